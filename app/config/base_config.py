@@ -3,11 +3,56 @@ Base configuration settings for the application.
 
 Classes:
     - BaseConfig: Base configuration.
+
+Functions:
+    - env_flag(name, default): Reads a boolean from the environment.
+    - engine_options_from_env(): Builds the SQLAlchemy engine options from the environment.
 """
 
 import os
 
 
+def env_flag(name: str, default: bool) -> bool:
+    """
+    Reads a boolean from the environment, where 1, true, yes and on (in any case) mean True.
+
+    :param name:str: The name of the environment variable.
+    :param default:bool: The value used when the variable is not set.
+    :return: bool: The value of the flag.
+    """
+    value = os.environ.get(name)
+
+    if value is None or value == '':
+        return default
+
+    return value.strip().lower() in ('1', 'true', 'yes', 'on')
+
+
+def engine_options_from_env() -> dict:
+    """
+    Builds the SQLAlchemy engine options from the DB_* environment variables.
+
+    DB_POOL_PRE_PING, DB_POOL_RECYCLE and DB_STATEMENT_CACHE_SIZE always apply. DB_POOL_SIZE,
+    DB_MAX_OVERFLOW and DB_POOL_TIMEOUT only apply to queue pools, so they are only passed when set.
+    Flask-SQLAlchemy reads the options like engine_from_config, which makes pool_timeout an integer.
+
+    :return: dict: The engine options, for SQLALCHEMY_ENGINE_OPTIONS.
+    """
+    options = {
+        'pool_pre_ping': env_flag('DB_POOL_PRE_PING', True),
+        'pool_recycle': int(os.environ.get('DB_POOL_RECYCLE') or 3600),
+        'query_cache_size': int(os.environ.get('DB_STATEMENT_CACHE_SIZE') or 500),
+    }
+
+    for option, variable, parse in (('pool_size', 'DB_POOL_SIZE', int),
+                                    ('max_overflow', 'DB_MAX_OVERFLOW', int),
+                                    ('pool_timeout', 'DB_POOL_TIMEOUT', int)):
+        if os.environ.get(variable):
+            options[option] = parse(os.environ[variable])
+
+    return options
+
+
 class BaseConfig:
     """
     Base configuration class.
@@ -15,8 +60,64 @@ class BaseConfig:
     Attributes:
         - SECRET_KEY (str): Secret key for the application.
         - SQLALCHEMY_TRACK_MODIFICATIONS (bool): If True, SQLAlchemy tracks modifications.
-        - SQLALCHEMY_ECHO (bool): If True, SQLAlchemy echoes messages.
+        - SQLALCHEMY_ECHO (bool): If True, SQLAlchemy logs every statement. Off unless SQLALCHEMY_ECHO is set.
+        - SQLALCHEMY_ENGINE_OPTIONS (dict): Pool and statement cache options, from the DB_* variables.
+        - DATABASE_REPLICA_URLS (list[str]): Read replicas of the database, from a comma separated variable.
+        - DATABASE_READ_YOUR_WRITES_SECONDS (float): Time a user reads from the primary after writing.
+        - TASKS_PAGE_SIZE (int): Default number of tasks returned per page.
+        - TASKS_MAX_PAGE_SIZE (int): Hard maximum number of tasks returned per page.
+        - TASKS_BATCH_MAX_SIZE (int): Maximum number of items in a batch request.
+        - TASKS_EXPORT_BATCH_SIZE (int): Number of rows fetched at a time when exporting tasks.
+        - TASKS_IMPORT_CHUNK_SIZE (int): Number of rows inserted per transaction when importing tasks.
+        - TASKS_GROUP_COMMIT (bool): If True, concurrent task creations of a worker are committed together.
+        - TASKS_GROUP_COMMIT_WINDOW (float): Seconds the first task of a group waits for others.
+        - TASKS_GROUP_COMMIT_MAX_ITEMS (int): Maximum number of tasks committed together.
+        - TASKS_GROUP_COMMIT_TIMEOUT (float): Seconds a task waits for its group, then for its write, before a 503.
+        - TASKS_SEARCH_MAX_LENGTH (int): Maximum length of a task search text.
+        - TASKS_SEARCH_MAX_RESULTS (int): Number of best matches a task search can page through.
+        - TASKS_STREAM_QUEUE_SIZE (int): Number of events a live stream may lag behind before it resyncs.
+        - TASKS_STREAM_HEARTBEAT (float): Seconds between heartbeats of an idle live stream.
+        - PASSWORD_HASH_METHOD (str): Werkzeug password hash method, including its cost parameters.
+        - PASSWORD_POOL_WORKERS (int): Number of processes hashing passwords, 0 to hash on the request thread.
+        - PASSWORD_POOL_MAX_PENDING (int): Maximum queued password operations before answering 503, 0 for no limit.
+        - RESPONSE_CACHE_ENABLED (bool): If True, task reads are cached per user.
+        - RESPONSE_CACHE_BACKEND (str): Import path of the response cache backend class.
+        - RESPONSE_CACHE_MAX_BYTES (int): Byte budget of the response cache.
+        - RESPONSE_CACHE_TTL (float): Lifetime of cached responses, in seconds.
+        - REQUEST_TIMING_ENABLED (bool): If True, request timings are aggregated per endpoint.
+        - SERVER_TIMING_HEADER (bool): If True, responses carry a Server-Timing header with their timings.
+        - METRICS_TOKEN (str): If set, /metrics requires it as a bearer token.
+        - QUERY_GUARD_THRESHOLD (int): Times one request may run the same statement before a warning is logged.
+          None disables the guard.
     """
     SECRET_KEY: str = os.environ.get('SECRET_KEY') or 'hard-to-guess-string'
     SQLALCHEMY_TRACK_MODIFICATIONS: bool = False
-    SQLALCHEMY_ECHO: bool = True
+    SQLALCHEMY_ECHO: bool = env_flag('SQLALCHEMY_ECHO', False)
+    SQLALCHEMY_ENGINE_OPTIONS: dict = engine_options_from_env()
+    DATABASE_REPLICA_URLS: list = [url.strip() for url in os.environ.get('DATABASE_REPLICA_URLS', '').split(',')
+                                   if url.strip()]
+    DATABASE_READ_YOUR_WRITES_SECONDS: float = float(os.environ.get('DATABASE_READ_YOUR_WRITES_SECONDS') or 5)
+    TASKS_PAGE_SIZE: int = 50
+    TASKS_MAX_PAGE_SIZE: int = 200
+    TASKS_BATCH_MAX_SIZE: int = 500
+    TASKS_EXPORT_BATCH_SIZE: int = 1000
+    TASKS_IMPORT_CHUNK_SIZE: int = 1000
+    TASKS_GROUP_COMMIT: bool = env_flag('TASKS_GROUP_COMMIT', False)
+    TASKS_GROUP_COMMIT_WINDOW: float = float(os.environ.get('TASKS_GROUP_COMMIT_WINDOW') or 0.002)
+    TASKS_GROUP_COMMIT_MAX_ITEMS: int = int(os.environ.get('TASKS_GROUP_COMMIT_MAX_ITEMS') or 64)
+    TASKS_GROUP_COMMIT_TIMEOUT: float = float(os.environ.get('TASKS_GROUP_COMMIT_TIMEOUT') or 30)
+    TASKS_SEARCH_MAX_LENGTH: int = 200
+    TASKS_SEARCH_MAX_RESULTS: int = 1000
+    TASKS_STREAM_QUEUE_SIZE: int = 100
+    TASKS_STREAM_HEARTBEAT: float = 15
+    PASSWORD_HASH_METHOD: str = os.environ.get('PASSWORD_HASH_METHOD') or 'scrypt:32768:8:1'
+    PASSWORD_POOL_WORKERS: int = int(os.environ.get('PASSWORD_POOL_WORKERS') or 2)
+    PASSWORD_POOL_MAX_PENDING: int = int(os.environ.get('PASSWORD_POOL_MAX_PENDING') or 32)
+    RESPONSE_CACHE_ENABLED: bool = True
+    RESPONSE_CACHE_BACKEND: str = 'app.extensions.cache.LRUCacheBackend'
+    RESPONSE_CACHE_MAX_BYTES: int = 64 * 1024 * 1024
+    RESPONSE_CACHE_TTL: float = 30
+    REQUEST_TIMING_ENABLED: bool = True
+    SERVER_TIMING_HEADER: bool = env_flag('SERVER_TIMING_HEADER', True)
+    METRICS_TOKEN: str | None = os.environ.get('METRICS_TOKEN')
+    QUERY_GUARD_THRESHOLD: int | None = None
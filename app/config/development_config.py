@@ -6,7 +6,7 @@ Classes:
 """
 import os
 
-from app.config import BaseConfig
+from app.config.base_config import BaseConfig, env_flag
 
 
 class DevelopmentConfig(BaseConfig):
@@ -15,6 +15,10 @@ class DevelopmentConfig(BaseConfig):
 
     Attributes:
         - SQLALCHEMY_DATABASE_URI (str): SQLAlchemy database URI.
+        - SQLALCHEMY_ECHO (bool): Statements are logged unless SQLALCHEMY_ECHO is set to false.
+        - QUERY_GUARD_THRESHOLD (int): Requests running the same statement more often log a warning.
     """
     SQLALCHEMY_DATABASE_URI: str = os.environ.get('DEVELOPMENT_DATABASE_URL') or 'sqlite:///development.db'
+    SQLALCHEMY_ECHO: bool = env_flag('SQLALCHEMY_ECHO', True)
+    QUERY_GUARD_THRESHOLD: int = int(os.environ.get('QUERY_GUARD_THRESHOLD') or 5)
     DEBUG: bool = True
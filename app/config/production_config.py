@@ -13,8 +13,25 @@ class ProductionConfig(BaseConfig):
     """
     Production configuration class.
 
+    With SQLite, connections run in WAL mode, where readers never block the writer, with
+    synchronous=NORMAL, which only syncs at checkpoints. Writes go through a single writer connection
+    per worker and wait up to busy_timeout for the writers of other workers.
+
     Attributes:
         - SQLALCHEMY_DATABASE_URI (str): SQLAlchemy database URI.
+        - SQLITE_PRAGMAS (dict): Pragmas set on every new SQLite connection.
+        - SQLITE_SINGLE_WRITER (bool): If True, writes of a worker share one SQLite connection.
+        - SQLITE_WRITER_TIMEOUT (float): Seconds a write waits for the writer connection.
     """
     SQLALCHEMY_DATABASE_URI: str = os.environ.get('PRODUCTION_DATABASE_URL') or 'sqlite:///production.db'
+    SQLITE_PRAGMAS: dict = {
+        'journal_mode': 'WAL',
+        'synchronous': 'NORMAL',
+        'busy_timeout': 5000,
+        'mmap_size': 256 * 1024 * 1024,
+        'cache_size': -64 * 1024,
+        'temp_store': 'MEMORY',
+    }
+    SQLITE_SINGLE_WRITER: bool = True
+    SQLITE_WRITER_TIMEOUT: float = 30
     DEBUG: bool = True
@@ -1 +1,7 @@
-from .db import db, migrate
+from .db import db, db_router, migrate, init_sqlite, engine_report
+from .cache import response_cache
+from .events import event_hub
+from .pool_metrics import pool_metrics
+from .timing import request_timing, timed
+from .metrics import metrics
+from .query_counter import query_guard, max_queries
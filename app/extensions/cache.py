@@ -0,0 +1,228 @@
+"""
+Per-user response cache for task reads.
+
+Cached bodies are keyed by user, resource and the ETag that @conditional computed for the request
+from the database. A write from any worker changes that ETag, so every response cached before it
+stops being reachable at once and is evicted over time by the backend's LRU policy, and a body is
+never served under the ETag of another state.
+
+Classes:
+    - CacheBackend: Interface of the cache storage backends.
+    - LRUCacheBackend: In-process LRU backend with a hard byte budget.
+    - ResponseCache: Caches JSON responses of read routes per user.
+"""
+import threading
+import time
+from collections import OrderedDict
+from functools import wraps
+
+from flask import current_app, g, request
+from werkzeug.utils import import_string
+
+
+class CacheBackend:
+    """
+    Interface of the cache storage backends.
+
+    Keys carry the database state they were computed from, so any backend is consistent across
+    workers; one shared between them (for example backed by Redis) also shares their entries.
+    """
+
+    def get(self, key: str) -> bytes | None:
+        """
+        Returns the value stored under the key, or None.
+        """
+        raise NotImplementedError
+
+    def set(self, key: str, value: bytes, ttl: float | None = None) -> None:
+        """
+        Stores a value under the key, expiring after ttl seconds if given.
+        """
+        raise NotImplementedError
+
+    def clear(self) -> None:
+        """
+        Removes all values.
+        """
+        raise NotImplementedError
+
+    def stats(self) -> dict:
+        """
+        Returns backend statistics, such as memory use.
+        """
+        return {}
+
+
+class LRUCacheBackend(CacheBackend):
+    """
+    In-process LRU backend with a hard byte budget.
+
+    Attributes:
+        - max_bytes (int): Maximum size of the stored keys and values, in bytes.
+    """
+
+    def __init__(self, max_bytes: int = 64 * 1024 * 1024, clock=time.monotonic):
+        self.max_bytes = max_bytes
+        self._clock = clock
+        self._entries: OrderedDict[str, tuple[bytes, float | None]] = OrderedDict()
+        self._bytes = 0
+        self._evictions = 0
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> bytes | None:
+        with self._lock:
+            entry = self._entries.get(key)
+
+            if entry is None:
+                return None
+
+            value, expires_at = entry
+
+            if expires_at is not None and expires_at <= self._clock():
+                self._remove(key)
+                return None
+
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: bytes, ttl: float | None = None) -> None:
+        size = len(key) + len(value)
+
+        if size > self.max_bytes:
+            return
+
+        expires_at = self._clock() + ttl if ttl else None
+
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+
+            self._entries[key] = (value, expires_at)
+            self._bytes += size
+
+            while self._bytes > self.max_bytes:
+                self._remove(next(iter(self._entries)))
+                self._evictions += 1
+
+    def _remove(self, key: str) -> None:
+        value, _ = self._entries.pop(key)
+        self._bytes -= len(key) + len(value)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+            self._evictions = 0
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                'entries': len(self._entries),
+                'bytes': self._bytes,
+                'max_bytes': self.max_bytes,
+                'evictions': self._evictions,
+            }
+
+
+class ResponseCache:
+    """
+    Caches JSON responses of read routes per user, keyed by the ETag of the current database state.
+
+    Attributes:
+        - enabled (bool): If False, cached views run uncached.
+        - ttl (float|None): Lifetime of cached responses, in seconds.
+        - backend (CacheBackend): The storage backend.
+        - hits (int): Number of responses served from the cache.
+        - misses (int): Number of responses computed by the view.
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self.ttl = None
+        self.backend: CacheBackend = LRUCacheBackend()
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    def init_app(self, app) -> None:
+        """
+        Configures the cache from the application configuration.
+
+        :param app:Flask: The Flask application instance.
+        """
+        backend = app.config.get('RESPONSE_CACHE_BACKEND', LRUCacheBackend)
+
+        if isinstance(backend, str):
+            backend = import_string(backend)
+
+        self.enabled = app.config.get('RESPONSE_CACHE_ENABLED', True)
+        self.ttl = app.config.get('RESPONSE_CACHE_TTL', 30)
+        self.backend = backend(max_bytes=app.config.get('RESPONSE_CACHE_MAX_BYTES', 64 * 1024 * 1024))
+        self.hits = 0
+        self.misses = 0
+        app.extensions['response_cache'] = self
+
+    def cached(self, resource):
+        """
+        Decorator caching the 200 responses of a view of the authenticated user.
+
+        The view must sit inside @conditional, whose ETag is part of the key; without one, as for a
+        missing resource, the view runs uncached.
+
+        :param resource:Callable: Builds the resource part of the key from the view arguments.
+        :return: Callable: The decorator.
+        """
+        def decorator(view):
+            @wraps(view)
+            def wrapper(*args, **kwargs):
+                etag = g.get('etag')
+
+                if not self.enabled or etag is None:
+                    return view(*args, **kwargs)
+
+                key = f'{request.user_id}:{etag}:{resource(**kwargs)}'
+                body = self.backend.get(key)
+
+                if body is not None:
+                    with self._lock:
+                        self.hits += 1
+
+                    response = current_app.response_class(body, mimetype='application/json')
+                    response.headers['X-Cache'] = 'HIT'
+                    return response
+
+                with self._lock:
+                    self.misses += 1
+
+                response = current_app.make_response(view(*args, **kwargs))
+
+                if response.status_code == 200 and not response.is_streamed:
+                    self.backend.set(key, response.get_data(), self.ttl)
+
+                response.headers['X-Cache'] = 'MISS'
+                return response
+
+            return wrapper
+
+        return decorator
+
+    def stats(self) -> dict:
+        """
+        Returns the hit ratio and the backend statistics.
+
+        :return: dict: Hits, misses, hit ratio and backend statistics such as memory use.
+        """
+        with self._lock:
+            hits, misses = self.hits, self.misses
+
+        lookups = hits + misses
+
+        return {
+            'hits': hits,
+            'misses': misses,
+            'hit_ratio': hits / lookups if lookups else 0.0,
+            **self.backend.stats(),
+        }
+
+
+response_cache = ResponseCache()
@@ -3,11 +3,30 @@ Setup for SQLAlchemy and database migrations.
 
 Classes:
     - Base: Base class for declarative models.
+    - RoutingSession: Session sending writes to the single writer engine and reads to replicas.
+    - ReplicaRouter: Sends the reads of read-only views to read replicas, and all of write views to the writer.
+
+Functions:
+    - init_sqlite(app): Applies the SQLite connection pragmas and creates the single writer engine.
+    - engine_report(app): Describes the effective configuration of the engines of an application.
 """
+import math
+import os
+import random
+from functools import wraps
 
+from flask import current_app, g, has_app_context, has_request_context, request
 from flask_sqlalchemy import SQLAlchemy
+from flask_sqlalchemy.session import Session
 from flask_migrate import Migrate
+from itsdangerous import BadSignature, URLSafeTimedSerializer
+from sqlalchemy import create_engine, engine_from_config, event
 from sqlalchemy.orm import DeclarativeBase
+from sqlalchemy.sql.dml import UpdateBase
+
+WRITER_EXTENSION_KEY = 'sqlite_writer'
+REPLICAS_EXTENSION_KEY = 'db_replicas'
+READ_YOUR_WRITES_COOKIE = 'db_last_write'
 
 
 class Base(DeclarativeBase):
@@ -17,6 +36,274 @@ class Base(DeclarativeBase):
     pass
 
 
-db = SQLAlchemy(model_class=Base)
+class RoutingSession(Session):
+    """
+    Session sending flushes and INSERT, UPDATE and DELETE statements to the writer engine.
+
+    The writer engine, created by init_sqlite when SQLITE_SINGLE_WRITER is set, has a pool of one
+    connection, so concurrent writers of a worker queue for it instead of failing with "database is
+    locked". Once a transaction has written, its reads go to the writer too, so they see its own
+    changes. In the views marked with db_router.read_write, reads go to the writer from the start,
+    so what a view reads before its first write is not already outdated by the time it writes.
+
+    Reads of the views marked with db_router.read_only go to the replica chosen for the request,
+    unless the transaction has written.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._writing = False
+
+    def get_bind(self, mapper=None, clause=None, bind=None, **kwargs):
+        if bind is None:
+            if self._flushing or isinstance(clause, UpdateBase):
+                self._writing = True
+
+            if self._writing or db_router.writing():
+                writer = current_app.extensions.get(WRITER_EXTENSION_KEY)
+
+                if writer is not None:
+                    return writer
+            else:
+                replica = db_router.replica()
+
+                if replica is not None:
+                    return replica
+
+        return super().get_bind(mapper=mapper, clause=clause, bind=bind, **kwargs)
+
+
+@event.listens_for(RoutingSession, 'after_commit')
+def _record_write(session):
+    """
+    Open the read-your-writes window of the writer once its changes are committed.
+    """
+    if session._writing:
+        db_router.record_write()
+
+
+@event.listens_for(RoutingSession, 'after_transaction_end')
+def _end_writing(session, transaction):
+    """
+    Give the writer connection back to the reads once the outermost transaction ends.
+    """
+    if transaction.parent is None:
+        session._writing = False
+
+
+def _write_serializer():
+    """
+    Returns the serializer signing the read-your-writes cookie, or None without a secret key.
+    """
+    secret = current_app.config.get('SECRET_KEY') or os.environ.get('SECRET_KEY')
+
+    return URLSafeTimedSerializer(secret, salt=READ_YOUR_WRITES_COOKIE) if secret else None
+
+
+def _request_user_id():
+    """
+    Returns the ID of the authenticated user of the current request, if any.
+    """
+    return getattr(request, 'user_id', None) if has_request_context() else None
+
+
+class ReplicaRouter:
+    """
+    Sends the reads of read-only views to read replicas, and all the statements of write views to
+    the writer.
+
+    Each request marked with read_only picks one of the DATABASE_REPLICA_URLS engines and keeps it
+    for all its reads. A user who committed a write in the last DATABASE_READ_YOUR_WRITES_SECONDS
+    reads from the primary instead, so they never miss their own changes to replication lag. The
+    write is carried by the client in a signed, short-lived cookie, so the window holds whichever
+    worker process serves the next read.
+
+    Attributes:
+        - identity (Callable): Returns the key of the read-your-writes window, the user ID by default.
+    """
+
+    def __init__(self, identity=_request_user_id):
+        self.identity = identity
+
+    def init_app(self, app) -> None:
+        """
+        Creates the replica engines of the application, with the engine options of the primary, and
+        registers the hook setting the read-your-writes cookie.
+
+        :param app:Flask: The Flask application instance.
+        """
+        options = app.config.get('SQLALCHEMY_ENGINE_OPTIONS') or {}
+        urls = app.config.get('DATABASE_REPLICA_URLS') or []
+
+        app.extensions[REPLICAS_EXTENSION_KEY] = [engine_from_config({**options, 'url': url}, prefix='')
+                                                  for url in urls]
+
+        if urls:
+            app.after_request(self._set_cookie)
+
+    def read_only(self, view):
+        """
+        Decorator routing the reads of a view to a replica, outside of read-your-writes windows.
+
+        :param view:Callable: The view function.
+        :return: Callable: The decorated view.
+        """
+        @wraps(view)
+        def wrapper(*args, **kwargs):
+            replicas = current_app.extensions.get(REPLICAS_EXTENSION_KEY)
+
+            if replicas and not self.recently_wrote(self.identity()):
+                g.db_replica = random.choice(replicas)
+
+            return view(*args, **kwargs)
+
+        return wrapper
+
+    def read_write(self, view):
+        """
+        Decorator sending all the statements of a view to the writer, reads before its first write
+        included, so that a view deciding what to write from what it read does so in one unit of
+        work.
+
+        :param view:Callable: The view function.
+        :return: Callable: The decorated view.
+        """
+        @wraps(view)
+        def wrapper(*args, **kwargs):
+            g.db_read_write = True
+
+            try:
+                return view(*args, **kwargs)
+            finally:
+                g.pop('db_read_write', None)
+
+        return wrapper
+
+    def writing(self) -> bool:
+        """
+        Returns whether the current request runs a view marked with read_write.
+
+        :return: bool: True if all its statements must go to the writer.
+        """
+        return g.get('db_read_write', False) if has_app_context() else False
+
+    def replica(self):
+        """
+        Returns the replica chosen for the current request, or None to use the primary.
+
+        :return: Engine|None: The replica engine.
+        """
+        return g.get('db_replica') if has_app_context() else None
+
+    def record_write(self) -> None:
+        """
+        Opens the read-your-writes window of the current identity, sent with the response.
+        """
+        if has_request_context():
+            g.db_wrote = True
+
+    def recently_wrote(self, key) -> bool:
+        """
+        Returns whether the identity is in a read-your-writes window, from the cookie of the request.
+
+        :param key:Any: The identity, such as a user ID.
+        :return: bool: True if its reads must go to the primary.
+        """
+        window = current_app.config.get('DATABASE_READ_YOUR_WRITES_SECONDS', 5)
+        value = request.cookies.get(READ_YOUR_WRITES_COOKIE)
+        serializer = _write_serializer()
+
+        if key is None or not value or window <= 0 or serializer is None:
+            return False
+
+        try:
+            return serializer.loads(value, max_age=window) == str(key)
+        except BadSignature:
+            return False
+
+    def _set_cookie(self, response):
+        """
+        Sets the read-your-writes cookie on the response of a request that committed a write.
+        """
+        key = self.identity()
+        window = current_app.config.get('DATABASE_READ_YOUR_WRITES_SECONDS', 5)
+        serializer = _write_serializer()
+
+        if g.pop('db_wrote', False) and key is not None and window > 0 and serializer is not None:
+            response.set_cookie(READ_YOUR_WRITES_COOKIE, serializer.dumps(str(key)), max_age=math.ceil(window),
+                                httponly=True, samesite='Lax', secure=request.is_secure)
+
+        return response
+
+
+db = SQLAlchemy(model_class=Base, session_options={'class_': RoutingSession})
+
+db_router = ReplicaRouter()
 
 migrate = Migrate()
+
+
+def init_sqlite(app) -> None:
+    """
+    Applies the SQLITE_PRAGMAS of the configuration to every new connection of the SQLite engine and
+    its replicas and, if SQLITE_SINGLE_WRITER is set, creates the single connection writer engine of
+    RoutingSession.
+
+    :param app:Flask: The Flask application instance, after db.init_app and db_router.init_app.
+    """
+    with app.app_context():
+        engine = db.engine
+
+    if engine.dialect.name != 'sqlite':
+        return
+
+    pragmas = app.config.get('SQLITE_PRAGMAS') or {}
+
+    def set_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+
+        for name, value in pragmas.items():
+            cursor.execute(f'PRAGMA {name} = {value}')
+
+        cursor.close()
+
+    engines = [target for target in (engine, *app.extensions.get(REPLICAS_EXTENSION_KEY, []))
+               if target.dialect.name == 'sqlite']
+
+    if app.config.get('SQLITE_SINGLE_WRITER') and engine.url.database not in (None, '', ':memory:'):
+        writer = create_engine(engine.url, echo=engine.echo, pool_size=1, max_overflow=0,
+                               pool_timeout=app.config.get('SQLITE_WRITER_TIMEOUT', 30))
+        app.extensions[WRITER_EXTENSION_KEY] = writer
+        engines.append(writer)
+
+    if pragmas:
+        for target in engines:
+            event.listen(target, 'connect', set_pragmas)
+
+
+def engine_report(app) -> dict:
+    """
+    Describes the effective configuration of the engines of the application, logged at startup.
+
+    :param app:Flask: The Flask application instance, after init_sqlite.
+    :return: dict: The URL without password, dialect, pool, echo flag, engine options and replicas.
+    """
+    with app.app_context():
+        engine = db.engine
+
+    report = {
+        'url': engine.url.render_as_string(hide_password=True),
+        'dialect': f'{engine.dialect.name}+{engine.dialect.driver}',
+        'pool': type(engine.pool).__name__,
+        'pool_status': engine.pool.status(),
+        'echo': bool(engine.echo),
+        'engine_options': app.config.get('SQLALCHEMY_ENGINE_OPTIONS', {}),
+        'replicas': [replica.url.render_as_string(hide_password=True)
+                     for replica in app.extensions.get(REPLICAS_EXTENSION_KEY, [])],
+    }
+
+    if engine.dialect.name == 'sqlite':
+        report['sqlite_pragmas'] = app.config.get('SQLITE_PRAGMAS') or {}
+        report['sqlite_single_writer'] = WRITER_EXTENSION_KEY in app.extensions
+
+    return report
@@ -0,0 +1,141 @@
+"""
+In-process fan-out of task change events to the live streams of their user.
+
+Write routes publish after committing, and every open stream of the user gets the event in its own
+bounded queue. A stream that falls too far behind loses its queued events and is told to resync
+from its last change sequence number instead of growing without bound.
+
+The hub only sees the writes of its own worker process; streams resume from the Last-Event-ID
+header, so a reconnecting client catches up with the changes made elsewhere.
+
+Classes:
+    - Subscription: Bounded queue of the events of one stream.
+    - EventHub: Fans task change events out to the subscriptions of their user.
+"""
+import queue
+import threading
+from collections import defaultdict
+
+
+class Subscription:
+    """
+    Bounded queue of the events of one stream.
+
+    Attributes:
+        - user_id (uuid.UUID): The ID of the subscribed user.
+        - overflowed (bool): True once an event was dropped because the queue was full.
+    """
+
+    def __init__(self, user_id, maxsize: int):
+        self.user_id = user_id
+        self.overflowed = False
+        self._queue = queue.Queue(maxsize)
+        self._lock = threading.Lock()
+
+    def put(self, event: tuple[str, int | None, object]) -> None:
+        """
+        Queues an event without blocking the publisher, flagging the overflow if the queue is full.
+
+        :param event:tuple: The event name, its change sequence number and its data.
+        """
+        with self._lock:
+            if self.overflowed:
+                return
+
+            try:
+                self._queue.put_nowait(event)
+            except queue.Full:
+                self.overflowed = True
+
+    def get(self, timeout: float) -> tuple[str, int | None, object] | None:
+        """
+        Waits for the next event.
+
+        :param timeout:float: Maximum wait, in seconds.
+        :return: tuple|None: The next event, or None if none came in time.
+        """
+        try:
+            return self._queue.get(timeout=timeout)
+        except queue.Empty:
+            return None
+
+    def reset(self) -> None:
+        """
+        Drops the queued events and clears the overflow flag, once the client was told to resync.
+        """
+        with self._lock:
+            while not self._queue.empty():
+                self._queue.get_nowait()
+
+            self.overflowed = False
+
+
+class EventHub:
+    """
+    Fans task change events out to the subscriptions of their user.
+    """
+
+    def __init__(self):
+        self._subscriptions = defaultdict(set)
+        self._lock = threading.Lock()
+
+    def subscribe(self, user_id, maxsize: int = 100) -> Subscription:
+        """
+        Opens a subscription to the events of a user.
+
+        :param user_id:uuid.UUID: The ID of the user.
+        :param maxsize:int: Maximum number of queued events before the subscription overflows.
+        :return: Subscription: The subscription, to be closed with unsubscribe.
+        """
+        subscription = Subscription(user_id, maxsize)
+
+        with self._lock:
+            self._subscriptions[user_id].add(subscription)
+
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        """
+        Closes a subscription.
+
+        :param subscription:Subscription: The subscription returned by subscribe.
+        """
+        with self._lock:
+            subscriptions = self._subscriptions.get(subscription.user_id)
+
+            if subscriptions is not None:
+                subscriptions.discard(subscription)
+
+                if not subscriptions:
+                    del self._subscriptions[subscription.user_id]
+
+    def publish(self, user_id, event: str, change_seq: int | None = None, data=None) -> None:
+        """
+        Sends an event to every subscription of a user. Never blocks on a slow subscriber.
+
+        :param user_id:uuid.UUID: The ID of the user whose tasks changed.
+        :param event:str: The event name, such as 'task.created'.
+        :param change_seq:int|None: The change sequence number of the change, used as event ID.
+        :param data:Any: The JSON serializable event data.
+        """
+        with self._lock:
+            subscriptions = list(self._subscriptions.get(user_id, ()))
+
+        for subscription in subscriptions:
+            subscription.put((event, change_seq, data))
+
+    def subscriber_count(self, user_id=None) -> int:
+        """
+        Returns the number of open subscriptions, of one user or of all of them.
+
+        :param user_id:uuid.UUID|None: The ID of the user, or None for all users.
+        :return: int: The number of open subscriptions.
+        """
+        with self._lock:
+            if user_id is not None:
+                return len(self._subscriptions.get(user_id, ()))
+
+            return sum(len(subscriptions) for subscriptions in self._subscriptions.values())
+
+
+event_hub = EventHub()
@@ -0,0 +1,183 @@
+"""
+Prometheus metrics of the service.
+
+Request metrics are recorded as each request finishes, from the timings of RequestTiming. The
+counters kept by each worker (connection pools, token cache, response cache) are folded into
+Prometheus counters and gauges at most once a second per worker, so a request only pays for a few
+increments.
+
+With several gunicorn workers, set PROMETHEUS_MULTIPROC_DIR to an empty directory before the
+workers start: every worker then writes its values to memory mapped files there, and /metrics
+aggregates the files of all workers.
+
+Classes:
+    - Metrics: Records the service metrics and renders them for scraping.
+"""
+import os
+import threading
+import time
+
+from flask import request
+from prometheus_client import (CONTENT_TYPE_LATEST, REGISTRY, CollectorRegistry, Counter, Gauge, Histogram,
+                               generate_latest, multiprocess)
+
+from app.utils.token import token_cache
+
+from .cache import response_cache
+from .pool_metrics import pool_metrics
+from .timing import BUCKETS, request_timing
+
+REQUESTS = Counter('http_requests_total', 'Requests served.', ['blueprint', 'endpoint', 'method', 'status'])
+REQUEST_DURATION = Histogram('http_request_duration_seconds', 'Request latency.', ['blueprint', 'endpoint'],
+                             buckets=BUCKETS)
+REQUEST_PHASE_DURATION = Histogram('http_request_phase_seconds',
+                                   'Time spent per request in JWT, password, database and JSON work.',
+                                   ['endpoint', 'phase'], buckets=BUCKETS)
+DB_STATEMENTS = Counter('db_statements_total', 'SQL statements run by requests.', ['endpoint'])
+IN_FLIGHT = Gauge('http_requests_in_flight', 'Requests being served.', multiprocess_mode='livesum')
+
+POOL_CHECKOUTS = Counter('db_pool_checkouts_total', 'Connections checked out of the pool.', ['engine'])
+POOL_TIMEOUTS = Counter('db_pool_timeouts_total', 'Checkouts that timed out waiting for a connection.', ['engine'])
+POOL_WAIT = Counter('db_pool_wait_seconds_total', 'Time spent obtaining connections.', ['engine'])
+POOL_CHECKED_OUT = Gauge('db_pool_checked_out', 'Connections in use.', ['engine'], multiprocess_mode='livesum')
+POOL_SIZE = Gauge('db_pool_size', 'Configured pool size.', ['engine'], multiprocess_mode='livesum')
+
+TOKEN_CACHE_HITS = Counter('token_cache_hits_total', 'Tokens found in the verified token cache.')
+TOKEN_CACHE_MISSES = Counter('token_cache_misses_total', 'Tokens decoded because they were not cached.')
+TOKEN_CACHE_SIZE = Gauge('token_cache_size', 'Tokens in the verified token cache.', multiprocess_mode='livesum')
+RESPONSE_CACHE_HITS = Counter('response_cache_hits_total', 'Responses served from the response cache.')
+RESPONSE_CACHE_MISSES = Counter('response_cache_misses_total', 'Responses computed by their view.')
+RESPONSE_CACHE_HIT_RATIO = Gauge('response_cache_hit_ratio', 'Share of cached lookups served from the response cache.',
+                                 multiprocess_mode='liveall')
+RESPONSE_CACHE_EVICTIONS = Counter('response_cache_evictions_total', 'Responses evicted from the response cache.')
+RESPONSE_CACHE_ENTRIES = Gauge('response_cache_entries', 'Responses in the response cache.',
+                               multiprocess_mode='livesum')
+RESPONSE_CACHE_BYTES = Gauge('response_cache_bytes', 'Bytes used by the response cache.', multiprocess_mode='livesum')
+
+
+class Metrics:
+    """
+    Records the service metrics and renders them for scraping.
+
+    Attributes:
+        - sync_interval (float): Minimum time between two syncs of the worker counters, in seconds.
+    """
+
+    def __init__(self, sync_interval: float = 1.0, clock=time.monotonic):
+        self.sync_interval = sync_interval
+        self._clock = clock
+        self._last_sync = float('-inf')
+        self._last_values = {}
+        self._sync_lock = threading.Lock()
+
+    def init_app(self, app) -> None:
+        """
+        Registers the request hooks, after RequestTiming.init_app.
+
+        :param app:Flask: The Flask application instance.
+        """
+        app.before_request(self._enter)
+        app.teardown_request(self._exit)
+
+        if self._observe not in request_timing.observers:
+            request_timing.observers.append(self._observe)
+
+        app.extensions['metrics'] = self
+
+    @staticmethod
+    def _enter() -> None:
+        request.metrics_in_flight = True
+        IN_FLIGHT.inc()
+
+    @staticmethod
+    def _exit(exception=None) -> None:
+        if getattr(request, 'metrics_in_flight', False):
+            IN_FLIGHT.dec()
+
+    def _observe(self, endpoint: str, status: int, timings: dict, statements: int) -> None:
+        blueprint = endpoint.split('.', 1)[0] if '.' in endpoint else ''
+
+        REQUESTS.labels(blueprint, endpoint, request.method, str(status)).inc()
+        REQUEST_DURATION.labels(blueprint, endpoint).observe(timings['total'])
+
+        for phase, seconds in timings.items():
+            if phase != 'total':
+                REQUEST_PHASE_DURATION.labels(endpoint, phase).observe(seconds)
+
+        if statements:
+            DB_STATEMENTS.labels(endpoint).inc(statements)
+
+        if self._clock() - self._last_sync >= self.sync_interval:
+            self.sync()
+
+    def _advance(self, counter, key, value: float, source=None) -> None:
+        """
+        Increments a counter by the growth of a worker counter since the previous sync.
+
+        A worker counter read from another source than at the previous sync, such as the statistics
+        of a new engine, or lower than at the previous sync was reset, and all of its value is new.
+        """
+        last_source, last = self._last_values.get(key, (None, 0))
+        delta = value - last if source is last_source and value >= last else value
+        self._last_values[key] = (source, value)
+
+        if delta > 0:
+            counter.inc(delta)
+
+    def sync(self) -> None:
+        """
+        Folds the worker counters of the pools and caches into the Prometheus metrics.
+
+        Skipped if another thread of the worker is already syncing.
+        """
+        if not self._sync_lock.acquire(blocking=False):
+            return
+
+        try:
+            self._last_sync = self._clock()
+
+            for name, pool_stats in list(pool_metrics.engines.items()):
+                stats = pool_stats.stats()
+                self._advance(POOL_CHECKOUTS.labels(name), ('checkouts', name), stats['checkouts'], pool_stats)
+                self._advance(POOL_TIMEOUTS.labels(name), ('timeouts', name), stats['timeouts'], pool_stats)
+                self._advance(POOL_WAIT.labels(name), ('wait', name), stats['wait_seconds_total'], pool_stats)
+                POOL_CHECKED_OUT.labels(name).set(stats['checked_out'])
+                POOL_SIZE.labels(name).set(stats.get('size', 0))
+
+            token_stats = token_cache.stats()
+            self._advance(TOKEN_CACHE_HITS, 'token_hits', token_stats['hits'], token_cache)
+            self._advance(TOKEN_CACHE_MISSES, 'token_misses', token_stats['misses'], token_cache)
+            TOKEN_CACHE_SIZE.set(token_stats['size'])
+
+            response_stats = response_cache.stats()
+            self._advance(RESPONSE_CACHE_HITS, 'response_hits', response_stats['hits'], response_cache)
+            self._advance(RESPONSE_CACHE_MISSES, 'response_misses', response_stats['misses'], response_cache)
+            RESPONSE_CACHE_HIT_RATIO.set(response_stats['hit_ratio'])
+
+            if 'evictions' in response_stats:
+                self._advance(RESPONSE_CACHE_EVICTIONS, 'response_evictions', response_stats['evictions'],
+                              response_cache.backend)
+
+            RESPONSE_CACHE_ENTRIES.set(response_stats.get('entries', 0))
+            RESPONSE_CACHE_BYTES.set(response_stats.get('bytes', 0))
+        finally:
+            self._sync_lock.release()
+
+    def render(self) -> tuple[bytes, str]:
+        """
+        Renders the metrics in the Prometheus text format, of all workers in multiprocess mode.
+
+        :return: tuple[bytes, str]: The body and its content type.
+        """
+        self.sync()
+
+        if os.environ.get('PROMETHEUS_MULTIPROC_DIR'):
+            registry = CollectorRegistry()
+            multiprocess.MultiProcessCollector(registry)
+        else:
+            registry = REGISTRY
+
+        return generate_latest(registry), CONTENT_TYPE_LATEST
+
+
+metrics = Metrics()
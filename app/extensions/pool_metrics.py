@@ -0,0 +1,179 @@
+"""
+Connection pool metrics of the SQLAlchemy engines.
+
+Checkouts are timed from the moment a connection is requested until the pool hands one over, so
+the wait on an exhausted pool shows up next to the number of connections in use.
+
+Classes:
+    - PoolStats: Checkout and wait counters of one engine.
+    - PoolMetrics: Instruments the engines of an application and reports their pool statistics.
+"""
+import threading
+import time
+
+from sqlalchemy import event
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+
+from .db import REPLICAS_EXTENSION_KEY, WRITER_EXTENSION_KEY, db
+
+
+class PoolStats:
+    """
+    Checkout and wait counters of one engine.
+
+    Attributes:
+        - checkouts (int): Number of connections handed over by the pool.
+        - checked_out (int): Number of connections currently in use.
+        - max_checked_out (int): Highest number of connections in use at once.
+        - connects (int): Number of new database connections opened.
+        - invalidations (int): Number of connections discarded after an error.
+        - timeouts (int): Number of checkouts that gave up waiting for a connection.
+        - wait_seconds_total (float): Total time spent obtaining connections.
+        - wait_seconds_max (float): Longest time spent obtaining a connection.
+    """
+
+    def __init__(self, engine, clock=time.perf_counter):
+        self.engine = engine
+        self.checkouts = 0
+        self.checked_out = 0
+        self.max_checked_out = 0
+        self.connects = 0
+        self.invalidations = 0
+        self.timeouts = 0
+        self.wait_seconds_total = 0.0
+        self.wait_seconds_max = 0.0
+        self._clock = clock
+        self._lock = threading.Lock()
+
+    def on_connect(self, dbapi_connection, connection_record) -> None:
+        with self._lock:
+            self.connects += 1
+
+    def on_checkout(self, dbapi_connection, connection_record, connection_proxy) -> None:
+        with self._lock:
+            self.checkouts += 1
+            self.checked_out += 1
+            self.max_checked_out = max(self.max_checked_out, self.checked_out)
+
+    def on_checkin(self, dbapi_connection, connection_record) -> None:
+        with self._lock:
+            self.checked_out = max(self.checked_out - 1, 0)
+
+    def on_invalidate(self, dbapi_connection, connection_record, exception) -> None:
+        with self._lock:
+            self.invalidations += 1
+
+    def timed(self, raw_connection):
+        """
+        Wraps the raw_connection method of the engine to time every checkout.
+
+        :param raw_connection:Callable: The method to wrap.
+        :return: Callable: The timed method.
+        """
+        def timed_raw_connection(*args, **kwargs):
+            started = self._clock()
+
+            try:
+                return raw_connection(*args, **kwargs)
+            except PoolTimeoutError:
+                with self._lock:
+                    self.timeouts += 1
+                raise
+            finally:
+                waited = self._clock() - started
+
+                with self._lock:
+                    self.wait_seconds_total += waited
+                    self.wait_seconds_max = max(self.wait_seconds_max, waited)
+
+        return timed_raw_connection
+
+    def stats(self) -> dict:
+        """
+        Returns the counters with the current state of the pool.
+
+        :return: dict: The pool statistics.
+        """
+        pool = self.engine.pool
+
+        with self._lock:
+            stats = {
+                'pool': type(pool).__name__,
+                'checkouts': self.checkouts,
+                'checked_out': self.checked_out,
+                'max_checked_out': self.max_checked_out,
+                'connects': self.connects,
+                'invalidations': self.invalidations,
+                'timeouts': self.timeouts,
+                'wait_seconds_total': self.wait_seconds_total,
+                'wait_seconds_max': self.wait_seconds_max,
+                'wait_seconds_avg': self.wait_seconds_total / self.checkouts if self.checkouts else 0.0,
+            }
+
+        if hasattr(pool, 'size') and hasattr(pool, 'overflow'):
+            stats['size'] = pool.size()
+            stats['overflow'] = pool.overflow()
+
+        return stats
+
+
+class PoolMetrics:
+    """
+    Instruments the engines of an application and reports their pool statistics.
+
+    Attributes:
+        - engines (dict[str, PoolStats]): The statistics of each instrumented engine, by name.
+    """
+
+    def __init__(self):
+        self.engines: dict[str, PoolStats] = {}
+
+    def instrument(self, engine, name: str = 'default') -> PoolStats:
+        """
+        Starts collecting the pool statistics of an engine.
+
+        :param engine:Engine: The engine to instrument.
+        :param name:str: The name its statistics are reported under.
+        :return: PoolStats: The statistics of the engine.
+        """
+        pool_stats = PoolStats(engine)
+
+        event.listen(engine, 'connect', pool_stats.on_connect)
+        event.listen(engine, 'checkout', pool_stats.on_checkout)
+        event.listen(engine, 'checkin', pool_stats.on_checkin)
+        event.listen(engine, 'invalidate', pool_stats.on_invalidate)
+        engine.raw_connection = pool_stats.timed(engine.raw_connection)
+
+        self.engines[name] = pool_stats
+
+        return pool_stats
+
+    def init_app(self, app) -> None:
+        """
+        Instruments the engine of the application, its writer engine if there is one and its replicas.
+
+        :param app:Flask: The Flask application instance, after db.init_app and init_sqlite.
+        """
+        with app.app_context():
+            self.instrument(db.engine)
+
+        writer = app.extensions.get(WRITER_EXTENSION_KEY)
+
+        if writer is not None:
+            self.instrument(writer, 'writer')
+
+        for index, replica in enumerate(app.extensions.get(REPLICAS_EXTENSION_KEY, [])):
+            self.instrument(replica, f'replica-{index}')
+
+        app.extensions['pool_metrics'] = self
+
+    def stats(self) -> dict:
+        """
+        Returns the pool statistics of every instrumented engine.
+
+        :return: dict: The statistics, by engine name.
+        """
+        return {name: pool_stats.stats() for name, pool_stats in self.engines.items()}
+
+
+pool_metrics = PoolMetrics()
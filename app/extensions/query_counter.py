@@ -0,0 +1,214 @@
+"""
+SQL statement counting, query budgets and N+1 detection.
+
+A single listener on every engine hands each statement to the counters active in the current
+context, so counting costs nothing when no counter is active. Counters group statements by shape,
+their SQL with expanded IN lists collapsed, to spot the same query running once per row.
+
+Classes:
+    - TooManyQueries: Raised when a block runs more statements than its budget.
+    - QueryCounter: Counts the statements run in a block, optionally enforcing a budget.
+    - QueryGuard: Warns when a request repeats the same statement shape too often.
+
+Functions:
+    - statement_shape(statement): Returns the shape of a SQL statement.
+    - max_queries(limit): Decorator enforcing a statement budget on a function or view.
+"""
+import logging
+import re
+import threading
+from collections import Counter
+from contextvars import ContextVar
+from functools import wraps
+
+from flask import current_app, g, has_app_context, has_request_context, request
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+logger = logging.getLogger(__name__)
+
+_active: ContextVar[tuple] = ContextVar('active_query_counters', default=())
+_listening = False
+_listening_lock = threading.Lock()
+
+_PLACEHOLDERS = re.compile(r'\(\s*(\?|%\(\w+\)s|:\w+)(\s*,\s*(\?|%\(\w+\)s|:\w+))*\s*\)')
+_WHITESPACE = re.compile(r'\s+')
+
+
+class TooManyQueries(AssertionError):
+    """
+    Raised when a block runs more statements than its budget.
+    """
+
+
+def statement_shape(statement: str) -> str:
+    """
+    Returns the shape of a SQL statement: its text with IN lists collapsed and whitespace folded.
+
+    :param statement:str: The SQL statement.
+    :return: str: The statement shape.
+    """
+    return _PLACEHOLDERS.sub('(?)', _WHITESPACE.sub(' ', statement).strip())
+
+
+def _count(conn, cursor, statement, parameters, context, executemany) -> None:
+    for counter in _active.get():
+        counter.statements.append(statement)
+
+
+def _ensure_listening() -> None:
+    """
+    Listens to the statements of every engine, once.
+    """
+    global _listening
+
+    if _listening:
+        return
+
+    with _listening_lock:
+        if not _listening:
+            event.listen(Engine, 'before_cursor_execute', _count)
+            _listening = True
+
+
+class QueryCounter:
+    """
+    Counts the statements run in a block, in the current thread.
+
+    Usable as a context manager; with a limit, leaving the block raises TooManyQueries if it ran
+    more statements, or logs a warning if strict is False.
+
+    Attributes:
+        - limit (int | None): Maximum number of statements.
+        - strict (bool): If True, exceeding the limit raises; otherwise it logs a warning.
+        - statements (list[str]): The statements run so far.
+    """
+
+    def __init__(self, limit: int | None = None, strict: bool = True):
+        self.limit = limit
+        self.strict = strict
+        self.statements: list[str] = []
+
+    @property
+    def count(self) -> int:
+        """
+        :return: int: Number of statements run so far.
+        """
+        return len(self.statements)
+
+    def shapes(self) -> Counter:
+        """
+        :return: Counter: Number of statements of each shape.
+        """
+        return Counter(statement_shape(statement) for statement in self.statements)
+
+    def start(self) -> 'QueryCounter':
+        _ensure_listening()
+        _active.set(_active.get() + (self,))
+        return self
+
+    def stop(self) -> None:
+        _active.set(tuple(counter for counter in _active.get() if counter is not self))
+
+    def check(self, name: str = 'block') -> None:
+        """
+        Enforces the limit.
+
+        :param name:str: What ran the statements, for the error message.
+        :raises TooManyQueries: If the limit is exceeded and strict is True.
+        """
+        if self.limit is None or self.count <= self.limit:
+            return
+
+        message = f'{name} ran {self.count} statements, more than its limit of {self.limit}:\n' + \
+            '\n'.join(f'{count} x {shape}' for shape, count in self.shapes().most_common())
+
+        if self.strict:
+            raise TooManyQueries(message)
+
+        logger.warning(message)
+
+    def __enter__(self) -> 'QueryCounter':
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.stop()
+
+        if exc_type is None:
+            self.check()
+
+
+def max_queries(limit: int):
+    """
+    Decorator enforcing a statement budget on a function or view.
+
+    On a view, the budget raises TooManyQueries in testing and logs a warning otherwise, so the test
+    suite catches a view that starts running a query per row. Statements run outside the view, such
+    as those of a streamed response body, are not counted.
+
+    :param limit:int: Maximum number of statements per call.
+    """
+    def decorator(function):
+        @wraps(function)
+        def wrapper(*args, **kwargs):
+            strict = current_app.testing if has_app_context() else True
+            counter = QueryCounter(limit, strict).start()
+
+            try:
+                result = function(*args, **kwargs)
+            finally:
+                counter.stop()
+
+            counter.check(request.endpoint if has_request_context() else function.__qualname__)
+
+            return result
+
+        return wrapper
+
+    return decorator
+
+
+class QueryGuard:
+    """
+    Warns when a request repeats the same statement shape more than threshold times.
+
+    Attributes:
+        - threshold (int | None): Repetitions of one shape tolerated per request; None disables the guard.
+    """
+
+    def __init__(self):
+        self.threshold = None
+
+    def init_app(self, app) -> None:
+        """
+        Registers the request hooks if QUERY_GUARD_THRESHOLD is set.
+
+        :param app:Flask: The Flask application instance.
+        """
+        self.threshold = app.config.get('QUERY_GUARD_THRESHOLD')
+
+        if self.threshold is not None:
+            app.before_request(self._start)
+            app.teardown_request(self._finish)
+
+        app.extensions['query_guard'] = self
+
+    @staticmethod
+    def _start() -> None:
+        g.query_counter = QueryCounter().start()
+
+    def _finish(self, exception=None) -> None:
+        counter = g.pop('query_counter', None)
+
+        if counter is None:
+            return
+
+        counter.stop()
+
+        for shape, count in counter.shapes().items():
+            if count > self.threshold:
+                logger.warning('Possible N+1 query: %s %s ran the same statement %d times: %s',
+                               request.method, request.endpoint, count, shape)
+
+
+query_guard = QueryGuard()
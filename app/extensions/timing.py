@@ -0,0 +1,223 @@
+"""
+Per-request timing with Server-Timing headers and per-endpoint histograms.
+
+Each request records its total time and the time spent in JWT verification, password hashing,
+database statements and JSON serialization, plus the number of SQL statements. The breakdown is
+sent back in a Server-Timing header and aggregated per endpoint, so the slow part of a slow
+endpoint shows at a glance.
+
+Classes:
+    - Histogram: Cumulative histogram of durations.
+    - RequestTiming: Records request timings and aggregates them per endpoint.
+
+Functions:
+    - timed(name): Context manager adding the time of its block to a metric of the current request.
+"""
+import threading
+import time
+from contextlib import contextmanager
+
+from flask import g, has_app_context, request
+from sqlalchemy import event
+
+from .db import REPLICAS_EXTENSION_KEY, WRITER_EXTENSION_KEY, db
+
+BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+class Histogram:
+    """
+    Cumulative histogram of durations, in seconds.
+
+    Attributes:
+        - buckets (tuple[float]): Upper bounds of the buckets.
+        - counts (list[int]): Number of observations at or below each bound.
+        - count (int): Number of observations.
+        - sum (float): Sum of the observations.
+    """
+
+    def __init__(self, buckets=BUCKETS):
+        self.buckets = buckets
+        self.counts = [0] * len(buckets)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        """
+        Records an observation.
+
+        :param value:float: The observed duration, in seconds.
+        """
+        self.count += 1
+        self.sum += value
+
+        for index, bound in enumerate(self.buckets):
+            if value <= bound:
+                self.counts[index] += 1
+
+    def as_dict(self) -> dict:
+        """
+        Returns the histogram as a dictionary.
+
+        :return: dict: The count, sum, mean and cumulative bucket counts.
+        """
+        return {
+            'count': self.count,
+            'sum': self.sum,
+            'mean': self.sum / self.count if self.count else 0.0,
+            'buckets': dict(zip(self.buckets, self.counts)),
+        }
+
+
+@contextmanager
+def timed(name: str):
+    """
+    Adds the time spent in the block to a metric of the current request, if it is being timed.
+
+    :param name:str: The metric, such as 'jwt' or 'json'.
+    """
+    start = time.perf_counter()
+
+    try:
+        yield
+    finally:
+        if has_app_context() and 'timings' in g:
+            g.timings[name] = g.timings.get(name, 0.0) + time.perf_counter() - start
+
+
+class RequestTiming:
+    """
+    Records request timings and aggregates them per endpoint.
+
+    Attributes:
+        - enabled (bool): If False, requests are not timed.
+        - header (bool): If True, responses carry a Server-Timing header.
+        - histograms (dict): Histogram of each (endpoint, metric) pair.
+        - statements (dict): Total number of SQL statements of each endpoint.
+        - observers (list[Callable]): Called with the endpoint, status code, timings and statement
+          count of every timed request.
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self.header = True
+        self.histograms: dict[tuple[str, str], Histogram] = {}
+        self.statements: dict[str, int] = {}
+        self.observers = []
+        self._lock = threading.Lock()
+
+    def init_app(self, app) -> None:
+        """
+        Registers the request hooks and instruments the engines of the application.
+
+        :param app:Flask: The Flask application instance, after the engines are created.
+        """
+        self.enabled = app.config.get('REQUEST_TIMING_ENABLED', True)
+        self.header = app.config.get('SERVER_TIMING_HEADER', True)
+
+        app.before_request(self._start)
+        app.after_request(self._finish)
+
+        with app.app_context():
+            self.instrument(db.engine)
+
+        for engine in (app.extensions.get(WRITER_EXTENSION_KEY), *app.extensions.get(REPLICAS_EXTENSION_KEY, [])):
+            if engine is not None:
+                self.instrument(engine)
+
+        app.extensions['request_timing'] = self
+
+    def instrument(self, engine) -> None:
+        """
+        Times the statements of an engine and counts them, for the request running them.
+
+        :param engine:Engine: The engine to instrument.
+        """
+        event.listen(engine, 'before_cursor_execute', _before_cursor_execute)
+        event.listen(engine, 'after_cursor_execute', _after_cursor_execute)
+        event.listen(engine, 'handle_error', _handle_error)
+
+    def _start(self) -> None:
+        if self.enabled:
+            g.timings = {}
+            g.statements = 0
+            g.request_start = time.perf_counter()
+
+    def _finish(self, response):
+        if 'timings' not in g:
+            return response
+
+        timings = {'total': time.perf_counter() - g.request_start, **g.timings}
+        endpoint = request.endpoint or 'unknown'
+
+        with self._lock:
+            for metric, seconds in timings.items():
+                histogram = self.histograms.get((endpoint, metric))
+
+                if histogram is None:
+                    histogram = self.histograms[(endpoint, metric)] = Histogram()
+
+                histogram.observe(seconds)
+
+            self.statements[endpoint] = self.statements.get(endpoint, 0) + g.statements
+
+        for observer in self.observers:
+            observer(endpoint, response.status_code, timings, g.statements)
+
+        if self.header:
+            response.headers['Server-Timing'] = ', '.join(
+                f'{metric};dur={seconds * 1000:.2f}' + (f';desc="{g.statements} queries"' if metric == 'db' else '')
+                for metric, seconds in timings.items()
+            )
+
+        return response
+
+    def stats(self) -> dict:
+        """
+        Returns the histograms and statement counts, by endpoint.
+
+        :return: dict: For each endpoint, its metric histograms and its number of SQL statements.
+        """
+        with self._lock:
+            stats = {}
+
+            for (endpoint, metric), histogram in self.histograms.items():
+                stats.setdefault(endpoint, {'statements': self.statements.get(endpoint, 0)})[metric] = \
+                    histogram.as_dict()
+
+            return stats
+
+    def reset(self) -> None:
+        """
+        Clears the histograms and statement counts.
+        """
+        with self._lock:
+            self.histograms.clear()
+            self.statements.clear()
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault('timing_start', []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    starts = conn.info.get('timing_start')
+
+    if not starts:
+        return
+
+    elapsed = time.perf_counter() - starts.pop()
+
+    if has_app_context() and 'timings' in g:
+        g.timings['db'] = g.timings.get('db', 0.0) + elapsed
+        g.statements += 1
+
+
+def _handle_error(exception_context):
+    connection = exception_context.connection
+
+    if connection is not None and connection.info.get('timing_start'):
+        connection.info['timing_start'].pop()
+
+
+request_timing = RequestTiming()
@@ -9,8 +9,11 @@ import os
 from dotenv import load_dotenv
 from flask import Flask
 from app.config import ProductionConfig, DevelopmentConfig
-from app.extensions import db, migrate
+from app.extensions import (db, db_router, migrate, init_sqlite, engine_report, pool_metrics, request_timing,
+                            response_cache, metrics, query_guard)
 from app.routes import register_blueprints
+from app.services.group_commit import task_group_commit
+from app.utils.json_provider import FastJSONProvider
 
 load_dotenv()
 
@@ -22,6 +25,7 @@ def create_app() -> Flask:
     :return:Flask: The configured Flask app instance.
     """
     flask_app = Flask(__name__)
+    flask_app.json = FastJSONProvider(flask_app)
 
     env = os.environ.get("FLASK_ENV", 'development')
 
@@ -31,7 +35,16 @@ def create_app() -> Flask:
         flask_app.config.from_object(DevelopmentConfig)
 
     db.init_app(flask_app)
+    db_router.init_app(flask_app)
+    init_sqlite(flask_app)
+    pool_metrics.init_app(flask_app)
+    request_timing.init_app(flask_app)
+    metrics.init_app(flask_app)
+    query_guard.init_app(flask_app)
+    flask_app.logger.info('Database engine: %s', engine_report(flask_app))
     migrate.init_app(flask_app, db)
+    response_cache.init_app(flask_app)
+    task_group_commit.init_app(flask_app)
 
     register_blueprints(flask_app)
 
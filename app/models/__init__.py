@@ -3,3 +3,5 @@ Init file
 """
 from .user import User
 from .task import Task
+from .task_tombstone import TaskTombstone
+from . import task_search
@@ -7,7 +7,7 @@ Classes:
 import uuid
 from datetime import datetime
 
-from sqlalchemy import UUID
+from sqlalchemy import UUID, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.extensions import db
@@ -16,13 +16,33 @@ from app.extensions import db
 class Task(db.Model):
     """
     Task model.
+
+    Every access path filters on user_id, so indexes lead with it: the composite index serves the
+    keyset-paginated list, the partial index serves listings of incomplete tasks, the title index
+    serves the list sorted by title, the updated_at index serves the single task validators, the
+    change_seq index serves delta sync and the creation day index, which also holds created_at and
+    completed, serves the summary's per-day counts without reading or sorting any row.
+
+    change_seq is the user's change sequence number of the last write to the task (see
+    User.task_change_seq).
     """
     __tablename__ = 'tasks'
+    __table_args__ = (
+        db.Index('ix_tasks_user_id_created_at_id', 'user_id', 'created_at', 'id'),
+        db.Index('ix_tasks_user_id_created_at_id_incomplete', 'user_id', 'created_at', 'id',
+                 sqlite_where=text('completed = 0'), postgresql_where=text('NOT completed')),
+        db.Index('ix_tasks_user_id_title_id', 'user_id', 'title', 'id'),
+        db.Index('ix_tasks_user_id_updated_at', 'user_id', 'updated_at'),
+        db.Index('ix_tasks_user_id_change_seq', 'user_id', 'change_seq'),
+        db.Index('ix_tasks_user_id_created_on', 'user_id', text('date(created_at)'), 'created_at', 'completed'),
+    )
     id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     title: Mapped[str] = mapped_column(nullable=False)
     description: Mapped[str] = mapped_column(nullable=False)
     completed: Mapped[bool] = mapped_column(default=False)
     created_at: Mapped[datetime] = mapped_column(default=datetime.now)
+    updated_at: Mapped[datetime] = mapped_column(default=datetime.now, onupdate=datetime.now)
+    change_seq: Mapped[int] = mapped_column(default=0, server_default='0')
 
     user_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), db.ForeignKey('users.id'), nullable=False)
     user: Mapped['User'] = relationship('User', back_populates='tasks')
@@ -42,5 +62,7 @@ class Task(db.Model):
             'description': self.description,
             'completed': self.completed,
             'created_at': self.created_at,
+            'updated_at': self.updated_at,
+            'change_seq': self.change_seq,
             'user_id': self.user_id,
         }
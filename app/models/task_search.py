@@ -0,0 +1,81 @@
+"""
+Full-text index of task titles and descriptions.
+
+On SQLite the index is an FTS5 external content table, tasks_fts, whose rows share the rowid of
+their task and hold no copy of the text. Triggers keep it in sync: inserts and deletes of tasks, and
+updates of their title or description (completing a task does not touch the index). The owner's ID
+is indexed as a token of its own column, so a search matches that token along with its words and
+only ever walks the postings of the user's tasks. On PostgreSQL it is a stored, generated tsvector
+column with a GIN index on (user_id, search_vector), through the btree_gin extension, which the
+database keeps in sync by itself. Both are created along with the tasks table, and by migrations
+0006 and 0008.
+
+The FTS5 table refers to tasks by rowid, which SQLite may renumber when it rebuilds the tasks table
+(VACUUM, or a batch migration copying the table). Rebuild the index afterwards with
+INSERT INTO tasks_fts(tasks_fts) VALUES('rebuild').
+
+Functions:
+    - is_search_object(name, type_): Returns whether a reflected schema object belongs to the index.
+"""
+from sqlalchemy import DDL, event
+
+from .task import Task
+
+SEARCH_TABLE = 'tasks_fts'
+SEARCH_VECTOR_COLUMN = 'search_vector'
+SEARCH_LANGUAGE = 'english'
+
+SEARCH_INDEX = 'ix_tasks_user_id_search_vector'
+
+SQLITE_CREATE = (
+    f"CREATE VIRTUAL TABLE {SEARCH_TABLE} USING fts5(title, description, user_id, "
+    "content='tasks', content_rowid='rowid', tokenize='unicode61 remove_diacritics 2')",
+    f"CREATE TRIGGER {SEARCH_TABLE}_insert AFTER INSERT ON tasks BEGIN "
+    f"INSERT INTO {SEARCH_TABLE}(rowid, title, description, user_id) "
+    "VALUES (new.rowid, new.title, new.description, new.user_id); "
+    "END",
+    f"CREATE TRIGGER {SEARCH_TABLE}_delete AFTER DELETE ON tasks BEGIN "
+    f"INSERT INTO {SEARCH_TABLE}({SEARCH_TABLE}, rowid, title, description, user_id) "
+    "VALUES ('delete', old.rowid, old.title, old.description, old.user_id); "
+    "END",
+    f"CREATE TRIGGER {SEARCH_TABLE}_update AFTER UPDATE OF title, description, user_id ON tasks BEGIN "
+    f"INSERT INTO {SEARCH_TABLE}({SEARCH_TABLE}, rowid, title, description, user_id) "
+    "VALUES ('delete', old.rowid, old.title, old.description, old.user_id); "
+    f"INSERT INTO {SEARCH_TABLE}(rowid, title, description, user_id) "
+    "VALUES (new.rowid, new.title, new.description, new.user_id); "
+    "END",
+)
+SQLITE_DROP = (f"DROP TABLE IF EXISTS {SEARCH_TABLE}",)
+
+POSTGRESQL_CREATE = (
+    f"ALTER TABLE tasks ADD COLUMN {SEARCH_VECTOR_COLUMN} tsvector GENERATED ALWAYS AS ("
+    f"setweight(to_tsvector('{SEARCH_LANGUAGE}', title), 'A') || "
+    f"setweight(to_tsvector('{SEARCH_LANGUAGE}', description), 'B')) STORED",
+    "CREATE EXTENSION IF NOT EXISTS btree_gin",
+    f"CREATE INDEX {SEARCH_INDEX} ON tasks USING GIN (user_id, {SEARCH_VECTOR_COLUMN})",
+)
+
+
+def is_search_object(name: str, type_: str) -> bool:
+    """
+    Returns whether a reflected schema object belongs to the full-text index, which the models do
+    not declare, so that migrations autogenerated from the models leave it alone.
+
+    :param name:str: The name of the object.
+    :param type_:str: The kind of object, such as 'table', 'column' or 'index'.
+    :return: bool: True for the FTS5 table and its shadow tables, the tsvector column and its index.
+    """
+    if type_ == 'table':
+        return name == SEARCH_TABLE or name.startswith(f'{SEARCH_TABLE}_')
+
+    return name in (SEARCH_VECTOR_COLUMN, SEARCH_INDEX)
+
+
+for statement in SQLITE_CREATE:
+    event.listen(Task.__table__, 'after_create', DDL(statement).execute_if(dialect='sqlite'))
+
+for statement in SQLITE_DROP:
+    event.listen(Task.__table__, 'after_drop', DDL(statement).execute_if(dialect='sqlite'))
+
+for statement in POSTGRESQL_CREATE:
+    event.listen(Task.__table__, 'after_create', DDL(statement).execute_if(dialect='postgresql'))
@@ -0,0 +1,35 @@
+"""
+Task tombstone model for the database.
+
+Classes:
+    - TaskTombstone: Records the deletion of a task for delta sync.
+"""
+import uuid
+from datetime import datetime
+
+from sqlalchemy import UUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.extensions import db
+
+
+class TaskTombstone(db.Model):
+    """
+    Task tombstone model.
+
+    Deleted tasks leave a tombstone carrying the change sequence number of the deletion, so clients
+    syncing with GET /tasks/changes learn about deletions as well as creations and updates.
+    """
+    __tablename__ = 'task_tombstones'
+    __table_args__ = (
+        db.Index('ix_task_tombstones_user_id_change_seq', 'user_id', 'change_seq'),
+    )
+    id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
+    task_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), nullable=False)
+    change_seq: Mapped[int] = mapped_column(nullable=False)
+    deleted_at: Mapped[datetime] = mapped_column(default=datetime.now)
+
+    user_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), db.ForeignKey('users.id'), nullable=False)
+
+    def __repr__(self):
+        return f'<TaskTombstone {self.task_id}>'
@@ -16,12 +16,18 @@ from app.extensions import db
 class User(db.Model):
     """
     User model.
+
+    task_change_seq is a monotonic counter bumped by every write to the user's tasks, deletions
+    included, and task_changed_at the date of that write. They are the ETag and Last-Modified date
+    of the task list and its summary (see tasks_validators), and task_change_seq the delta sync cursor.
     """
     __tablename__ = 'users'
     id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     email: Mapped[str] = mapped_column(unique=True, nullable=False)
     password: Mapped[str] = mapped_column(nullable=False)
     created_at: Mapped[datetime] = mapped_column(default=datetime.now)
+    task_change_seq: Mapped[int] = mapped_column(default=0, server_default='0')
+    task_changed_at: Mapped[datetime | None] = mapped_column()
 
     tasks: Mapped[list['Task']] = relationship('Task', back_populates='user')
 
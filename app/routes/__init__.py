@@ -1,19 +1,21 @@
 """
-Register Flask Blueprints for authentication and tasks routes.
+Register Flask Blueprints for authentication, tasks and metrics routes.
 
 Functions:
-    - register_blueprints(app): Registers the authentication and tasks blueprints.
+    - register_blueprints(app): Registers the authentication, tasks and metrics blueprints.
 """
 
 from app.routes.auth import auth_blueprint
+from app.routes.metrics import metrics_blueprint
 from app.routes.tasks import tasks_blueprint
 
 
 def register_blueprints(app):
     """
-    Register the authentication and tasks blueprints with URL prefixes.
+    Register the authentication, tasks and metrics blueprints with URL prefixes.
 
     :param app:Flask: The Flask application instance.
     """
     app.register_blueprint(auth_blueprint, url_prefix='/auth')
     app.register_blueprint(tasks_blueprint, url_prefix='/tasks')
+    app.register_blueprint(metrics_blueprint, url_prefix='/metrics')
@@ -4,21 +4,35 @@ Authentication endpoints for user registration and login.
 Functions:
     - register(): Registers a new user.
     - login(): Logs in a user and returns a JWT token.
+    - password_pool_saturated(error): Answers with 503 when the password pool is saturated.
 
 Decorators:
     - @auth_blueprint.route(): Defines routes for registration and login.
 """
 from flask import Blueprint, request, jsonify, Response
-from werkzeug.security import generate_password_hash, check_password_hash
 
-from app.extensions import db
+from app.extensions import db, max_queries, timed
 from app.models import User
+from app.services.auth_service import PasswordPoolSaturated, check_password, hash_password
 from app.utils.token import generate_token, verify_token
 
 auth_blueprint = Blueprint('auth', __name__)
 
 
+@auth_blueprint.errorhandler(PasswordPoolSaturated)
+def password_pool_saturated(error: PasswordPoolSaturated) -> tuple[Response, int, dict]:
+    """
+    Answers with 503 when the password pool queue is full.
+
+    Returns:
+    - JSON: Error message.
+    - Status Code: 503 (Service Unavailable), with a Retry-After header.
+    """
+    return jsonify({"message": "Server is busy, please try again"}), 503, {"Retry-After": "1"}
+
+
 @auth_blueprint.route('/register', methods=['POST'])
+@max_queries(2)
 def register() -> tuple[Response, int]:
     """
     Registers a new user.
@@ -29,7 +43,7 @@ def register() -> tuple[Response, int]:
 
     Returns:
     - JSON: Success or error message.
-    - Status Code: 201 (Created), 400 (Bad Request), 500 (Internal Server Error).
+    - Status Code: 201 (Created), 400 (Bad Request), 500 (Internal Server Error), 503 (Service Unavailable).
     """
     data = request.get_json()
 
@@ -39,7 +53,7 @@ def register() -> tuple[Response, int]:
     if db.session.query(User).filter_by(email=data.get('email')).first():
         return jsonify({"message": "User already registered"}), 400
 
-    hashed_password = generate_password_hash(data['password'])
+    hashed_password = hash_password(data['password'])
     new_user = User(email=data['email'], password=hashed_password)
 
     try:
@@ -51,6 +65,7 @@ def register() -> tuple[Response, int]:
 
 
 @auth_blueprint.route('/login', methods=['POST'])
+@max_queries(1)
 def login() -> tuple[Response, int]:
     """
     Logs in a user and returns a JWT token.
@@ -61,7 +76,7 @@ def login() -> tuple[Response, int]:
 
     Returns:
     - JSON: Success message with the JWT token or error message.
-    - Status Code: 200 (OK), 400 (Bad Request), 401 (Unauthorized).
+    - Status Code: 200 (OK), 400 (Bad Request), 401 (Unauthorized), 503 (Service Unavailable).
     """
     data = request.get_json()
 
@@ -70,9 +85,10 @@ def login() -> tuple[Response, int]:
 
     user = User.query.filter_by(email=data['email']).first()
 
-    if not user or not check_password_hash(user.password, data['password']):
+    if not user or not check_password(user.password, data['password']):
         return jsonify({"message": "Invalid email or password"}), 401
 
-    token = generate_token(str(user.id))
+    with timed('jwt'):
+        token = generate_token(str(user.id))
 
     return jsonify({"token": token}), 200
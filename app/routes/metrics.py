@@ -0,0 +1,42 @@
+"""
+Prometheus scrape endpoint.
+
+Functions:
+    - get_metrics(): Returns the service metrics in the Prometheus text format.
+
+Decorators:
+    - @metrics_blueprint.route(): Defines the metrics route.
+"""
+import hmac
+
+from flask import Blueprint, Response, current_app, jsonify, request
+
+from app.extensions import metrics
+
+metrics_blueprint = Blueprint('metrics', __name__)
+
+
+@metrics_blueprint.route('', methods=['GET'])
+def get_metrics() -> Response | tuple[Response, int]:
+    """
+    Return the service metrics in the Prometheus text format.
+
+    Covers request counts and latency histograms per blueprint and route, in-flight requests, the
+    connection pools and the token and response caches. With PROMETHEUS_MULTIPROC_DIR set, the
+    metrics of every gunicorn worker are aggregated.
+
+    Headers:
+        - Authorization (str): 'Bearer <METRICS_TOKEN>', required only if METRICS_TOKEN is set.
+
+    Returns:
+        - Text: The metrics.
+        - HTTP Status Code: 200 (OK), 401 (Unauthorized).
+    """
+    token = current_app.config.get('METRICS_TOKEN')
+
+    if token and not hmac.compare_digest(request.headers.get('Authorization', ''), f'Bearer {token}'):
+        return jsonify({"message": "Token is missing or invalid"}), 401
+
+    body, content_type = metrics.render()
+
+    return Response(body, content_type=content_type)
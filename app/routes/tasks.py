@@ -3,21 +3,43 @@ Task management routes using Flask and SQLAlchemy.
 
 Functions:
     - create_task(): Creates a new task.
-    - get_tasks(): Returns all tasks for the authenticated user.
+    - get_tasks(): Returns a page of tasks for the authenticated user.
+    - get_task_changes(): Returns the task changes and deletions since a cursor, for delta sync.
+    - search_tasks_route(): Returns the tasks matching a full-text search, best match first.
+    - get_tasks_summary(): Returns the task counts and daily creation histogram of the authenticated user.
+    - stream_task_events(): Streams the task changes of the authenticated user as Server-Sent Events.
     - get_task_by_id(task_id): Returns the task with the given ID.
+    - export_tasks(): Streams all tasks of the authenticated user as NDJSON or CSV.
+    - import_tasks_stream(): Imports a streamed NDJSON or CSV body of tasks.
     - update_task(): Updates the task with the given ID.
     - delete_task(): Deletes the task with the given ID.
+    - create_tasks_batch(): Creates many tasks in one transaction.
+    - update_tasks_batch(): Updates many tasks in one transaction.
+    - delete_tasks_batch(): Deletes many tasks in one transaction.
 
 Decorators:
     - before_request(): Verifies the JWT token before each request.
+    - group_commit_timeout(error): Answers with 503 when a grouped task creation timed out.
 """
+import csv
+import io
 import uuid
 
-from flask import Blueprint, request, jsonify
+from flask import Blueprint, Response, request, jsonify, current_app, stream_with_context
 
-from app.extensions import db
+from app.extensions import db, db_router, event_hub, max_queries, response_cache, timed
 from app.models import Task
-from app.utils.token import verify_token
+from app.services.group_commit import GroupCommitTimeout, task_group_commit
+from app.services.tasks_service import (create_tasks, delete_tasks, update_tasks, update_task_by_id,
+                                        delete_task_by_id, get_task, list_tasks, stream_tasks, import_tasks,
+                                        tasks_validators, task_updated_at, task_changes, reserve_change_seqs,
+                                        current_change_seq, search_tasks, task_summary, TASK_FIELDS, TASK_SORTS)
+from app.utils.conditional import conditional, make_etag
+from app.utils.filters import InvalidFilterError, parse_bool, parse_datetime, parse_fields, parse_sort
+from app.utils.pagination import (InvalidCursorError, decode_cursor, decode_offset_cursor, encode_cursor,
+                                  encode_offset_cursor, parse_limit, parse_change_cursor)
+from app.utils.token import verify_token_cached
+from app.utils.validations import validate_task
 
 tasks_blueprint = Blueprint('tasks', __name__)
 
@@ -27,6 +49,8 @@ def before_request():
     """
     Verify the JWT token before each request.
 
+    Verified tokens are cached per worker, so a token is fully decoded once rather than on every request.
+
     Returns:
         - JSON: Error message if token is missing or invalid.
         - HTTP Status Code: 401 (Unauthorized).
@@ -36,54 +60,501 @@ def before_request():
     if not token:
         return jsonify({"message": "Token is missing"}), 401
 
-    user_id = verify_token(token)
+    with timed('jwt'):
+        request.user_id = verify_token_cached(token)
+
 
-    user_id_uuid = uuid.UUID(user_id)
+@tasks_blueprint.errorhandler(GroupCommitTimeout)
+def group_commit_timeout(error: GroupCommitTimeout):
+    """
+    Answers with 503 when a task creation waited too long for its group commit. A task withdrawn
+    before being written can safely be created again; one whose write was under way may exist, and
+    the client should check its changes before retrying.
 
-    if not (user_id or str(user_id_uuid) == user_id):
-        return jsonify({"message": "An error occurred while authenticating the user token"}), 401
+    Returns:
+        - JSON: Error message.
+        - HTTP Status Code: 503 (Service Unavailable), with a Retry-After header.
+    """
+    if error.withdrawn:
+        message = "Server is busy, the task was not created, please try again"
+    else:
+        message = "Server is busy, the task may or may not have been created"
 
-    request.user_id = user_id_uuid
+    return jsonify({"message": message}), 503, {"Retry-After": "1"}
 
 
 @tasks_blueprint.route('/', methods=['POST'])
+@max_queries(3)
+@db_router.read_write
 def create_task():
     """
     Create a new task for the authenticated user.
 
+    With TASKS_GROUP_COMMIT on, the task is committed together with the tasks created concurrently
+    in the same worker, in one transaction.
+
     Request bodu (JSON):
         - title (str): The title of the task.
         - description (str): The description of the task.
 
     Returns:
-        - JSON: The created task details.
-        - HTTP Status Code: 201 (Created).
+        - JSON: The created task details or an error message.
+        - HTTP Status Code: 201 (Created), 400 (Bad Request), 503 (Service Unavailable, not created).
     """
     data = request.get_json()
 
-    new_task = Task(title=data['title'], description=data['description'], user_id=request.user_id)
+    error = validate_task(data)
+
+    if error:
+        return jsonify({"message": error}), 400
+
+    if task_group_commit.enabled:
+        task = task_group_commit.submit(request.user_id, data)['task']
+        db_router.record_write()
+    else:
+        new_task = Task(title=data['title'], description=data['description'], user_id=request.user_id,
+                        change_seq=reserve_change_seqs(request.user_id))
+
+        db.session.add(new_task)
+        db.session.commit()
+        task = new_task.as_dict()
+
+    event_hub.publish(request.user_id, 'task.created', task['change_seq'], task)
+
+    return jsonify(task), 201
 
-    db.session.add(new_task)
-    db.session.commit()
 
-    return jsonify(new_task.as_dict()), 201
+def _tasks_validators():
+    """
+    Compute the ETag and Last-Modified date of a task list page from the user's change sequence,
+    without loading any task.
+    """
+    change_seq, changed_at = tasks_validators(request.user_id)
+
+    return make_etag(request.user_id, change_seq, request.query_string.decode()), changed_at
+
+
+def _task_validators(task_id):
+    """
+    Compute the ETag and Last-Modified date of a task from its last update date.
+    """
+    updated_at = task_updated_at(request.user_id, uuid.UUID(task_id))
+
+    if updated_at is None:
+        return None
+
+    return make_etag(task_id, updated_at), updated_at
 
 
 @tasks_blueprint.route('/', methods=['GET'])
+@max_queries(2)
+@db_router.read_only
+@conditional(_tasks_validators)
+@response_cache.cached(lambda: f'tasks?{request.query_string.decode()}')
 def get_tasks():
     """
-    Retrieve all tasks for the authenticated user.
+    Retrieve a page of tasks for the authenticated user, ordered by creation date by default.
+
+    Pagination is keyset based on (sort key, id), so deep pages cost the same as the first one.
+    Filters, sort order and field selection all run in SQL: unselected columns are never loaded.
+
+    Query parameters:
+        - limit (int, optional): Page size, capped at TASKS_MAX_PAGE_SIZE.
+        - cursor (str, optional): The next_cursor returned by the previous page, with the same sort.
+        - completed (bool, optional): Only return completed (true) or incomplete (false) tasks.
+        - created_after (str, optional): Only return tasks created after this ISO 8601 date.
+        - created_before (str, optional): Only return tasks created before this ISO 8601 date.
+        - sort (str, optional): created_at (default), -created_at, title or -title.
+        - fields (str, optional): Comma separated fields to return, such as id,title,completed.
+
+    Responses carry an ETag and a Last-Modified date; conditional requests get a 304 when nothing changed.
+
+    Returns:
+        - JSON: The retrieved tasks and the cursor of the next page (null on the last page).
+        - HTTP Status Code: 200 (OK), 304 (Not Modified), 400 (Bad Request).
+    """
+    try:
+        limit = parse_limit(request.args.get('limit'),
+                            current_app.config.get('TASKS_PAGE_SIZE', 50),
+                            current_app.config.get('TASKS_MAX_PAGE_SIZE', 200))
+        sort = parse_sort(request.args.get('sort'), TASK_SORTS, 'created_at')
+        fields = parse_fields(request.args.get('fields'), TASK_FIELDS)
+        filters = {
+            'completed': parse_bool(request.args.get('completed'), 'completed'),
+            'created_after': parse_datetime(request.args.get('created_after'), 'created_after'),
+            'created_before': parse_datetime(request.args.get('created_before'), 'created_before'),
+        }
+        cursor = request.args.get('cursor')
+        position = decode_cursor(cursor, sort) if cursor else None
+    except (InvalidCursorError, InvalidFilterError) as e:
+        return jsonify({"message": str(e)}), 400
+
+    key = sort.lstrip('-')
+    selected = fields and tuple(dict.fromkeys((*fields, key, 'id')))
+    tasks = list_tasks(request.user_id, limit + 1, position, sort=sort, fields=selected, **filters)
+
+    next_cursor = None
+
+    if len(tasks) > limit:
+        tasks = tasks[:limit]
+        next_cursor = encode_cursor(tasks[-1][key], uuid.UUID(tasks[-1]['id']), sort)
+
+    if selected != fields:
+        tasks = [{field: task[field] for field in fields} for task in tasks]
+
+    return jsonify({"tasks": tasks, "next_cursor": next_cursor}), 200
+
+
+@tasks_blueprint.route('/changes', methods=['GET'])
+@max_queries(2)
+@db_router.read_only
+def get_task_changes():
+    """
+    Retrieve the changes of the authenticated user's tasks since a cursor, for delta sync.
+
+    Every write takes the next number of the user's change sequence, and deleted tasks leave a
+    tombstone, so a client keeping the returned cursor only ever downloads what changed. Without a
+    cursor, every live task is returned.
+
+    Query parameters:
+        - since (str, optional): The cursor returned by the previous sync.
+        - limit (int, optional): Maximum number of changes, capped at TASKS_MAX_PAGE_SIZE.
+
+    Returns:
+        - JSON: The created or updated tasks, the IDs of the deleted tasks, the cursor to sync from
+          next and whether more changes are pending.
+        - HTTP Status Code: 200 (OK), 400 (Bad Request).
+    """
+    try:
+        limit = parse_limit(request.args.get('limit'),
+                            current_app.config.get('TASKS_PAGE_SIZE', 50),
+                            current_app.config.get('TASKS_MAX_PAGE_SIZE', 200))
+        since = parse_change_cursor(request.args.get('since'))
+    except InvalidCursorError as e:
+        return jsonify({"message": str(e)}), 400
+
+    changed, deleted, cursor, has_more = task_changes(request.user_id, since, limit)
+
+    return jsonify({"changed": changed, "deleted": deleted, "cursor": str(cursor), "has_more": has_more}), 200
+
+
+@tasks_blueprint.route('/search', methods=['GET'])
+@max_queries(2)
+@db_router.read_only
+@conditional(_tasks_validators)
+@response_cache.cached(lambda: f'search?{request.query_string.decode()}')
+def search_tasks_route():
+    """
+    Search the authenticated user's tasks by title and description.
+
+    The search runs on a full-text index (FTS5 on SQLite, a GIN indexed tsvector on PostgreSQL), so
+    it costs a few index lookups rather than a scan of the user's tasks. Tasks matching every word
+    are returned, the best matches first, with title matches ranking above description matches.
+    Paging stops after the TASKS_SEARCH_MAX_RESULTS best matches, so no page ranks and skips more
+    than that many.
+
+    Query parameters:
+        - q (str): The words to search for.
+        - limit (int, optional): Page size, capped at TASKS_MAX_PAGE_SIZE.
+        - cursor (str, optional): The next_cursor returned by the previous page.
+
+    Responses carry an ETag and a Last-Modified date; conditional requests get a 304 when nothing changed.
+
+    Returns:
+        - JSON: The matching tasks and the cursor of the next page (null on the last page).
+        - HTTP Status Code: 200 (OK), 304 (Not Modified), 400 (Bad Request).
+    """
+    text = request.args.get('q', '').strip()
+    max_length = current_app.config.get('TASKS_SEARCH_MAX_LENGTH', 200)
+
+    if not text or len(text) > max_length:
+        return jsonify({"message": f"q must be between 1 and {max_length} characters"}), 400
+
+    try:
+        limit = parse_limit(request.args.get('limit'),
+                            current_app.config.get('TASKS_PAGE_SIZE', 50),
+                            current_app.config.get('TASKS_MAX_PAGE_SIZE', 200))
+        cursor = request.args.get('cursor')
+        offset = decode_offset_cursor(cursor) if cursor else 0
+    except InvalidCursorError as e:
+        return jsonify({"message": str(e)}), 400
+
+    max_results = current_app.config.get('TASKS_SEARCH_MAX_RESULTS', 1000)
+
+    if offset >= max_results:
+        return jsonify({"message": f"Only the {max_results} best matches can be paged through"}), 400
+
+    limit = min(limit, max_results - offset)
+    tasks = search_tasks(request.user_id, text, limit + 1, offset)
+
+    next_cursor = None
+
+    if len(tasks) > limit:
+        tasks = tasks[:limit]
+
+        if offset + limit < max_results:
+            next_cursor = encode_offset_cursor(offset + limit)
+
+    return jsonify({"tasks": tasks, "next_cursor": next_cursor}), 200
+
+
+@tasks_blueprint.route('/summary', methods=['GET'])
+@max_queries(2)
+@db_router.read_only
+@conditional(_tasks_validators)
+@response_cache.cached(lambda: f'summary?{request.query_string.decode()}')
+def get_tasks_summary():
+    """
+    Count the authenticated user's tasks and bucket them by creation day.
+
+    The counts are computed in the database with a single GROUP BY, so no task is loaded, and the
+    response is revalidated and cached like the task list.
+
+    Query parameters:
+        - created_after (str, optional): Only count tasks created after this ISO 8601 date.
+        - created_before (str, optional): Only count tasks created before this ISO 8601 date.
+
+    Returns:
+        - JSON: The total, completed and pending counts, and the number of tasks created each day.
+        - HTTP Status Code: 200 (OK), 304 (Not Modified), 400 (Bad Request).
+    """
+    try:
+        created_after = parse_datetime(request.args.get('created_after'), 'created_after')
+        created_before = parse_datetime(request.args.get('created_before'), 'created_before')
+    except InvalidFilterError as e:
+        return jsonify({"message": str(e)}), 400
+
+    return jsonify(task_summary(request.user_id, created_after, created_before)), 200
+
+
+def _ndjson_chunks(batches):
+    """
+    Serialize batches of tasks as newline-delimited JSON, one chunk per batch.
+    """
+    dumps = current_app.json.dumps
+
+    for batch in batches:
+        yield ''.join(dumps(task) + '\n' for task in batch)
+
+
+def _csv_chunks(batches):
+    """
+    Serialize batches of tasks as CSV with a header row, one chunk per batch.
+    """
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(TASK_FIELDS)
+
+    for batch in batches:
+        writer.writerows([task[field] for field in TASK_FIELDS] for task in batch)
+        yield buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+
+
+EXPORT_FORMATS = {
+    'ndjson': (_ndjson_chunks, 'application/x-ndjson'),
+    'csv': (_csv_chunks, 'text/csv'),
+}
+
+
+@tasks_blueprint.route('/export', methods=['GET'])
+@db_router.read_only
+def export_tasks():
+    """
+    Stream all tasks of the authenticated user.
+
+    Rows come from a server-side cursor and are written out batch by batch, so memory use does not
+    grow with the number of tasks.
+
+    Query parameters:
+        - format (str, optional): ndjson (default) or csv.
+
+    Returns:
+        - NDJSON or CSV: The tasks, ordered by creation date.
+        - HTTP Status Code: 200 (OK), 400 (Bad Request).
+    """
+    export_format = request.args.get('format', 'ndjson')
+
+    if export_format not in EXPORT_FORMATS:
+        return jsonify({"message": "Format must be one of: " + ', '.join(EXPORT_FORMATS)}), 400
+
+    serialize, mimetype = EXPORT_FORMATS[export_format]
+    batches = stream_tasks(request.user_id, current_app.config.get('TASKS_EXPORT_BATCH_SIZE', 1000))
+
+    return Response(stream_with_context(serialize(batches)), mimetype=mimetype, headers={
+        'Content-Disposition': f'attachment; filename=tasks.{export_format}',
+    })
+
+
+def _ndjson_records(stream):
+    """
+    Parse a streamed NDJSON body line by line into (line number, task or error message) pairs.
+    """
+    loads = current_app.json.loads
+
+    for line_number, line in enumerate(stream, start=1):
+        if not line.strip():
+            continue
+
+        try:
+            yield line_number, loads(line)
+        except ValueError:
+            yield line_number, "Invalid JSON"
+
+
+def _csv_records(stream):
+    """
+    Parse a streamed CSV body with a header row into (line number, task or error message) pairs.
+    """
+    reader = csv.DictReader(line.decode('utf-8', errors='replace') for line in stream)
+
+    try:
+        for row in reader:
+            yield reader.line_num, {key: value for key, value in row.items() if key is not None}
+    except csv.Error as e:
+        yield reader.line_num, f"Invalid CSV: {e}"
+
+
+IMPORT_FORMATS = {
+    'ndjson': _ndjson_records,
+    'csv': _csv_records,
+}
+
+IMPORT_MIMETYPES = {
+    'application/x-ndjson': 'ndjson',
+    'application/jsonl': 'ndjson',
+    'text/csv': 'csv',
+}
+
+
+@tasks_blueprint.route('/import', methods=['POST'])
+@db_router.read_write
+def import_tasks_stream():
+    """
+    Import tasks for the authenticated user from a streamed NDJSON or CSV body.
+
+    The body is parsed incrementally and every record is validated like in create_task. Valid
+    records are inserted TASKS_IMPORT_CHUNK_SIZE at a time, one transaction per chunk.
+
+    Query parameters:
+        - format (str, optional): ndjson or csv, otherwise derived from the Content-Type.
+
+    Returns:
+        - JSON: The accepted and rejected counts and the first errors with their line numbers.
+        - HTTP Status Code: 200 (OK), 400 (Bad Request).
+    """
+    import_format = request.args.get('format') or IMPORT_MIMETYPES.get(request.mimetype)
+
+    if import_format not in IMPORT_FORMATS:
+        return jsonify({"message": "Format must be one of: " + ', '.join(IMPORT_FORMATS)}), 400
+
+    records = IMPORT_FORMATS[import_format](request.stream)
+    summary = import_tasks(request.user_id, records, current_app.config.get('TASKS_IMPORT_CHUNK_SIZE', 1000))
+
+    if summary['accepted']:
+        event_hub.publish(request.user_id, 'resync')
+
+    return jsonify(summary), 200
+
+
+def _sse(event: str, change_seq: int | None, data, dumps) -> str:
+    """
+    Format an event as a Server-Sent Events message, with the change sequence number as its ID.
+    """
+    message = f'event: {event}\n'
+
+    if change_seq is not None:
+        message += f'id: {change_seq}\n'
+
+    return message + f'data: {dumps(data)}\n\n'
+
+
+def _event_stream(subscription, since: int, last_seq: int, heartbeat: float):
+    """
+    Yield the events of a subscription, with a heartbeat comment whenever the stream is idle.
+
+    Heartbeats also compare the user's change sequence with the last event sent, which catches the
+    writes served by other worker processes, and tell the client to resync if it fell behind.
+    """
+    dumps = current_app.json.dumps
+
+    try:
+        yield f'retry: {int(heartbeat * 1000)}\n\n'
+
+        if since and since < last_seq:
+            yield _sse('resync', None, {"since": str(since)}, dumps)
+
+        while True:
+            if subscription.overflowed:
+                subscription.reset()
+                yield _sse('resync', None, {"since": str(last_seq)}, dumps)
+                continue
+
+            event = subscription.get(heartbeat)
+
+            if event is not None:
+                last_seq = max(last_seq, event[1] or 0)
+                yield _sse(*event, dumps)
+                continue
+
+            change_seq = current_change_seq(subscription.user_id)
+            db.session.remove()
+
+            if change_seq > last_seq:
+                yield _sse('resync', None, {"since": str(last_seq)}, dumps)
+                last_seq = change_seq
+            else:
+                yield ': heartbeat\n\n'
+    finally:
+        event_hub.unsubscribe(subscription)
+
+
+@tasks_blueprint.route('/stream', methods=['GET'])
+def stream_task_events():
+    """
+    Stream the task changes of the authenticated user as Server-Sent Events.
+
+    Write routes publish task.created, task.updated and task.deleted events after committing, with
+    the change sequence number as event ID. A resync event asks the client to fetch GET
+    /tasks/changes from its cursor, after a reconnection that missed changes or when the stream fell
+    more than TASKS_STREAM_QUEUE_SIZE events behind. The stream does no work while idle, so it is
+    held cheaply by an asynchronous worker (see the README).
+
+    Headers:
+        - Last-Event-ID (str, optional): The ID of the last event received, to resume from.
 
     Returns:
-        - JSON: The retrieved tasks.
-        - HTTP Status Code: 200 (OK).
+        - Event stream: The task change events and heartbeats.
+        - HTTP Status Code: 200 (OK), 400 (Bad Request).
     """
-    tasks = Task.query.filter_by(user_id=request.user_id).all()
+    try:
+        since = parse_change_cursor(request.headers.get('Last-Event-ID') or request.args.get('since'))
+    except InvalidCursorError as e:
+        return jsonify({"message": str(e)}), 400
+
+    subscription = event_hub.subscribe(request.user_id, current_app.config.get('TASKS_STREAM_QUEUE_SIZE', 100))
 
-    return jsonify([task.as_dict() for task in tasks]), 200
+    try:
+        change_seq = current_change_seq(request.user_id)
+        db.session.remove()
+    except BaseException:
+        event_hub.unsubscribe(subscription)
+        raise
+
+    events = _event_stream(subscription, since, change_seq, current_app.config.get('TASKS_STREAM_HEARTBEAT', 15))
+
+    return Response(stream_with_context(events), mimetype='text/event-stream', headers={
+        'Cache-Control': 'no-cache',
+        'X-Accel-Buffering': 'no',
+    })
 
 
 @tasks_blueprint.route('/<task_id>', methods=['GET'])
+@max_queries(2)
+@db_router.read_only
+@conditional(_task_validators)
+@response_cache.cached(lambda task_id: f'task:{task_id}')
 def get_task_by_id(task_id):
     """
     Retrieve a specific task by ID for the authenticated user.
@@ -93,17 +564,19 @@ def get_task_by_id(task_id):
 
     Returns:
         - JSON: The task details or an error message.
-        - HTTP Status Code: 200 (OK), 404 (Not Found).
+        - HTTP Status Code: 200 (OK), 304 (Not Modified), 404 (Not Found).
     """
-    task = Task.query.filter_by(id=uuid.UUID(task_id), user_id=request.user_id).first()
+    task = get_task(request.user_id, uuid.UUID(task_id))
 
     if task is None:
         return jsonify({"message": "Task not found"}), 404
 
-    return jsonify(task.as_dict()), 200
+    return jsonify(task), 200
 
 
 @tasks_blueprint.route('/<task_id>', methods=['PUT'])
+@max_queries(3)
+@db_router.read_write
 def update_task(task_id):
     """
     Update a specific task by ID for the authenticated user.
@@ -118,25 +591,31 @@ def update_task(task_id):
 
     Returns:
         - JSON: The updated task details or an error message.
-        - HTTP Status Code: 200 (OK), 404 (Not Found).
+        - HTTP Status Code: 200 (OK), 400 (Bad Request), 404 (Not Found).
     """
     data = request.get_json()
 
-    task = Task.query.filter_by(id=uuid.UUID(task_id), user_id=request.user_id).first()
+    error = validate_task(data, partial=True)
+
+    if error:
+        return jsonify({"message": error}), 400
+
+    changes = {key: data[key] for key in ('title', 'description', 'completed') if key in data}
+
+    task = update_task_by_id(request.user_id, uuid.UUID(task_id), changes)
 
     if not task:
         return jsonify({"message": "Task not found"}), 404
 
-    task.title = data.get('title', task.title)
-    task.description = data.get('description', task.description)
-    task.completed = data.get('completed', task.completed)
-
     db.session.commit()
+    event_hub.publish(request.user_id, 'task.updated', task['change_seq'], task)
 
-    return jsonify(task.as_dict()), 200
+    return jsonify(task), 200
 
 
 @tasks_blueprint.route('/<task_id>', methods=['DELETE'])
+@max_queries(4)
+@db_router.read_write
 def delete_task(task_id):
     """
     Delete a specific task by ID for the authenticated user.
@@ -148,12 +627,129 @@ def delete_task(task_id):
         - JSON: The deleted task details or an error message.
         - HTTP Status Code: 200 (OK), 404 (Not Found).
     """
-    task = Task.query.filter_by(id=uuid.UUID(task_id), user_id=request.user_id).first()
+    change_seq = delete_task_by_id(request.user_id, uuid.UUID(task_id))
 
-    if not task:
+    if change_seq is None:
         return jsonify({"message": "Task not found"}), 404
 
-    db.session.delete(task)
     db.session.commit()
+    event_hub.publish(request.user_id, 'task.deleted', change_seq, {"id": task_id})
 
     return jsonify({"message": "Task deleted successfully"}), 200
+
+
+def _batch_items(key: str):
+    """
+    Extract the list of items of a batch request body.
+
+    :param key:str: The body key holding the items.
+    :return: tuple: The items and None, or None and an error response.
+    """
+    data = request.get_json(silent=True)
+    items = data.get(key) if isinstance(data, dict) else None
+
+    if not isinstance(items, list) or not items:
+        return None, (jsonify({"message": f"A non-empty '{key}' list is required"}), 400)
+
+    max_size = current_app.config.get('TASKS_BATCH_MAX_SIZE', 500)
+
+    if len(items) > max_size:
+        return None, (jsonify({"message": f"Batch size is limited to {max_size} items"}), 400)
+
+    return items, None
+
+
+def _publish_results(event: str, status: int, results: list[dict]) -> None:
+    """
+    Publish the successful results of a committed batch to the live streams of the user.
+
+    :param event:str: The event name.
+    :param status:int: The status of the successful results.
+    :param results:list[dict]: The batch results.
+    """
+    for result in results:
+        if result['status'] != status:
+            continue
+
+        if 'task' in result:
+            event_hub.publish(request.user_id, event, result['task']['change_seq'], result['task'])
+        else:
+            event_hub.publish(request.user_id, event, result['change_seq'], {"id": result['id']})
+
+
+@tasks_blueprint.route('/batch', methods=['POST'])
+@max_queries(2)
+@db_router.read_write
+def create_tasks_batch():
+    """
+    Create many tasks for the authenticated user in one transaction.
+
+    Request body (JSON):
+        - tasks (list): Task objects with title and description.
+
+    Returns:
+        - JSON: One result per task, in request order, with its status and task or error message.
+        - HTTP Status Code: 200 (OK), 400 (Bad Request).
+    """
+    items, error = _batch_items('tasks')
+
+    if error:
+        return error
+
+    results = create_tasks(request.user_id, items)
+    db.session.commit()
+    _publish_results('task.created', 201, results)
+
+    return jsonify({"results": results}), 200
+
+
+@tasks_blueprint.route('/batch', methods=['PATCH'])
+@max_queries(4)
+@db_router.read_write
+def update_tasks_batch():
+    """
+    Update many tasks of the authenticated user in one transaction.
+
+    Request body (JSON):
+        - tasks (list): Task objects with id and any of title, description and completed.
+
+    Returns:
+        - JSON: One result per task, in request order, with its status and task or error message.
+        - HTTP Status Code: 200 (OK), 400 (Bad Request).
+    """
+    items, error = _batch_items('tasks')
+
+    if error:
+        return error
+
+    results = update_tasks(request.user_id, items)
+    db.session.commit()
+    _publish_results('task.updated', 200, results)
+
+    return jsonify({"results": results}), 200
+
+
+@tasks_blueprint.route('/batch', methods=['DELETE'])
+@max_queries(4)
+@db_router.read_write
+def delete_tasks_batch():
+    """
+    Delete many tasks of the authenticated user in one transaction.
+
+    Request body (JSON):
+        - ids (list): The IDs of the tasks to delete.
+
+    Returns:
+        - JSON: One result per ID, in request order, with its status and message.
+        - HTTP Status Code: 200 (OK), 400 (Bad Request).
+    """
+    ids, error = _batch_items('ids')
+
+    if error:
+        return error
+
+    results = delete_tasks(request.user_id, ids)
+    db.session.commit()
+    _publish_results('task.deleted', 200, results)
+
+    return jsonify({"results": results}), 200
@@ -0,0 +1,158 @@
+"""
+Password hashing and verification off the request thread.
+
+Key derivation takes hundreds of milliseconds of CPU, so it runs in a bounded process pool. A burst
+of registrations or logins then queues there instead of stalling every other request of the
+worker, and once the queue is full callers are told to retry later.
+
+Classes:
+    - PasswordPoolSaturated: Raised when the password pool queue is full.
+    - PasswordHasher: Runs password hashing and verification in a bounded worker pool.
+
+Functions:
+    - get_password_hasher(): Returns the password hasher of the current application.
+    - hash_password(password): Hashes a password with the configured method.
+    - check_password(pwhash, password): Checks a password against a hash.
+"""
+import multiprocessing
+import threading
+from concurrent.futures import Executor, ProcessPoolExecutor
+
+from flask import current_app
+
+from app.extensions import timed
+from werkzeug.security import check_password_hash, generate_password_hash
+
+
+class PasswordPoolSaturated(Exception):
+    """
+    Raised when too many password operations are already queued.
+    """
+    pass
+
+
+class PasswordHasher:
+    """
+    Runs password hashing and verification in a bounded worker pool.
+
+    Attributes:
+        - method (str): The werkzeug hash method, including its cost parameters.
+        - max_pending (int): Maximum number of queued or running operations, 0 for no limit.
+    """
+
+    def __init__(self, method: str, workers: int = 0, max_pending: int = 32, executor: Executor | None = None):
+        """
+        :param method:str: The werkzeug hash method, such as 'scrypt:32768:8:1'.
+        :param workers:int: Number of worker processes, 0 to hash on the calling thread.
+        :param max_pending:int: Maximum number of queued or running operations, 0 for no limit.
+        :param executor:Executor|None: Executor to use instead of a new process pool.
+        """
+        self.method = method
+        self.max_pending = max_pending
+        self._executor = executor
+
+        if self._executor is None and workers > 0:
+            self._executor = ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context('spawn'))
+
+        self._slots = threading.BoundedSemaphore(max_pending) if max_pending > 0 else None
+
+    @classmethod
+    def from_config(cls, config) -> 'PasswordHasher':
+        """
+        Creates a password hasher from the application configuration.
+
+        :param config:Config: The Flask configuration.
+        :return: PasswordHasher: The password hasher.
+        """
+        return cls(config.get('PASSWORD_HASH_METHOD', 'scrypt'),
+                   config.get('PASSWORD_POOL_WORKERS', 0),
+                   config.get('PASSWORD_POOL_MAX_PENDING', 32))
+
+    def _run(self, function, *args):
+        with timed('password'):
+            return self._submit(function, *args)
+
+    def _submit(self, function, *args):
+        if self._executor is None:
+            return function(*args)
+
+        if self._slots is None:
+            return self._executor.submit(function, *args).result()
+
+        if not self._slots.acquire(blocking=False):
+            raise PasswordPoolSaturated("Too many password operations in progress")
+
+        try:
+            future = self._executor.submit(function, *args)
+        except BaseException:
+            self._slots.release()
+            raise
+
+        future.add_done_callback(lambda _: self._slots.release())
+
+        return future.result()
+
+    def hash(self, password: str) -> str:
+        """
+        Hashes a password.
+
+        :param password:str: The plain text password.
+        :return: str: The password hash.
+        :raises PasswordPoolSaturated: If the pool queue is full.
+        """
+        return self._run(generate_password_hash, password, self.method)
+
+    def check(self, pwhash: str, password: str) -> bool:
+        """
+        Checks a password against a hash.
+
+        :param pwhash:str: The stored password hash.
+        :param password:str: The plain text password.
+        :return: bool: True if the password matches.
+        :raises PasswordPoolSaturated: If the pool queue is full.
+        """
+        return self._run(check_password_hash, pwhash, password)
+
+    def shutdown(self) -> None:
+        """
+        Shuts the worker pool down.
+        """
+        if self._executor is not None:
+            self._executor.shutdown()
+
+
+def get_password_hasher() -> PasswordHasher:
+    """
+    Returns the password hasher of the current application, creating it on first use.
+
+    :return: PasswordHasher: The password hasher.
+    """
+    hasher = current_app.extensions.get('password_hasher')
+
+    if hasher is None:
+        hasher = current_app.extensions.setdefault('password_hasher', PasswordHasher.from_config(current_app.config))
+
+    return hasher
+
+
+def hash_password(password: str) -> str:
+    """
+    Hashes a password with the configured method.
+
+    :param password:str: The plain text password.
+    :return: str: The password hash.
+    :raises PasswordPoolSaturated: If the pool queue is full.
+    """
+    return get_password_hasher().hash(password)
+
+
+def check_password(pwhash: str, password: str) -> bool:
+    """
+    Checks a password against a hash.
+
+    :param pwhash:str: The stored password hash.
+    :param password:str: The plain text password.
+    :return: bool: True if the password matches.
+    :raises PasswordPoolSaturated: If the pool queue is full.
+    """
+    return get_password_hasher().check(pwhash, password)
@@ -0,0 +1,251 @@
+"""
+Group commit of concurrent task creations.
+
+With group commit on, create_task hands its payload to a background thread instead of running its
+own INSERT and COMMIT. The thread collects the payloads submitted within a short window, inserts
+them with one executemany INSERT per user and commits them in a single transaction, so a burst of
+creations pays for one commit (one fsync on SQLite) instead of one each. Every caller still waits
+for, and gets, its own result.
+
+A caller that times out withdraws its item if the thread has not picked it up yet, so the item is
+never written and the caller can safely retry; once picked up, the item's commit is under way and
+the caller waits for its outcome, up to the timeout once more, after which the item may or may not
+be written.
+
+Classes:
+    - GroupCommitTimeout: Raised when a caller timed out waiting for its item.
+    - GroupCommitter: Collects concurrent writes and commits them together.
+"""
+import logging
+import os
+import queue
+import threading
+import time
+from concurrent.futures import Future, TimeoutError
+
+from app.extensions import db
+from app.services.tasks_service import create_tasks
+
+logger = logging.getLogger(__name__)
+
+class GroupCommitTimeout(Exception):
+    """
+    Raised when a caller waited longer than the timeout for its item.
+
+    Attributes:
+        - withdrawn (bool): If True, the item was withdrawn before being written and is safe to retry.
+          Otherwise its write was under way and may still have been committed.
+    """
+
+    def __init__(self, message: str, withdrawn: bool = True):
+        super().__init__(message)
+        self.withdrawn = withdrawn
+
+
+class GroupCommitter:
+    """
+    Collects concurrent writes and commits them together.
+
+    A batch is flushed when it reaches max_items or when window seconds passed since its first
+    item. If the batch transaction fails, its items are retried one transaction each, so a single
+    failing item only fails its own caller.
+
+    Attributes:
+        - enabled (bool): If False, callers write and commit by themselves.
+        - window (float): Maximum time the first item of a batch waits for others, in seconds.
+        - max_items (int): Maximum number of items per batch.
+        - timeout (float): Maximum time a caller waits for its item to be picked up, then written, in seconds.
+        - batches (int): Number of batches committed.
+        - items (int): Number of items committed.
+    """
+
+    def __init__(self, write=create_tasks):
+        """
+        :param write:Callable: Writes the items of one user, returning one result per item.
+        """
+        self.enabled = False
+        self.window = 0.002
+        self.max_items = 64
+        self.timeout = 30.0
+        self.batches = 0
+        self.items = 0
+        self._write = write
+        self._app = None
+        self._queue: queue.Queue = queue.Queue()
+        self._thread = None
+        self._pid = None
+        self._lock = threading.Lock()
+
+    def init_app(self, app) -> None:
+        """
+        Configures the committer from the application configuration.
+
+        :param app:Flask: The Flask application instance.
+        """
+        self.enabled = app.config.get('TASKS_GROUP_COMMIT', False)
+        self.window = app.config.get('TASKS_GROUP_COMMIT_WINDOW', 0.002)
+        self.max_items = app.config.get('TASKS_GROUP_COMMIT_MAX_ITEMS', 64)
+        self.timeout = app.config.get('TASKS_GROUP_COMMIT_TIMEOUT', 30.0)
+        self._app = app
+        app.extensions['group_commit'] = self
+
+    def _ensure_started(self) -> None:
+        """
+        Starts the batching thread, once per process so that forked workers get their own, and again
+        if it exited.
+        """
+        if self._thread is not None and self._pid == os.getpid() and self._thread.is_alive():
+            return
+
+        with self._lock:
+            if self._thread is None or self._pid != os.getpid() or not self._thread.is_alive():
+                self._queue = queue.Queue()
+                self._pid = os.getpid()
+                self._thread = threading.Thread(target=self._run, name='group-commit', daemon=True)
+                self._thread.start()
+
+    def submit(self, user_id, item):
+        """
+        Submits an item and waits until the batch holding it is committed.
+
+        If the item is still queued after timeout seconds, it is withdrawn and never written. If it
+        is already being written, the caller waits up to timeout seconds more for the outcome of
+        that write.
+
+        :param user_id:uuid.UUID: The ID of the authenticated user.
+        :param item:dict: The validated payload.
+        :return: dict: The result of the item, as returned by the write function.
+        :raises GroupCommitTimeout: If the item was withdrawn after the timeout, or its write did not
+            finish within the timeout more.
+        :raises Exception: The error of the item's transaction, if it failed.
+        """
+        self._ensure_started()
+
+        future = Future()
+        self._queue.put((user_id, item, future))
+
+        try:
+            return future.result(timeout=self.timeout)
+        except TimeoutError:
+            if future.cancel():
+                raise GroupCommitTimeout(f"Not written within {self.timeout} seconds") from None
+
+        try:
+            return future.result(timeout=self.timeout)
+        except TimeoutError:
+            raise GroupCommitTimeout(f"Write not finished within {2 * self.timeout} seconds",
+                                     withdrawn=False) from None
+
+    def _collect(self) -> list | None:
+        """
+        Waits for a first item, then collects the items arriving within the window.
+        """
+        first = self._queue.get()
+
+        if first is None:
+            return None
+
+        batch = [first]
+        deadline = time.monotonic() + self.window
+
+        while len(batch) < self.max_items:
+            remaining = deadline - time.monotonic()
+
+            try:
+                entry = self._queue.get(timeout=remaining) if remaining > 0 else self._queue.get_nowait()
+            except queue.Empty:
+                break
+
+            if entry is None:
+                self._queue.put(None)
+                break
+
+            batch.append(entry)
+
+        return batch
+
+    def _run(self) -> None:
+        while True:
+            batch = self._collect()
+
+            if batch is None:
+                return
+
+            batch = [entry for entry in batch if entry[2].set_running_or_notify_cancel()]
+
+            if not batch:
+                continue
+
+            try:
+                with self._app.app_context():
+                    try:
+                        self._commit_or_retry(batch)
+                    finally:
+                        db.session.remove()
+            except Exception as e:
+                # The session could not be rolled back or removed: fail the items left without a
+                # result rather than end the thread, which would leave every later caller waiting.
+                logger.exception('Group commit of %d items failed', len(batch))
+
+                for _, _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+
+    def _commit_or_retry(self, batch: list) -> None:
+        """
+        Commits a batch, retrying its items one transaction each if it fails.
+        """
+        try:
+            self._commit(batch)
+        except Exception:
+            db.session.rollback()
+
+            for entry in batch:
+                self._commit([entry])
+
+    def _commit(self, batch: list) -> None:
+        """
+        Writes a batch in one transaction and hands every caller its result.
+
+        A batch of one item reports its failure to its caller; a larger one raises it, to be retried
+        item by item.
+        """
+        by_user = {}
+
+        for entry in batch:
+            by_user.setdefault(entry[0], []).append(entry)
+
+        try:
+            results = []
+
+            for user_id, entries in by_user.items():
+                results.extend(zip(entries, self._write(user_id, [item for _, item, _ in entries])))
+
+            db.session.commit()
+        except Exception as e:
+            if len(batch) > 1:
+                raise
+
+            db.session.rollback()
+            batch[0][2].set_exception(e)
+            return
+
+        self.batches += 1
+        self.items += len(batch)
+
+        for (_, _, future), result in results:
+            future.set_result(result)
+
+    def shutdown(self) -> None:
+        """
+        Stops the batching thread once the items already submitted are committed.
+        """
+        with self._lock:
+            thread, self._thread = self._thread, None
+
+        if thread is not None and self._pid == os.getpid():
+            self._queue.put(None)
+            thread.join()
+
+
+task_group_commit = GroupCommitter()
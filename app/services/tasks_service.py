@@ -0,0 +1,683 @@
+"""
+Set-based and single-statement task operations shared by the task routes.
+
+Each function runs as few statements as possible and leaves the commit to the caller, so a batch
+is a single transaction.
+
+Every write takes the next numbers of the user's change sequence (User.task_change_seq) and stamps
+them on the rows it touches, deletions on a tombstone, which is what GET /tasks/changes syncs from.
+
+Functions:
+    - reserve_change_seqs(user_id, count): Reserves the next change sequence numbers of a user.
+    - current_change_seq(user_id): Returns the last change sequence number of a user.
+    - create_tasks(user_id, items): Inserts many tasks with one executemany INSERT.
+    - update_tasks(user_id, items): Updates many tasks with one UPDATE ... WHERE id IN ... RETURNING.
+    - delete_tasks(user_id, ids): Deletes many tasks with one DELETE ... WHERE id IN ... RETURNING.
+    - update_task_by_id(user_id, task_id, changes): Updates one task with a single UPDATE ... RETURNING.
+    - delete_task_by_id(user_id, task_id): Deletes one task with a single DELETE ... RETURNING.
+    - task_row_as_dict(row, json_fields): Converts a task row tuple to the JSON shape of Task.as_dict().
+    - task_rows_as_dicts(rows, json_fields): Converts task row tuples to the JSON shape of Task.as_dict().
+    - task_json_fields(fields): Returns the JSON conversions of a subset of the task fields.
+    - list_tasks(user_id, limit, after, ...): Returns a filtered and sorted keyset page of tasks without ORM hydration.
+    - get_task(user_id, task_id): Returns one task without ORM hydration.
+    - stream_tasks(user_id, batch_size): Yields all tasks of a user in batches from a server-side cursor.
+    - import_tasks(user_id, records, chunk_size): Inserts a stream of task records in chunked transactions.
+    - tasks_validators(user_id): Returns the change sequence number and last change date of a user's tasks.
+    - task_updated_at(user_id, task_id): Returns the last update date of one task.
+    - task_changes(user_id, since, limit): Returns the task changes and deletions after a change sequence number.
+    - search_tasks(user_id, text, limit, offset): Returns a page of tasks matching a full-text search, best first.
+    - task_summary(user_id, created_after, created_before): Returns the task counts and daily histogram of a user.
+"""
+import uuid
+from collections.abc import Iterable, Iterator
+from datetime import datetime
+
+from sqlalchemy import (DateTime, Uuid, case, column, delete, func, insert, literal_column, or_, select, table, tuple_,
+                        update)
+
+from app.extensions import db
+from app.models import Task, TaskTombstone, User
+from app.models.task_search import SEARCH_LANGUAGE, SEARCH_TABLE, SEARCH_VECTOR_COLUMN
+from app.utils.validations import parse_uuid, validate_task
+
+TASK_COLUMNS = tuple(Task.__table__.c)
+TASK_FIELDS = tuple(column.key for column in TASK_COLUMNS)
+
+
+def _json_converter(column):
+    """
+    Returns the function that turns a value of the column into its JSON string form, if any.
+    """
+    if isinstance(column.type, Uuid):
+        return str
+
+    if isinstance(column.type, DateTime):
+        return datetime.isoformat
+
+    return None
+
+
+TASK_JSON_FIELDS = tuple((column.key, _json_converter(column)) for column in TASK_COLUMNS)
+TASK_SORTS = {
+    'created_at': (Task.created_at, False),
+    '-created_at': (Task.created_at, True),
+    'title': (Task.title, False),
+    '-title': (Task.title, True),
+}
+
+
+def _owned_task_ids(user_id: uuid.UUID, task_ids) -> set[uuid.UUID]:
+    """
+    Returns which of the given task IDs belong to the user.
+    """
+    if not task_ids:
+        return set()
+
+    return set(db.session.scalars(select(Task.id).where(Task.user_id == user_id, Task.id.in_(task_ids))))
+
+
+def reserve_change_seqs(user_id: uuid.UUID, count: int = 1) -> int:
+    """
+    Reserves the next count numbers of the user's change sequence.
+
+    The counter is bumped with a single UPDATE ... RETURNING, which also locks the user row until the
+    transaction ends, so concurrent writers of the same user get disjoint, ordered ranges. Numbers of
+    a rolled back transaction are given back with it.
+
+    :param user_id:uuid.UUID: The ID of the authenticated user.
+    :param count:int: The number of sequence numbers to reserve.
+    :return: int: The first reserved number, the others follow it.
+    """
+    statement = (update(User)
+                 .where(User.id == user_id)
+                 .values(task_change_seq=User.task_change_seq + count, task_changed_at=datetime.now())
+                 .execution_options(synchronize_session=False))
+
+    if _supports_returning('update'):
+        last = db.session.execute(statement.returning(User.task_change_seq)).scalar_one()
+    else:
+        db.session.execute(statement)
+        last = db.session.scalar(select(User.task_change_seq).where(User.id == user_id))
+
+    return last - count + 1
+
+
+def current_change_seq(user_id: uuid.UUID) -> int:
+    """
+    Returns the last change sequence number of the user, read by primary key.
+
+    :param user_id:uuid.UUID: The ID of the authenticated user.
+    :return: int: The last change sequence number, 0 if the user never wrote a task.
+    """
+    return db.session.scalar(select(User.task_change_seq).where(User.id == user_id)) or 0
+
+
+def create_tasks(user_id: uuid.UUID, items: list) -> list[dict]:
+    """
+    Creates the valid tasks of a batch with a single executemany INSERT.
+
+    :param user_id:uuid.UUID: The ID of the authenticated user.
+    :param items:list: The task payloads.
+    :return: list[dict]: One result per item, with its status and the created task or an error message.
+    """
+    results = []
+    rows = []
+
+    for item in items:
+        error = validate_task(item)
+
+        if error:
+            results.append({"status": 400, "message": error})
+            continue
+
+        now = datetime.now()
+        row = {
+            'id': uuid.uuid4(),
+            'title': item['title'],
+            'description': item['description'],
+            'completed': False,
+            'created_at': now,
+            'updated_at': now,
+            'user_id': user_id,
+        }
+        rows.append(row)
+        results.append({"status": 201, "task": row})
+
+    if rows:
+        first_seq = reserve_change_seqs(user_id, len(rows))
+
+        for offset, row in enumerate(rows):
+            row['change_seq'] = first_seq + offset
+
+        db.session.execute(insert(Task), rows)
+
+    return results
+
+
+def update_tasks(user_id: uuid.UUID, items: list) -> list[dict]:
+    """
+    Updates the tasks of a batch with a single UPDATE ... WHERE id IN ... RETURNING statement.
+
+    Every changed column is set through a CASE on the task ID, which keeps the column's value for
+    the tasks that do not change it, and so is each task's own change sequence number. The tasks
+    that are not the user's are the ones the statement does not return; the sequence numbers
+    reserved for them are skipped.
+
+    :param user_id:uuid.UUID: The ID of the authenticated user.
+    :param items:list: The task payloads, each with the ID of the task to update.
+    :return: list[dict]: One result per item, with its status and the updated task or an error message.
+    """
+    results: list[dict | None] = [None] * len(items)
+    pending = {}
+
+    for index, item in enumerate(items):
+        task_id = parse_uuid(item.get('id')) if isinstance(item, dict) else None
+
+        if task_id is None:
+            results[index] = {"status": 400, "message": "A valid task ID is required"}
+            continue
+
+        changes = {key: value for key, value in item.items() if key in ('title', 'description', 'completed')}
+        error = validate_task(changes, partial=True)
+
+        if error or task_id in pending:
+            results[index] = {"status": 400, "message": error or "Task ID is repeated in the batch"}
+            continue
+
+        pending[task_id] = (index, changes)
+
+    changed = [task_id for task_id, (_, changes) in pending.items() if changes]
+    unchanged = [task_id for task_id, (_, changes) in pending.items() if not changes]
+    rows = []
+
+    if changed:
+        first_seq = reserve_change_seqs(user_id, len(changed))
+        values = {'change_seq': case({task_id: first_seq + offset for offset, task_id in enumerate(changed)},
+                                     value=Task.id)}
+
+        for key in ('title', 'description', 'completed'):
+            new_values = {task_id: pending[task_id][1][key] for task_id in changed if key in pending[task_id][1]}
+
+            if new_values:
+                values[key] = case(new_values, value=Task.id, else_=getattr(Task, key))
+
+        statement = (update(Task)
+                     .where(Task.user_id == user_id, Task.id.in_(changed))
+                     .values(values)
+                     .execution_options(synchronize_session=False))
+
+        if _supports_returning('update'):
+            rows.extend(db.session.execute(statement.returning(*TASK_COLUMNS)))
+        else:
+            db.session.execute(statement)
+            unchanged.extend(changed)
+
+    if unchanged:
+        rows.extend(db.session.execute(select(*TASK_COLUMNS).where(Task.user_id == user_id,
+                                                                   Task.id.in_(unchanged))))
+
+    for row in rows:
+        results[pending[row.id][0]] = {"status": 200, "task": task_row_as_dict(row)}
+
+    for index, result in enumerate(results):
+        if result is None:
+            results[index] = {"status": 404, "message": "Task not found"}
+
+    return results
+
+
+def delete_tasks(user_id: uuid.UUID, ids: list) -> list[dict]:
+    """
+    Deletes the tasks of a batch with a single DELETE ... WHERE id IN ... RETURNING, and records
+    their tombstones with a single executemany INSERT.
+
+    The deleted tasks are the ones the statement returns, so a task that a concurrent request
+    deleted first is reported as not found rather than deleted twice.
+
+    :param user_id:uuid.UUID: The ID of the authenticated user.
+    :param ids:list: The IDs of the tasks to delete.
+    :return: list[dict]: One result per ID, with its status, message and the change sequence number
+        of the deletion.
+    """
+    task_ids = [parse_uuid(task_id) for task_id in ids]
+    candidates = {task_id for task_id in task_ids if task_id}
+    statement = (delete(Task)
+                 .where(Task.user_id == user_id, Task.id.in_(candidates))
+                 .execution_options(synchronize_session=False))
+
+    if not candidates:
+        owned = set()
+    elif _supports_returning('delete'):
+        owned = set(db.session.scalars(statement.returning(Task.id)))
+    else:
+        owned = _owned_task_ids(user_id, candidates)
+
+        if owned:
+            db.session.execute(statement)
+
+    seqs = _record_tombstones(user_id, owned) if owned else {}
+
+    results = []
+
+    for task_id in task_ids:
+        if task_id is None:
+            results.append({"status": 400, "message": "A valid task ID is required"})
+        elif task_id in owned:
+            owned.discard(task_id)
+            results.append({"status": 200, "id": task_id, "change_seq": seqs[task_id],
+                            "message": "Task deleted successfully"})
+        else:
+            results.append({"status": 404, "id": task_id, "message": "Task not found"})
+
+    return results
+
+
+def _record_tombstones(user_id: uuid.UUID, task_ids) -> dict[uuid.UUID, int]:
+    """
+    Records the deletion of the given tasks, each with its own change sequence number.
+
+    :return: dict[uuid.UUID, int]: The change sequence number of the deletion of each task.
+    """
+    first_seq = reserve_change_seqs(user_id, len(task_ids))
+    seqs = {task_id: first_seq + offset for offset, task_id in enumerate(task_ids)}
+    now = datetime.now()
+
+    db.session.execute(insert(TaskTombstone), [
+        {'task_id': task_id, 'user_id': user_id, 'change_seq': seq, 'deleted_at': now}
+        for task_id, seq in seqs.items()
+    ])
+
+    return seqs
+
+
+def _supports_returning(kind: str) -> bool:
+    """
+    Returns whether the bound database supports RETURNING for the given statement kind.
+
+    SQLAlchemy disables it for SQLite older than 3.35, which then uses the fallback paths.
+    """
+    return getattr(db.session.get_bind(mapper=Task).dialect, f'{kind}_returning', False)
+
+
+def update_task_by_id(user_id: uuid.UUID, task_id: uuid.UUID, changes: dict) -> dict | None:
+    """
+    Updates a task of the user with a single UPDATE ... WHERE id AND user_id RETURNING statement.
+
+    No ORM object is loaded, so the row goes straight from the statement to the task dictionary.
+
+    :param user_id:uuid.UUID: The ID of the authenticated user.
+    :param task_id:uuid.UUID: The ID of the task to update.
+    :param changes:dict: The validated fields to change.
+    :return: dict|None: The updated task, or None if the user has no task with the given ID.
+    """
+    columns = TASK_COLUMNS
+    condition = (Task.id == task_id) & (Task.user_id == user_id)
+
+    if changes:
+        changes = {**changes, 'change_seq': reserve_change_seqs(user_id)}
+
+    if changes and _supports_returning('update'):
+        statement = (update(Task).where(condition).values(changes).returning(*columns)
+                     .execution_options(synchronize_session=False))
+        row = db.session.execute(statement).first()
+        return task_row_as_dict(row) if row else None
+
+    if changes:
+        db.session.execute(update(Task).where(condition).values(changes)
+                           .execution_options(synchronize_session=False))
+
+    row = db.session.execute(select(*columns).where(condition)).first()
+
+    return task_row_as_dict(row) if row else None
+
+
+def delete_task_by_id(user_id: uuid.UUID, task_id: uuid.UUID) -> int | None:
+    """
+    Deletes a task of the user with a single DELETE ... WHERE id AND user_id statement, and records
+    its tombstone.
+
+    :param user_id:uuid.UUID: The ID of the authenticated user.
+    :param task_id:uuid.UUID: The ID of the task to delete.
+    :return: int|None: The change sequence number of the deletion, or None if the user has no task
+        with the given ID.
+    """
+    statement = (delete(Task).where(Task.id == task_id, Task.user_id == user_id)
+                 .execution_options(synchronize_session=False))
+
+    if _supports_returning('delete'):
+        deleted = db.session.execute(statement.returning(Task.id)).first() is not None
+    else:
+        deleted = db.session.execute(statement).rowcount > 0
+
+    if not deleted:
+        return None
+
+    return _record_tombstones(user_id, [task_id])[task_id]
+
+
+def task_row_as_dict(row, json_fields=TASK_JSON_FIELDS) -> dict:
+    """
+    Converts a task row tuple, selected with TASK_COLUMNS, to the JSON shape of Task.as_dict().
+
+    UUIDs and dates are converted to their string forms here, so serializing the dictionary never
+    falls back to the JSON provider's default hook.
+
+    :param row:Row: The row to convert.
+    :param json_fields:tuple: The fields of the row and their conversions, for rows of other columns.
+    :return: dict: The task as a dictionary of JSON native values.
+    """
+    return {field: value if convert is None or value is None else convert(value)
+            for (field, convert), value in zip(json_fields, row)}
+
+
+def task_rows_as_dicts(rows, json_fields=TASK_JSON_FIELDS) -> list[dict]:
+    """
+    Converts task row tuples, selected with TASK_COLUMNS, to the JSON shape of Task.as_dict().
+
+    :param rows:Iterable: The rows to convert.
+    :param json_fields:tuple: The fields of the rows and their conversions, for rows of other columns.
+    :return: list[dict]: The tasks as dictionaries of JSON native values.
+    """
+    return [task_row_as_dict(row, json_fields) for row in rows]
+
+
+def task_json_fields(fields) -> tuple:
+    """
+    Returns the JSON conversions of a subset of the task fields, for task_row_as_dict.
+
+    :param fields:Iterable[str]: The fields, in the order of the selected columns.
+    :return: tuple: The (field, conversion) pairs.
+    """
+    conversions = dict(TASK_JSON_FIELDS)
+
+    return tuple((field, conversions[field]) for field in fields)
+
+
+def list_tasks(user_id: uuid.UUID, limit: int, after: tuple | None = None, *, sort: str = 'created_at',
+               fields: tuple[str, ...] | None = None, completed: bool | None = None,
+               created_after: datetime | None = None, created_before: datetime | None = None) -> list[dict]:
+    """
+    Returns a keyset page of the user's tasks, filtered and ordered in SQL.
+
+    Rows are selected as plain tuples of the requested columns only, so no ORM object is built per
+    task and unrequested columns, such as the description, are neither loaded nor serialized. Every
+    sort order has a (user_id, key, id) index, scanned backwards for descending orders.
+
+    :param user_id:uuid.UUID: The ID of the authenticated user.
+    :param limit:int: The maximum number of tasks to return.
+    :param after:tuple|None: The (sort key, id) position of the last task of the previous page.
+    :param sort:str: A key of TASK_SORTS, such as 'created_at' or '-title' for descending titles.
+    :param fields:tuple|None: The fields to return, all of them if None.
+    :param completed:bool|None: If set, only tasks with this completion state are returned.
+    :param created_after:datetime|None: If set, only tasks created after this date are returned.
+    :param created_before:datetime|None: If set, only tasks created before this date are returned.
+    :return: list[dict]: The tasks as dictionaries.
+    """
+    key, descending = TASK_SORTS[sort]
+
+    if fields is None:
+        columns, json_fields = TASK_COLUMNS, TASK_JSON_FIELDS
+    else:
+        columns, json_fields = [Task.__table__.c[field] for field in fields], task_json_fields(fields)
+
+    statement = select(*columns).where(Task.user_id == user_id)
+
+    if completed is not None:
+        statement = statement.where(Task.completed == completed)
+
+    if created_after is not None:
+        statement = statement.where(Task.created_at > created_after)
+
+    if created_before is not None:
+        statement = statement.where(Task.created_at < created_before)
+
+    if after:
+        position = tuple_(key, Task.id)
+        statement = statement.where(position < after if descending else position > after)
+
+    order = (key.desc(), Task.id.desc()) if descending else (key, Task.id)
+    statement = statement.order_by(*order).limit(limit)
+
+    return task_rows_as_dicts(db.session.execute(statement), json_fields)
+
+
+def get_task(user_id: uuid.UUID, task_id: uuid.UUID) -> dict | None:
+    """
+    Returns one of the user's tasks without ORM hydration.
+
+    :param user_id:uuid.UUID: The ID of the authenticated user.
+    :param task_id:uuid.UUID: The ID of the task.
+    :return: dict|None: The task, or None if the user has no task with the given ID.
+    """
+    row = db.session.execute(select(*TASK_COLUMNS).where(Task.id == task_id, Task.user_id == user_id)).first()
+
+    return task_row_as_dict(row) if row else None
+
+
+def stream_tasks(user_id: uuid.UUID, batch_size: int = 1000) -> Iterator[list[dict]]:
+    """
+    Yields all tasks of the user in batches, ordered by (created_at, id).
+
+    The rows are fetched with yield_per, which streams them from a server-side cursor, so memory
+    stays bounded by the batch size whatever the number of tasks.
+
+    :param user_id:uuid.UUID: The ID of the authenticated user.
+    :param batch_size:int: The number of rows fetched and yielded at a time.
+    :return: Iterator[list[dict]]: Batches of tasks as dictionaries.
+    """
+    statement = (select(*TASK_COLUMNS)
+                 .where(Task.user_id == user_id)
+                 .order_by(Task.created_at, Task.id)
+                 .execution_options(yield_per=batch_size))
+
+    for partition in db.session.execute(statement).partitions():
+        yield task_rows_as_dicts(partition)
+
+
+def import_tasks(user_id: uuid.UUID, records: Iterable[tuple[int, dict | str]], chunk_size: int = 1000,
+                 max_errors: int = 100) -> dict:
+    """
+    Inserts a stream of task records, committing every chunk_size records.
+
+    Unlike the other functions of this module it commits by itself, so an import of any size holds
+    at most one chunk in memory and in the open transaction.
+
+    :param user_id:uuid.UUID: The ID of the authenticated user.
+    :param records:Iterable: (line number, task payload or parse error message) pairs.
+    :param chunk_size:int: The number of records inserted per transaction.
+    :param max_errors:int: The maximum number of errors reported back.
+    :return: dict: The accepted and rejected counts and the first errors.
+    """
+    summary = {"accepted": 0, "rejected": 0, "errors": []}
+
+    def reject(line: int, message: str) -> None:
+        summary['rejected'] += 1
+
+        if len(summary['errors']) < max_errors:
+            summary['errors'].append({"line": line, "message": message})
+
+    def flush(chunk: list[tuple[int, dict]]) -> None:
+        results = create_tasks(user_id, [item for _, item in chunk])
+        db.session.commit()
+
+        for (line, _), result in zip(chunk, results):
+            if result['status'] == 201:
+                summary['accepted'] += 1
+            else:
+                reject(line, result['message'])
+
+    chunk = []
+
+    for line, record in records:
+        if isinstance(record, str):
+            reject(line, record)
+            continue
+
+        chunk.append((line, record))
+
+        if len(chunk) >= chunk_size:
+            flush(chunk)
+            chunk = []
+
+    if chunk:
+        flush(chunk)
+
+    return summary
+
+
+def tasks_validators(user_id: uuid.UUID) -> tuple[int, datetime | None]:
+    """
+    Returns the last number of the user's change sequence and the date of that change.
+
+    Every write to the user's tasks, deletions included, bumps both on the user row, so they
+    version the whole task list with a single primary key lookup, however many tasks there are.
+
+    :param user_id:uuid.UUID: The ID of the authenticated user.
+    :return: tuple[int, datetime|None]: The change sequence number and the date of the last change.
+    """
+    row = db.session.execute(
+        select(User.task_change_seq, User.task_changed_at).where(User.id == user_id)
+    ).one_or_none()
+
+    return tuple(row) if row is not None else (0, None)
+
+
+def task_updated_at(user_id: uuid.UUID, task_id: uuid.UUID) -> datetime | None:
+    """
+    Returns the last update date of one of the user's tasks.
+
+    :param user_id:uuid.UUID: The ID of the authenticated user.
+    :param task_id:uuid.UUID: The ID of the task.
+    :return: datetime|None: The last update date, or None if the user has no task with the given ID.
+    """
+    return db.session.scalar(select(Task.updated_at).where(Task.id == task_id, Task.user_id == user_id))
+
+
+def task_changes(user_id: uuid.UUID, since: int, limit: int) -> tuple[list[dict], list[str], int, bool]:
+    """
+    Returns the changes of the user's tasks after a change sequence number, oldest first.
+
+    Live tasks and tombstones are both read from their (user_id, change_seq) index and merged on the
+    sequence number, so a page never skips a change whatever the mix of writes and deletions. Change
+    sequence numbers are unique per user, so the last one of a page is an exact resume point.
+
+    :param user_id:uuid.UUID: The ID of the authenticated user.
+    :param since:int: The change sequence number the client is synced up to, 0 for a full sync.
+    :param limit:int: The maximum number of changes to return.
+    :return: tuple: The changed tasks, the IDs of the deleted tasks, the sequence number to resume
+        from and whether more changes follow.
+    """
+    tasks = db.session.execute(
+        select(*TASK_COLUMNS)
+        .where(Task.user_id == user_id, Task.change_seq > since)
+        .order_by(Task.change_seq)
+        .limit(limit + 1)
+    ).all()
+    # A full sync holds none of the deleted tasks, so it skips the tombstones altogether.
+    tombstones = db.session.execute(
+        select(TaskTombstone.change_seq, TaskTombstone.task_id)
+        .where(TaskTombstone.user_id == user_id, TaskTombstone.change_seq > since)
+        .order_by(TaskTombstone.change_seq)
+        .limit(limit + 1)
+    ).all() if since else []
+
+    merged = sorted([(row.change_seq, row, True) for row in tasks] +
+                    [(row.change_seq, row, False) for row in tombstones],
+                    key=lambda change: change[0])
+    page = merged[:limit]
+
+    changed = [task_row_as_dict(row) for _, row, live in page if live]
+    deleted = [str(row.task_id) for _, row, live in page if not live]
+    cursor = page[-1][0] if page else since
+
+    return changed, deleted, cursor, len(merged) > limit
+
+
+def _fts_query(user_id: uuid.UUID, text: str) -> str:
+    """
+    Turns search text into an FTS5 query matching every word in the titles and descriptions of the
+    user's tasks, quoting each one so that operators and punctuation typed by the user are never
+    parsed as FTS5 syntax.
+    """
+    words = ' '.join('"{}"'.format(word.replace('"', '""')) for word in text.split())
+
+    return f'user_id : "{user_id.hex}" AND {{title description}} : ({words})'
+
+
+def search_tasks(user_id: uuid.UUID, text: str, limit: int, offset: int = 0) -> list[dict]:
+    """
+    Returns a page of the user's tasks matching every word of the search text, best match first.
+
+    On SQLite the words and the user's ID are looked up together in the FTS5 index, so only the
+    user's matches are joined and ranked with bm25, a title match weighing ten times a description
+    match. On PostgreSQL the text is parsed with websearch_to_tsquery, matched against the tsvector
+    column through the (user_id, search_vector) GIN index and ranked with ts_rank_cd. Other
+    databases fall back to an unranked substring search.
+
+    :param user_id:uuid.UUID: The ID of the authenticated user.
+    :param text:str: The search text.
+    :param limit:int: The maximum number of tasks to return.
+    :param offset:int: The number of best matches to skip.
+    :return: list[dict]: The tasks as dictionaries.
+    """
+    dialect = db.session.get_bind(mapper=Task).dialect.name
+
+    if dialect == 'sqlite':
+        fts = table(SEARCH_TABLE, column('rowid'))
+        statement = (select(*TASK_COLUMNS)
+                     .select_from(fts.join(Task, literal_column('tasks.rowid') == fts.c.rowid))
+                     .where(literal_column(SEARCH_TABLE).op('MATCH')(_fts_query(user_id, text)),
+                            Task.user_id == user_id)
+                     .order_by(func.bm25(literal_column(SEARCH_TABLE), 10.0, 1.0, 0.0), Task.id))
+    elif dialect == 'postgresql':
+        query = func.websearch_to_tsquery(SEARCH_LANGUAGE, text)
+        vector = literal_column(f'tasks.{SEARCH_VECTOR_COLUMN}')
+        statement = (select(*TASK_COLUMNS)
+                     .where(Task.user_id == user_id, vector.op('@@')(query))
+                     .order_by(func.ts_rank_cd(vector, query).desc(), Task.id))
+    else:
+        conditions = [or_(func.lower(Task.title).contains(word, autoescape=True),
+                          func.lower(Task.description).contains(word, autoescape=True))
+                      for word in text.lower().split()]
+        statement = select(*TASK_COLUMNS).where(Task.user_id == user_id, *conditions).order_by(Task.created_at, Task.id)
+
+    return task_rows_as_dicts(db.session.execute(statement.limit(limit).offset(offset)))
+
+
+def task_summary(user_id: uuid.UUID, created_after: datetime | None = None,
+                 created_before: datetime | None = None) -> dict:
+    """
+    Returns the number of tasks of the user, completed and pending, and a histogram of their
+    creation days, all counted in SQL.
+
+    A single GROUP BY statement counts the tasks created on each day; the totals are the sums of the
+    days. It walks the (user_id, date(created_at), created_at, completed) index in day order, the
+    date filters narrowing it to a range of days, so it neither reads nor sorts task rows.
+    Days are calendar days of the stored, server local, creation dates.
+
+    :param user_id:uuid.UUID: The ID of the authenticated user.
+    :param created_after:datetime|None: If set, only tasks created after this date are counted.
+    :param created_before:datetime|None: If set, only tasks created before this date are counted.
+    :return: dict: The total, completed and pending counts, and the task count of each day, oldest first.
+    """
+    day = func.date(Task.created_at)
+    statement = (select(day, func.count(), func.sum(case((Task.completed, 1), else_=0)))
+                 .where(Task.user_id == user_id)
+                 .group_by(day)
+                 .order_by(day))
+
+    if created_after is not None:
+        statement = statement.where(day >= func.date(created_after), Task.created_at > created_after)
+
+    if created_before is not None:
+        statement = statement.where(day <= func.date(created_before), Task.created_at < created_before)
+
+    total = completed = 0
+    days = []
+
+    for created_on, count, completed_count in db.session.execute(statement):
+        total += count
+        completed += completed_count
+        days.append({'date': str(created_on), 'count': count})
+
+    return {'total': total, 'completed': completed, 'pending': total - completed, 'days': days}
@@ -0,0 +1,111 @@
+"""
+Parsers for the filter, sort and field selection query parameters of list endpoints.
+
+Functions:
+    - parse_bool(value, name): Parses a boolean query parameter.
+    - parse_datetime(value, name): Parses an ISO 8601 date query parameter.
+    - parse_sort(value, sorts, default): Parses a sort order among the supported ones.
+    - parse_fields(value, allowed): Parses a comma separated list of fields to return.
+
+Exceptions:
+    - InvalidFilterError: A filter, sort or field selection could not be parsed.
+"""
+from datetime import datetime
+
+TRUE_VALUES = ('true', '1', 'yes')
+FALSE_VALUES = ('false', '0', 'no')
+
+
+class InvalidFilterError(ValueError):
+    """
+    Raised when a filter, sort or field selection query parameter is malformed.
+    """
+    pass
+
+
+def parse_bool(value: str | None, name: str) -> bool | None:
+    """
+    Parses a boolean query parameter.
+
+    :param value:str|None: Raw value of the query parameter.
+    :param name:str: Name of the query parameter, for the error message.
+    :return: bool|None: The boolean, or None if the parameter is absent.
+    :raises InvalidFilterError: If the value is not a boolean.
+    """
+    if value is None:
+        return None
+
+    if value.lower() in TRUE_VALUES:
+        return True
+
+    if value.lower() in FALSE_VALUES:
+        return False
+
+    raise InvalidFilterError(f"{name} must be true or false")
+
+
+def parse_datetime(value: str | None, name: str) -> datetime | None:
+    """
+    Parses an ISO 8601 date query parameter into a naive local datetime, like the stored dates.
+
+    :param value:str|None: Raw value of the query parameter.
+    :param name:str: Name of the query parameter, for the error message.
+    :return: datetime|None: The date, or None if the parameter is absent.
+    :raises InvalidFilterError: If the value is not an ISO 8601 date.
+    """
+    if value is None:
+        return None
+
+    try:
+        parsed = datetime.fromisoformat(value)
+    except ValueError:
+        raise InvalidFilterError(f"{name} must be an ISO 8601 date")
+
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone().replace(tzinfo=None)
+
+    return parsed
+
+
+def parse_sort(value: str | None, sorts, default: str) -> str:
+    """
+    Parses a sort order among the supported ones.
+
+    :param value:str|None: Raw value of the sort query parameter.
+    :param sorts:Iterable[str]: The supported sort orders.
+    :param default:str: Sort order used when none is given.
+    :return: str: The sort order.
+    :raises InvalidFilterError: If the sort order is not supported.
+    """
+    if value is None:
+        return default
+
+    if value not in sorts:
+        raise InvalidFilterError(f"sort must be one of {', '.join(sorts)}")
+
+    return value
+
+
+def parse_fields(value: str | None, allowed) -> tuple[str, ...] | None:
+    """
+    Parses a comma separated list of fields to return.
+
+    :param value:str|None: Raw value of the fields query parameter.
+    :param allowed:Iterable[str]: The fields that can be selected.
+    :return: tuple[str, ...]|None: The fields without duplicates, or None for all fields.
+    :raises InvalidFilterError: If the list is empty or has an unknown field.
+    """
+    if value is None:
+        return None
+
+    fields = tuple(dict.fromkeys(field.strip() for field in value.split(',') if field.strip()))
+
+    if not fields:
+        raise InvalidFilterError("fields must not be empty")
+
+    unknown = [field for field in fields if field not in allowed]
+
+    if unknown:
+        raise InvalidFilterError(f"Unknown fields: {', '.join(unknown)}")
+
+    return fields
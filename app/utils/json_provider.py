@@ -0,0 +1,102 @@
+"""
+JSON provider for the Flask application.
+
+Serializes with orjson when it is installed and falls back to the standard library otherwise.
+UUIDs are written as strings and dates as ISO 8601, in both cases.
+
+Classes:
+    - FastJSONProvider: Flask JSON provider backed by orjson or json.
+"""
+import uuid
+from datetime import date
+
+from flask.json.provider import DefaultJSONProvider
+
+from app.extensions.timing import timed
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is an optional dependency
+    orjson = None
+
+
+class FastJSONProvider(DefaultJSONProvider):
+    """
+    JSON provider that uses orjson when available.
+
+    Keys are not sorted, which the default provider does on every response. Payloads built by the
+    task service already hold UUIDs and dates as strings, so the default hook is rarely reached.
+
+    Attributes:
+        - sort_keys (bool): Always False, key order follows the serialized dictionaries.
+        - compact (bool): Always True, responses are not indented even in debug mode.
+        - use_orjson (bool): If True, orjson is used for dumping and loading.
+    """
+    sort_keys = False
+    compact = True
+    use_orjson = orjson is not None
+
+    @staticmethod
+    def default(o):
+        """
+        Serialize the types the JSON libraries do not handle natively.
+
+        :param o:Any: The object to serialize.
+        :return: Any: A JSON serializable value.
+        """
+        if isinstance(o, uuid.UUID):
+            return str(o)
+
+        if isinstance(o, date):
+            return o.isoformat()
+
+        return DefaultJSONProvider.default(o)
+
+    def dumps(self, obj, **kwargs) -> str:
+        """
+        Serialize data as a JSON string.
+
+        Keyword arguments only apply to the standard library, so passing any of them uses it.
+
+        :param obj:Any: The data to serialize.
+        :return: str: The JSON document.
+        """
+        if self.use_orjson and not kwargs:
+            return orjson.dumps(obj, default=self.default, option=orjson.OPT_NON_STR_KEYS).decode()
+
+        return super().dumps(obj, **kwargs)
+
+    def loads(self, s, **kwargs):
+        """
+        Deserialize data from a JSON string or bytes.
+
+        :param s:str|bytes: The JSON document.
+        :return: Any: The deserialized data.
+        """
+        if self.use_orjson and not kwargs:
+            return orjson.loads(s)
+
+        return super().loads(s, **kwargs)
+
+    def response(self, *args, **kwargs):
+        """
+        Serialize the given arguments as a JSON response.
+
+        With orjson, the body is written as bytes without an intermediate string. Indented output
+        (compact set to False) goes through the standard library.
+
+        :return: Response: The JSON response.
+        """
+        indent = (self.compact is None and self._app.debug) or self.compact is False
+
+        if not self.use_orjson or indent:
+            with timed('json'):
+                return super().response(*args, **kwargs)
+
+        obj = self._prepare_response_obj(args, kwargs)
+
+        with timed('json'):
+            body = orjson.dumps(obj, default=self.default,
+                                option=orjson.OPT_NON_STR_KEYS | orjson.OPT_APPEND_NEWLINE)
+
+        return self._app.response_class(body, mimetype=self.mimetype)
@@ -0,0 +1,153 @@
+"""
+Helpers for keyset (cursor) pagination.
+
+Functions:
+    - encode_cursor(key, task_id, sort): Encodes a keyset position into an opaque cursor.
+    - decode_cursor(cursor, sort): Decodes an opaque cursor back into a keyset position.
+    - parse_limit(value, default, maximum): Parses and bounds a page size.
+    - parse_change_cursor(value): Parses a delta sync cursor into a change sequence number.
+    - encode_offset_cursor(offset): Encodes a result offset into an opaque cursor.
+    - decode_offset_cursor(cursor): Decodes an opaque cursor back into a result offset.
+
+Exceptions:
+    - InvalidCursorError: Cursor or page size could not be parsed.
+"""
+import base64
+import binascii
+import json
+import uuid
+from datetime import datetime
+
+
+class InvalidCursorError(ValueError):
+    """
+    Raised when a pagination cursor or page size is malformed.
+    """
+    pass
+
+
+def encode_cursor(key: datetime | str, task_id: uuid.UUID, sort: str = 'created_at') -> str:
+    """
+    Encodes the position of the last returned row into an opaque cursor.
+
+    The cursor records its sort order, unless it is the default one, so that it cannot be replayed
+    with another order.
+
+    :param key:datetime|str: Sort key of the last returned task, its creation date or its title.
+    :param task_id:uuid.UUID: ID of the last returned task.
+    :param sort:str: Sort order of the page, such as 'created_at' or '-title'.
+    :return: str: URL-safe opaque cursor.
+    """
+    position = [key.isoformat() if isinstance(key, datetime) else key, task_id.hex]
+
+    if sort != 'created_at':
+        position.append(sort)
+
+    raw = json.dumps(position, separators=(',', ':'))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip('=')
+
+
+def decode_cursor(cursor: str, sort: str = 'created_at') -> tuple[datetime | str, uuid.UUID]:
+    """
+    Decodes an opaque cursor into the keyset position it represents.
+
+    :param cursor:str: Cursor previously returned by encode_cursor.
+    :param sort:str: Sort order of the requested page.
+    :return: tuple[datetime|str, uuid.UUID]: Sort key and ID of the last returned task; the key is a
+        datetime for the created_at orders and a string otherwise.
+    :raises InvalidCursorError: If the cursor is malformed or was issued for another sort order.
+    """
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        key, task_id, *rest = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        cursor_sort = rest[0] if rest else 'created_at'
+
+        if len(rest) > 1 or not isinstance(key, str):
+            raise ValueError("unexpected position")
+        if cursor_sort != sort:
+            raise ValueError(f"issued for sort {cursor_sort}")
+
+        if sort.lstrip('-') == 'created_at':
+            key = datetime.fromisoformat(key)
+
+        return key, uuid.UUID(hex=task_id)
+    except (binascii.Error, UnicodeDecodeError, TypeError, ValueError) as e:
+        raise InvalidCursorError(f"Invalid cursor: {e}")
+
+
+def parse_limit(value: str | None, default: int, maximum: int) -> int:
+    """
+    Parses the requested page size, falling back to the default and capping it at the maximum.
+
+    :param value:str|None: Raw value of the limit query parameter.
+    :param default:int: Page size used when no limit is given.
+    :param maximum:int: Hard maximum page size.
+    :return: int: The page size to use.
+    :raises InvalidCursorError: If the limit is not a positive integer.
+    """
+    if value is None:
+        return min(default, maximum)
+
+    try:
+        limit = int(value)
+    except ValueError:
+        raise InvalidCursorError("Limit must be an integer")
+
+    if limit < 1:
+        raise InvalidCursorError("Limit must be greater than zero")
+
+    return min(limit, maximum)
+
+
+def parse_change_cursor(value: str | None) -> int:
+    """
+    Parses a delta sync cursor, the change sequence number the client is synced up to.
+
+    :param value:str|None: Raw value of the since query parameter, None for a full sync.
+    :return: int: The change sequence number, 0 for a full sync.
+    :raises InvalidCursorError: If the cursor is not a non-negative integer.
+    """
+    if value is None:
+        return 0
+
+    try:
+        since = int(value)
+    except ValueError:
+        raise InvalidCursorError("Invalid cursor: not an integer")
+
+    if since < 0:
+        raise InvalidCursorError("Invalid cursor: must not be negative")
+
+    return since
+
+
+def encode_offset_cursor(offset: int) -> str:
+    """
+    Encodes the offset of the next result into an opaque cursor, for ranked results that have no
+    stable keyset position.
+
+    :param offset:int: Number of results already returned.
+    :return: str: URL-safe opaque cursor.
+    """
+    raw = json.dumps(['offset', offset], separators=(',', ':'))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip('=')
+
+
+def decode_offset_cursor(cursor: str) -> int:
+    """
+    Decodes an opaque cursor into the offset it represents.
+
+    :param cursor:str: Cursor previously returned by encode_offset_cursor.
+    :return: int: Number of results already returned.
+    :raises InvalidCursorError: If the cursor is malformed.
+    """
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        kind, offset = json.loads(base64.urlsafe_b64decode(padded.encode()))
+
+        if kind != 'offset' or not isinstance(offset, int) or isinstance(offset, bool) or offset < 0:
+            raise ValueError("not an offset cursor")
+
+        return offset
+    except (binascii.Error, UnicodeDecodeError, TypeError, ValueError) as e:
+        raise InvalidCursorError(f"Invalid cursor: {e}")
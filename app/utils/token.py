@@ -1,15 +1,24 @@
 """
 Functions to generate and verify JWT tokens.
 
+Classes:
+    - TokenCache: Bounded LRU cache of verified tokens.
+
 Functions:
     - generate_token(user_id): Generates a JWT token.
     - verify_token(token): Verifies a JWT token.
+    - verify_token_cached(token): Verifies a JWT token once per worker and returns the user UUID.
 
 Exceptions:
     - jwt.ExpiredTokenError: Token expired.
     - jwt.InvalidTokenError: Token invalid.
 """
+import hashlib
 import os
+import threading
+import time
+import uuid
+from collections import OrderedDict
 from datetime import datetime, timedelta
 
 import jwt
@@ -50,6 +59,106 @@ def generate_token(user_id: str) -> str:
         raise Exception(f"An error occurred while generating the token: {e}")
 
 
+class TokenCache:
+    """
+    Bounded LRU cache of verified tokens, keyed on the SHA-256 digest of the token.
+
+    Entries hold the decoded subject and expire at the token expiry, or after the TTL if that
+    comes first, so an expired token is always verified again (and rejected) by jwt.decode.
+
+    Attributes:
+        - maxsize (int): Maximum number of cached tokens.
+        - ttl (float): Maximum time, in seconds, a verified token is trusted without a new check.
+        - hits (int): Number of lookups served from the cache.
+        - misses (int): Number of lookups that required a full verification.
+    """
+
+    def __init__(self, maxsize: int = 10000, ttl: float = 300, clock=time.time):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._clock = clock
+        self._entries: OrderedDict[bytes, tuple[uuid.UUID, float]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(token: str) -> bytes:
+        return hashlib.sha256(token.encode()).digest()
+
+    def get(self, token: str) -> uuid.UUID | None:
+        """
+        Returns the user ID of a cached, unexpired token.
+
+        :param token:str: The JWT token.
+        :return: uuid.UUID|None: The user ID, or None on a miss.
+        """
+        key = self._key(token)
+
+        with self._lock:
+            entry = self._entries.get(key)
+
+            if entry is not None and entry[1] > self._clock():
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[0]
+
+            if entry is not None:
+                del self._entries[key]
+
+            self.misses += 1
+            return None
+
+    def put(self, token: str, user_id: uuid.UUID, exp: float) -> None:
+        """
+        Caches a verified token until its expiry or the TTL, evicting the least recently used one.
+
+        :param token:str: The JWT token.
+        :param user_id:uuid.UUID: The decoded subject.
+        :param exp:float: The expiry timestamp of the token.
+        """
+        if self.maxsize <= 0:
+            return
+
+        key = self._key(token)
+        expires_at = min(exp, self._clock() + self.ttl)
+
+        with self._lock:
+            self._entries[key] = (user_id, expires_at)
+            self._entries.move_to_end(key)
+
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """
+        Removes all entries and resets the counters.
+        """
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> dict:
+        """
+        Returns the cache counters.
+
+        :return: dict: Hits, misses, hit ratio and current size.
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_ratio': self.hits / lookups if lookups else 0.0,
+                'size': len(self._entries),
+                'maxsize': self.maxsize,
+            }
+
+
+token_cache = TokenCache(int(os.getenv('TOKEN_CACHE_SIZE', 10000)), float(os.getenv('TOKEN_CACHE_TTL', 300)))
+
+
 def verify_token(token) -> str:
     """
     Verifies if a JWT token is valid and returns the user ID.
@@ -68,12 +177,49 @@ def verify_token(token) -> str:
     :param token:str: The JWT token.
     :return: user_id (str): The ID of the user.
     """
+    return _decode_token(token)['sub']
+
+
+def _decode_token(token) -> dict:
+    """
+    Decodes and verifies a JWT token.
+
+    :param token:str: The JWT token.
+    :return: dict: The token payload.
+    """
     try:
-        payload = jwt.decode(token, SECRET_KEY, algorithms=["HS256"])
-        return payload['sub']
+        return jwt.decode(token, SECRET_KEY, algorithms=["HS256"])
     except jwt.ExpiredSignatureError:
         raise jwt.ExpiredSignatureError("Token expired. Please log in again.")
     except jwt.InvalidTokenError:
         raise jwt.InvalidTokenError("Invalid token. Please log in again.")
     except Exception as e:
         raise Exception(f"An error occurred while verifying the token: {e}")
+
+
+def verify_token_cached(token) -> uuid.UUID:
+    """
+    Verifies a JWT token and returns the user ID, paying the verification once per token and worker.
+
+    Parameters:
+    token (str): The JWT token.
+
+    Returns:
+    uuid.UUID: The ID of the user.
+
+    Raises:
+    jwt.ExpiredSignatureError: If the token is expired.
+    jwt.InvalidTokenError: If the token is invalid.
+    ValueError: If the token subject is not a UUID.
+
+    :param token:str: The JWT token.
+    :return: user_id (uuid.UUID): The ID of the user.
+    """
+    user_id = token_cache.get(token)
+
+    if user_id is None:
+        payload = _decode_token(token)
+        user_id = uuid.UUID(payload['sub'])
+        token_cache.put(token, user_id, payload['exp'])
+
+    return user_id
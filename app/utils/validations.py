@@ -0,0 +1,50 @@
+"""
+Validation rules for request payloads.
+
+Functions:
+    - validate_task(data, partial): Validates the fields of a task payload.
+    - parse_uuid(value): Parses a UUID from a request value.
+"""
+import uuid
+
+
+def validate_task(data, partial: bool = False) -> str | None:
+    """
+    Validates the fields of a task payload.
+
+    A full payload (task creation) requires a non-empty title and a description. A partial payload
+    (task update) accepts any subset of title, description and completed.
+
+    :param data:Any: The decoded JSON payload of the task.
+    :param partial:bool: If True, all fields are optional and completed is accepted.
+    :return: str|None: An error message, or None if the payload is valid.
+    """
+    if not isinstance(data, dict):
+        return "Task must be a JSON object"
+
+    if not partial and ('title' not in data or 'description' not in data):
+        return "Title and description are required"
+
+    if 'title' in data and (not isinstance(data['title'], str) or not data['title'].strip()):
+        return "Title must be a non-empty string"
+
+    if 'description' in data and not isinstance(data['description'], str):
+        return "Description must be a string"
+
+    if partial and 'completed' in data and not isinstance(data['completed'], bool):
+        return "Completed must be a boolean"
+
+    return None
+
+
+def parse_uuid(value) -> uuid.UUID | None:
+    """
+    Parses a UUID from a request value.
+
+    :param value:Any: The raw value.
+    :return: uuid.UUID|None: The parsed UUID, or None if the value is not a valid UUID.
+    """
+    try:
+        return uuid.UUID(str(value))
+    except ValueError:
+        return None
@@ -0,0 +1,391 @@
+"""
+Load benchmark of the API endpoints at several data scales.
+
+For every scale, a fresh SQLite database is seeded with synthetic users owning tasks_per_user tasks
+each, and the application is built with the production profile (WAL, single writer). The response cache
+is off, so reads measure the queries and serialization; the ':cached' endpoints rerun them with the
+cache on to measure cache hits separately. Each endpoint is then driven by concurrent clients, either in-process through the Flask test
+client or over HTTP through a local threaded WSGI server, and its throughput and p50/p95/p99
+latencies are reported.
+
+Results can be written as JSON and compared with the file of a previous commit: with --baseline,
+the run fails when an endpoint got slower than --threshold percent on --metric.
+
+Usage:
+    python -m benchmarks.bench_api [--scales 1000 100000 1000000] [--modes inprocess wsgi]
+                                   [--concurrency 8] [--requests 50] [--output results.json]
+                                   [--baseline previous.json] [--threshold 10] [--metric p95_ms]
+"""
+import argparse
+import http.client
+import json
+import os
+import platform
+import random
+import sqlite3
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import uuid
+from datetime import datetime, timedelta
+
+from flask import Flask
+from sqlalchemy import insert
+from werkzeug.serving import WSGIRequestHandler, make_server
+
+from app.config import ProductionConfig
+from app.extensions import db, db_router, init_sqlite, metrics, pool_metrics, request_timing, response_cache
+from app.models import Task, User
+from app.routes import register_blueprints
+from app.services.auth_service import hash_password
+from app.services.group_commit import task_group_commit
+from app.utils.json_provider import FastJSONProvider
+from app.utils.token import generate_token
+
+PASSWORD = 'benchmark'
+SEED_CHUNK_SIZE = 10_000
+CACHED_SUFFIX = ':cached'
+ENDPOINTS = ('auth.login', 'tasks.get_tasks', 'tasks.get_tasks:cached', 'tasks.get_task_changes',
+             'tasks.get_task_by_id', 'tasks.create_task', 'tasks.update_task')
+LATENCY_METRICS = ('p50_ms', 'p95_ms', 'p99_ms')
+
+
+def create_app(uri: str, password_hash_method: str) -> Flask:
+    """
+    Create an application with the production profile on the benchmark database.
+    """
+    app = Flask(__name__)
+    app.json = FastJSONProvider(app)
+    app.config.from_object(ProductionConfig)
+    app.config['SQLALCHEMY_DATABASE_URI'] = uri
+    app.config['SQLALCHEMY_ECHO'] = False
+    app.config['PASSWORD_HASH_METHOD'] = password_hash_method
+    app.config['SERVER_TIMING_HEADER'] = False
+    app.config['RESPONSE_CACHE_ENABLED'] = False
+    db.init_app(app)
+    db_router.init_app(app)
+    init_sqlite(app)
+    pool_metrics.init_app(app)
+    request_timing.init_app(app)
+    metrics.init_app(app)
+    response_cache.init_app(app)
+    task_group_commit.init_app(app)
+    register_blueprints(app)
+
+    return app
+
+
+def seed(scale: int, tasks_per_user: int) -> list[dict]:
+    """
+    Insert scale tasks spread over synthetic users, with executemany INSERTs of SEED_CHUNK_SIZE rows.
+
+    :return: list[dict]: The ID, email and task IDs of every user.
+    """
+    password = hash_password(PASSWORD)
+    start = datetime.now() - timedelta(days=1)
+    users = []
+
+    for index in range((scale + tasks_per_user - 1) // tasks_per_user):
+        count = min(tasks_per_user, scale - index * tasks_per_user)
+        users.append({'id': uuid.uuid4(), 'email': f'user{index}@example.com',
+                      'task_ids': [uuid.uuid4() for _ in range(count)]})
+
+    db.session.execute(insert(User), [{
+        'id': user['id'], 'email': user['email'], 'password': password, 'task_change_seq': len(user['task_ids']),
+    } for user in users])
+
+    rows = []
+
+    for user in users:
+        for i, task_id in enumerate(user['task_ids']):
+            rows.append({
+                'id': task_id,
+                'title': f'Task {i}',
+                'description': f'Description of task {i}',
+                'completed': i % 3 == 0,
+                'created_at': start + timedelta(microseconds=i),
+                'updated_at': start + timedelta(microseconds=i),
+                'change_seq': i + 1,
+                'user_id': user['id'],
+            })
+
+            if len(rows) == SEED_CHUNK_SIZE:
+                db.session.execute(insert(Task), rows)
+                rows = []
+
+    if rows:
+        db.session.execute(insert(Task), rows)
+
+    db.session.commit()
+
+    return users
+
+
+def requests_for(endpoint: str, user: dict):
+    """
+    Return a function building the (method, path, body) of the next request of a client.
+    """
+    task_ids = [str(task_id) for task_id in user['task_ids']] or [str(uuid.uuid4())]
+    since = max(len(user['task_ids']) - 50, 0)
+
+    name = endpoint.removesuffix(CACHED_SUFFIX)
+
+    def build(i: int) -> tuple[str, str, dict | None]:
+        if name == 'auth.login':
+            return 'POST', '/auth/login', {'email': user['email'], 'password': PASSWORD}
+        if name == 'tasks.get_tasks':
+            return 'GET', '/tasks/?limit=50', None
+        if name == 'tasks.get_task_changes':
+            return 'GET', f'/tasks/changes?since={since}&limit=50', None
+        if name == 'tasks.get_task_by_id':
+            return 'GET', f'/tasks/{random.choice(task_ids)}', None
+        if name == 'tasks.create_task':
+            return 'POST', '/tasks/', {'title': f'New task {i}', 'description': f'New task {i}'}
+        if name == 'tasks.update_task':
+            return 'PUT', f'/tasks/{random.choice(task_ids)}', {'title': f'Updated {i}', 'completed': i % 2 == 0}
+
+        raise ValueError(f'Unknown endpoint: {endpoint}')
+
+    return build
+
+
+class InProcessClient:
+    """
+    Sends requests through the Flask test client.
+    """
+
+    def __init__(self, app):
+        self._client = app.test_client()
+
+    def request(self, method: str, path: str, headers: dict, body: dict | None) -> int:
+        return self._client.open(path, method=method, headers=headers, json=body).status_code
+
+
+class HTTPClient:
+    """
+    Sends requests to the local WSGI server over a keep-alive HTTP connection.
+    """
+
+    def __init__(self, port: int):
+        self._connection = http.client.HTTPConnection('127.0.0.1', port, timeout=60)
+
+    def request(self, method: str, path: str, headers: dict, body: dict | None) -> int:
+        if body is not None:
+            headers = {**headers, 'Content-Type': 'application/json'}
+            body = json.dumps(body)
+
+        self._connection.request(method, path, body=body, headers=headers)
+        response = self._connection.getresponse()
+        response.read()
+
+        return response.status
+
+
+class QuietRequestHandler(WSGIRequestHandler):
+    """
+    Request handler of the WSGI server that does not log every request.
+    """
+
+    def log_request(self, *args, **kwargs) -> None:
+        pass
+
+
+def drive(make_client, endpoint: str, users: list[dict], tokens: list[str], requests: int, warmup: int) -> dict:
+    """
+    Run one endpoint with one client thread per user and return its throughput and latencies.
+    """
+    latencies = []
+    errors = []
+    lock = threading.Lock()
+    barrier = threading.Barrier(len(users) + 1)
+
+    def client_thread(user: dict, token: str) -> None:
+        client = make_client()
+        build = requests_for(endpoint, user)
+        headers = {} if endpoint == 'auth.login' else {'Authorization': token}
+        timings = []
+        failed = 0
+
+        for i in range(warmup):
+            method, path, body = build(i)
+            client.request(method, path, headers, body)
+
+        barrier.wait()
+
+        for i in range(requests):
+            method, path, body = build(i)
+            start = time.perf_counter()
+            status = client.request(method, path, headers, body)
+            timings.append(time.perf_counter() - start)
+            failed += status >= 400
+
+        with lock:
+            latencies.extend(timings)
+            errors.append(failed)
+
+    threads = [threading.Thread(target=client_thread, args=pair) for pair in zip(users, tokens)]
+
+    for thread in threads:
+        thread.start()
+
+    barrier.wait()
+    start = time.perf_counter()
+
+    for thread in threads:
+        thread.join()
+
+    elapsed = time.perf_counter() - start
+    percentiles = statistics.quantiles(latencies, n=100)
+
+    return {
+        'requests': len(latencies),
+        'errors': sum(errors),
+        'throughput': len(latencies) / elapsed,
+        'p50_ms': percentiles[49] * 1000,
+        'p95_ms': percentiles[94] * 1000,
+        'p99_ms': percentiles[98] * 1000,
+    }
+
+
+def run_scale(scale: int, args) -> dict:
+    """
+    Seed a database at one scale and benchmark every endpoint in every mode.
+
+    :return: dict: The results, keyed by 'scale/mode/endpoint'.
+    """
+    results = {}
+
+    with tempfile.TemporaryDirectory() as directory:
+        app = create_app(f'sqlite:///{directory}/bench.db', args.password_hash_method)
+
+        with app.app_context():
+            db.create_all()
+            started = time.perf_counter()
+            users = seed(scale, args.tasks_per_user)[:args.concurrency]
+            print(f'seeded {scale} tasks in {time.perf_counter() - started:.1f}s', file=sys.stderr)
+            tokens = [generate_token(str(user['id'])) for user in users]
+            db.session.remove()
+
+        for mode in args.modes:
+            server = None
+
+            if mode == 'wsgi':
+                server = make_server('127.0.0.1', 0, app, threaded=True, request_handler=QuietRequestHandler)
+                threading.Thread(target=server.serve_forever, daemon=True).start()
+                make_client = lambda: HTTPClient(server.port)  # noqa: E731
+            else:
+                make_client = lambda: InProcessClient(app)  # noqa: E731
+
+            try:
+                for endpoint in args.endpoints:
+                    response_cache.enabled = endpoint.endswith(CACHED_SUFFIX)
+                    result = drive(make_client, endpoint, users, tokens, args.requests, args.warmup)
+                    results[f'{scale}/{mode}/{endpoint}'] = {'scale': scale, 'mode': mode, 'endpoint': endpoint,
+                                                             **result}
+                    print(f'{scale:>8} {mode:>9} {endpoint:>24} {result["throughput"]:>8.0f} '
+                          f'{result["p50_ms"]:>8.1f} {result["p95_ms"]:>8.1f} {result["p99_ms"]:>8.1f} '
+                          f'{result["errors"]:>6}')
+            finally:
+                if server is not None:
+                    server.shutdown()
+
+        task_group_commit.shutdown()
+
+        with app.app_context():
+            db.session.remove()
+            db.engine.dispose()
+
+    return results
+
+
+def compare(baseline: dict, current: dict, threshold: float, metric: str) -> list[str]:
+    """
+    Return a description of every result slower than the baseline by more than threshold percent.
+
+    Latencies regress when they grow and throughput when it drops; results missing from either run
+    are ignored.
+    """
+    regressions = []
+
+    for key, result in current['results'].items():
+        previous = baseline['results'].get(key)
+
+        if previous is None or not previous[metric] or not result[metric]:
+            continue
+
+        if metric in LATENCY_METRICS:
+            slowdown = (result[metric] / previous[metric] - 1) * 100
+        else:
+            slowdown = (previous[metric] / result[metric] - 1) * 100
+
+        if slowdown > threshold:
+            regressions.append(f'{key}: {metric} {previous[metric]:.1f} -> {result[metric]:.1f} '
+                               f'({slowdown:+.1f}%)')
+
+    return regressions
+
+
+def environment() -> dict:
+    """
+    Describe the commit and platform the benchmark ran on.
+    """
+    try:
+        commit = subprocess.run(['git', 'rev-parse', 'HEAD'], capture_output=True, text=True,
+                                check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+
+    return {
+        'commit': commit,
+        'created_at': datetime.now().isoformat(),
+        'python': platform.python_version(),
+        'sqlite': sqlite3.sqlite_version,
+        'platform': platform.platform(),
+        'cpus': os.cpu_count(),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--scales', type=int, nargs='+', default=[1_000, 100_000, 1_000_000])
+    parser.add_argument('--tasks-per-user', type=int, default=1_000)
+    parser.add_argument('--modes', nargs='+', choices=('inprocess', 'wsgi'), default=['inprocess', 'wsgi'])
+    parser.add_argument('--endpoints', nargs='+', choices=ENDPOINTS, default=list(ENDPOINTS))
+    parser.add_argument('--concurrency', type=int, default=8)
+    parser.add_argument('--requests', type=int, default=50, help='requests per client and endpoint')
+    parser.add_argument('--warmup', type=int, default=5, help='untimed requests per client and endpoint')
+    parser.add_argument('--password-hash-method', default='scrypt:32768:8:1')
+    parser.add_argument('--output', help='write the results to this JSON file')
+    parser.add_argument('--baseline', help='compare with the JSON results of a previous run')
+    parser.add_argument('--threshold', type=float, default=10.0, help='allowed slowdown, in percent')
+    parser.add_argument('--metric', choices=(*LATENCY_METRICS, 'throughput'), default='p95_ms')
+    args = parser.parse_args()
+
+    report = {'environment': environment(), 'settings': vars(args), 'results': {}}
+
+    print(f"{'tasks':>8} {'mode':>9} {'endpoint':>24} {'req/s':>8} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} "
+          f"{'errors':>6}")
+
+    for scale in args.scales:
+        report['results'].update(run_scale(scale, args))
+
+    if args.output:
+        with open(args.output, 'w') as file:
+            json.dump(report, file, indent=2)
+
+    if args.baseline:
+        with open(args.baseline) as file:
+            regressions = compare(json.load(file), report, args.threshold, args.metric)
+
+        for regression in regressions:
+            print(f'REGRESSION {regression}', file=sys.stderr)
+
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,126 @@
+"""
+Concurrent load benchmark of task creation, with and without group commit.
+
+Several client threads, each with its own user, create tasks through POST /tasks/ as fast as they
+can against a SQLite file in WAL mode with synchronous=FULL, where every commit waits for an fsync.
+Reports the throughput and latency percentiles of both modes.
+
+Usage:
+    python -m benchmarks.bench_group_commit [--clients 16] [--requests 50] [--window 0.002]
+"""
+import argparse
+import statistics
+import tempfile
+import threading
+import time
+
+from flask import Flask
+
+from app.extensions import db, init_sqlite
+from app.routes import auth_blueprint, tasks_blueprint
+from app.services.group_commit import task_group_commit
+
+
+def create_app(uri: str, group_commit: bool, window: float, max_items: int) -> Flask:
+    """
+    Create an application on the benchmark database.
+    """
+    app = Flask(__name__)
+    app.config['SQLALCHEMY_DATABASE_URI'] = uri
+    app.config['SQLITE_PRAGMAS'] = {'journal_mode': 'WAL', 'synchronous': 'FULL', 'busy_timeout': 30000}
+    app.config['PASSWORD_HASH_METHOD'] = 'pbkdf2:sha256:1'
+    app.config['TASKS_GROUP_COMMIT'] = group_commit
+    app.config['TASKS_GROUP_COMMIT_WINDOW'] = window
+    app.config['TASKS_GROUP_COMMIT_MAX_ITEMS'] = max_items
+    db.init_app(app)
+    init_sqlite(app)
+    task_group_commit.init_app(app)
+    app.register_blueprint(auth_blueprint, url_prefix='/auth')
+    app.register_blueprint(tasks_blueprint, url_prefix='/tasks')
+
+    return app
+
+
+def login(app: Flask, index: int) -> str:
+    """
+    Register and log in the user of a client thread, returning its token.
+    """
+    client = app.test_client()
+    credentials = {'email': f'client{index}@example.com', 'password': 'benchmark'}
+    client.post('/auth/register', json=credentials)
+
+    return client.post('/auth/login', json=credentials).get_json()['token']
+
+
+def run(app: Flask, clients: int, requests: int) -> tuple[float, list[float]]:
+    """
+    Run the load and return the wall time and the latency of every request, in seconds.
+    """
+    tokens = [login(app, index) for index in range(clients)]
+    latencies = []
+    lock = threading.Lock()
+    barrier = threading.Barrier(clients + 1)
+
+    def client_thread(token: str) -> None:
+        client = app.test_client()
+        timings = []
+        barrier.wait()
+
+        for i in range(requests):
+            start = time.perf_counter()
+            response = client.post('/tasks/', headers={'Authorization': token},
+                                   json={'title': f'Task {i}', 'description': f'Task {i}'})
+            timings.append(time.perf_counter() - start)
+            assert response.status_code == 201
+
+        with lock:
+            latencies.extend(timings)
+
+    threads = [threading.Thread(target=client_thread, args=(token,)) for token in tokens]
+
+    for thread in threads:
+        thread.start()
+
+    barrier.wait()
+    start = time.perf_counter()
+
+    for thread in threads:
+        thread.join()
+
+    return time.perf_counter() - start, latencies
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--clients', type=int, default=16)
+    parser.add_argument('--requests', type=int, default=50)
+    parser.add_argument('--window', type=float, default=0.002)
+    parser.add_argument('--max-items', type=int, default=64)
+    args = parser.parse_args()
+
+    print(f"{'mode':>14} {'req/s':>8} {'p50 (ms)':>9} {'p99 (ms)':>9} {'commits':>8}")
+
+    for group_commit in (False, True):
+        with tempfile.TemporaryDirectory() as directory:
+            app = create_app(f'sqlite:///{directory}/bench.db', group_commit, args.window, args.max_items)
+
+            with app.app_context():
+                db.create_all()
+
+            batches = task_group_commit.batches
+            elapsed, latencies = run(app, args.clients, args.requests)
+            total = args.clients * args.requests
+            percentiles = statistics.quantiles(latencies, n=100)
+            commits = task_group_commit.batches - batches if group_commit else total
+
+            print(f"{'group commit' if group_commit else 'per request':>14} {total / elapsed:>8.0f} "
+                  f'{percentiles[49] * 1000:>9.1f} {percentiles[98] * 1000:>9.1f} {commits:>8}')
+
+            task_group_commit.shutdown()
+
+            with app.app_context():
+                db.engine.dispose()
+
+
+if __name__ == '__main__':
+    main()
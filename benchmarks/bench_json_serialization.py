@@ -0,0 +1,101 @@
+"""
+Microbenchmark of task list serialization.
+
+Compares Flask's default JSON provider on Task.as_dict() payloads (UUID and datetime objects) with
+FastJSONProvider on the precomputed payloads of the task service, with the stdlib and with orjson.
+
+Usage:
+    python -m benchmarks.bench_json_serialization [--sizes 1000 10000 100000] [--repeat 5]
+"""
+import argparse
+import time
+import uuid
+from datetime import datetime, timedelta
+
+from flask import Flask
+from flask.json.provider import DefaultJSONProvider
+
+from app.utils.json_provider import FastJSONProvider, orjson
+
+
+def build_tasks(count: int) -> list[dict]:
+    """
+    Build task dictionaries shaped like Task.as_dict().
+    """
+    user_id = uuid.uuid4()
+    start = datetime.now()
+
+    return [{
+        'id': uuid.uuid4(),
+        'title': f'Task {i}',
+        'description': f'Description of task {i}',
+        'completed': i % 3 == 0,
+        'created_at': start + timedelta(seconds=i),
+        'user_id': user_id,
+    } for i in range(count)]
+
+
+def precompute(tasks: list[dict]) -> list[dict]:
+    """
+    Convert UUIDs and datetimes to strings, as the task service does.
+    """
+    return [{**task, 'id': str(task['id']), 'created_at': task['created_at'].isoformat(),
+             'user_id': str(task['user_id'])} for task in tasks]
+
+
+def best_of(app: Flask, payload: dict, repeat: int) -> float:
+    """
+    Return the best wall time, in seconds, of building a JSON response for the payload.
+    """
+    timings = []
+
+    with app.app_context():
+        for _ in range(repeat):
+            start = time.perf_counter()
+            app.json.response(payload)
+            timings.append(time.perf_counter() - start)
+
+    return min(timings)
+
+
+def make_app(provider_class, use_orjson: bool = False) -> Flask:
+    """
+    Create a Flask application with the given JSON provider.
+    """
+    app = Flask(__name__)
+    app.json = provider_class(app)
+
+    if provider_class is FastJSONProvider:
+        app.json.use_orjson = use_orjson
+
+    return app
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1_000, 10_000, 100_000])
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    variants = [
+        ('default', make_app(DefaultJSONProvider), False),
+        ('stdlib', make_app(FastJSONProvider), True),
+    ]
+
+    if orjson is not None:
+        variants.append(('orjson', make_app(FastJSONProvider, use_orjson=True), True))
+
+    print(f"{'tasks':>8} " + ' '.join(f'{name + " (ms)":>14}' for name, _, _ in variants))
+
+    for size in args.sizes:
+        tasks = build_tasks(size)
+        payloads = {False: {'tasks': tasks, 'next_cursor': None},
+                    True: {'tasks': precompute(tasks), 'next_cursor': None}}
+
+        timings = [best_of(app, payloads[precomputed], args.repeat) for _, app, precomputed in variants]
+
+        print(f'{size:>8} ' + ' '.join(f'{timing * 1000:>14.1f}' for timing in timings))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,103 @@
+"""
+Benchmark of the task listing read paths.
+
+Compares the ORM path (hydrate Task objects, then call Task.as_dict()) with the Core path used by
+GET /tasks/ (select row tuples and build the dictionaries directly) for several list sizes.
+
+Usage:
+    python -m benchmarks.bench_task_listing [--sizes 1000 10000 100000] [--repeat 5]
+"""
+import argparse
+import tempfile
+import time
+import uuid
+from datetime import datetime, timedelta
+
+from flask import Flask
+from sqlalchemy import insert
+
+from app.extensions import db
+from app.models import Task
+from app.services.tasks_service import list_tasks
+
+
+def seed_tasks(user_id: uuid.UUID, count: int) -> None:
+    """
+    Insert synthetic tasks for one user with a single executemany INSERT.
+    """
+    start = datetime.now()
+    rows = [{
+        'id': uuid.uuid4(),
+        'title': f'Task {i}',
+        'description': f'Description of task {i}',
+        'completed': i % 3 == 0,
+        'created_at': start + timedelta(microseconds=i),
+        'user_id': user_id,
+    } for i in range(count)]
+
+    db.session.execute(insert(Task), rows)
+    db.session.commit()
+
+
+def orm_path(user_id: uuid.UUID, count: int) -> list[dict]:
+    """
+    List tasks the way GET /tasks/ did before the Core read path.
+    """
+    tasks = Task.query.filter_by(user_id=user_id).order_by(Task.created_at, Task.id).limit(count).all()
+    return [task.as_dict() for task in tasks]
+
+
+def core_path(user_id: uuid.UUID, count: int) -> list[dict]:
+    """
+    List tasks through the Core read path.
+    """
+    return list_tasks(user_id, count)
+
+
+def best_of(function, user_id: uuid.UUID, count: int, repeat: int) -> float:
+    """
+    Return the best wall time, in seconds, of several runs on a fresh session.
+    """
+    timings = []
+
+    for _ in range(repeat):
+        db.session.remove()
+        start = time.perf_counter()
+        result = function(user_id, count)
+        timings.append(time.perf_counter() - start)
+        assert len(result) == count
+
+    return min(timings)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1_000, 10_000, 100_000])
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        app = Flask(__name__)
+        app.config['SQLALCHEMY_DATABASE_URI'] = f'sqlite:///{directory}/bench.db'
+        db.init_app(app)
+
+        with app.app_context():
+            db.create_all()
+
+            print(f"{'tasks':>8} {'orm (ms)':>10} {'core (ms)':>10} {'speedup':>8}")
+
+            for size in args.sizes:
+                user_id = uuid.uuid4()
+                seed_tasks(user_id, size)
+
+                orm = best_of(orm_path, user_id, size, args.repeat)
+                core = best_of(core_path, user_id, size, args.repeat)
+
+                print(f'{size:>8} {orm * 1000:>10.1f} {core * 1000:>10.1f} {orm / core:>7.1f}x')
+
+            db.session.remove()
+            db.engine.dispose()
+
+
+if __name__ == '__main__':
+    main()
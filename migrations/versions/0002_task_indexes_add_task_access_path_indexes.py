@@ -0,0 +1,29 @@
+"""add task access path indexes
+
+Revision ID: 0002_task_indexes
+Revises: 0001_initial
+Create Date: 2026-10-17 05:45:28.925701
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0002_task_indexes'
+down_revision = '0001_initial'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('tasks', schema=None) as batch_op:
+        batch_op.create_index('ix_tasks_user_id_created_at_id', ['user_id', 'created_at', 'id'], unique=False)
+        batch_op.create_index('ix_tasks_user_id_created_at_id_incomplete', ['user_id', 'created_at', 'id'], unique=False,
+                              sqlite_where=sa.text('completed = 0'), postgresql_where=sa.text('NOT completed'))
+
+
+def downgrade():
+    with op.batch_alter_table('tasks', schema=None) as batch_op:
+        batch_op.drop_index('ix_tasks_user_id_created_at_id_incomplete')
+        batch_op.drop_index('ix_tasks_user_id_created_at_id')
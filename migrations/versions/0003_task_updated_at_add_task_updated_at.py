@@ -0,0 +1,43 @@
+"""add task updated_at
+
+Revision ID: 0003_task_updated_at
+Revises: 0002_task_indexes
+Create Date: 2026-10-17 05:57:00.904266
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0003_task_updated_at'
+down_revision = '0002_task_indexes'
+branch_labels = None
+depends_on = None
+
+
+def task_uuid_columns():
+    """
+    SQLite recreates the table for some changes and cannot reflect the UUID type; keep it explicitly.
+    """
+    return [
+        sa.Column('id', sa.UUID(), primary_key=True),
+        sa.Column('user_id', sa.UUID(), sa.ForeignKey('users.id'), nullable=False),
+    ]
+
+
+def upgrade():
+    with op.batch_alter_table('tasks', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('updated_at', sa.DateTime(), nullable=True))
+
+    op.execute('UPDATE tasks SET updated_at = created_at')
+
+    with op.batch_alter_table('tasks', schema=None, reflect_args=task_uuid_columns()) as batch_op:
+        batch_op.alter_column('updated_at', existing_type=sa.DateTime(), nullable=False)
+        batch_op.create_index('ix_tasks_user_id_updated_at', ['user_id', 'updated_at'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('tasks', schema=None, reflect_args=task_uuid_columns()) as batch_op:
+        batch_op.drop_index('ix_tasks_user_id_updated_at')
+        batch_op.drop_column('updated_at')
@@ -0,0 +1,79 @@
+"""add task change sequence and tombstones
+
+Revision ID: 0004_task_change_seq
+Revises: 0003_task_updated_at
+Create Date: 2026-10-17 05:59:50.096728
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0004_task_change_seq'
+down_revision = '0003_task_updated_at'
+branch_labels = None
+depends_on = None
+
+
+def task_uuid_columns():
+    """
+    SQLite recreates the table for some changes and cannot reflect the UUID type; keep it explicitly.
+    """
+    return [
+        sa.Column('id', sa.UUID(), primary_key=True),
+        sa.Column('user_id', sa.UUID(), sa.ForeignKey('users.id'), nullable=False),
+    ]
+
+
+def user_uuid_columns():
+    return [sa.Column('id', sa.UUID(), primary_key=True)]
+
+
+def upgrade():
+    op.create_table('task_tombstones',
+    sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+    sa.Column('task_id', sa.UUID(), nullable=False),
+    sa.Column('change_seq', sa.Integer(), nullable=False),
+    sa.Column('deleted_at', sa.DateTime(), nullable=False),
+    sa.Column('user_id', sa.UUID(), nullable=False),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    with op.batch_alter_table('task_tombstones', schema=None) as batch_op:
+        batch_op.create_index('ix_task_tombstones_user_id_change_seq', ['user_id', 'change_seq'], unique=False)
+
+    with op.batch_alter_table('tasks', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('change_seq', sa.Integer(), server_default='0', nullable=False))
+        batch_op.create_index('ix_tasks_user_id_change_seq', ['user_id', 'change_seq'], unique=False)
+
+    with op.batch_alter_table('users', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('task_change_seq', sa.Integer(), server_default='0', nullable=False))
+        batch_op.add_column(sa.Column('task_changed_at', sa.DateTime(), nullable=True))
+
+    # Number the existing tasks of each user in creation order, so a first sync sees all of them.
+    op.execute(
+        'UPDATE tasks SET change_seq = ranked.seq '
+        'FROM (SELECT id, ROW_NUMBER() OVER (PARTITION BY user_id ORDER BY created_at, id) AS seq FROM tasks) '
+        'AS ranked WHERE tasks.id = ranked.id'
+    )
+    op.execute(
+        'UPDATE users SET task_change_seq = COALESCE((SELECT MAX(change_seq) FROM tasks '
+        'WHERE tasks.user_id = users.id), 0), '
+        'task_changed_at = (SELECT MAX(updated_at) FROM tasks WHERE tasks.user_id = users.id)'
+    )
+
+
+def downgrade():
+    with op.batch_alter_table('users', schema=None, reflect_args=user_uuid_columns()) as batch_op:
+        batch_op.drop_column('task_changed_at')
+        batch_op.drop_column('task_change_seq')
+
+    with op.batch_alter_table('tasks', schema=None, reflect_args=task_uuid_columns()) as batch_op:
+        batch_op.drop_index('ix_tasks_user_id_change_seq')
+        batch_op.drop_column('change_seq')
+
+    with op.batch_alter_table('task_tombstones', schema=None) as batch_op:
+        batch_op.drop_index('ix_task_tombstones_user_id_change_seq')
+
+    op.drop_table('task_tombstones')
@@ -0,0 +1,26 @@
+"""add task title index
+
+Revision ID: 0005_task_title_index
+Revises: 0004_task_change_seq
+Create Date: 2026-10-17 06:27:52.819697
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0005_task_title_index'
+down_revision = '0004_task_change_seq'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('tasks', schema=None) as batch_op:
+        batch_op.create_index('ix_tasks_user_id_title_id', ['user_id', 'title', 'id'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('tasks', schema=None) as batch_op:
+        batch_op.drop_index('ix_tasks_user_id_title_id')
@@ -0,0 +1,55 @@
+"""add task full-text index
+
+Revision ID: 0006_task_search
+Revises: 0005_task_title_index
+Create Date: 2026-10-17 06:52:10.412285
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '0006_task_search'
+down_revision = '0005_task_title_index'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    dialect = op.get_bind().dialect.name
+
+    if dialect == 'sqlite':
+        op.execute("CREATE VIRTUAL TABLE tasks_fts USING fts5("
+                   "title, description, content='tasks', content_rowid='rowid', "
+                   "tokenize='unicode61 remove_diacritics 2')")
+        op.execute("CREATE TRIGGER tasks_fts_insert AFTER INSERT ON tasks BEGIN "
+                   "INSERT INTO tasks_fts(rowid, title, description) VALUES (new.rowid, new.title, new.description); "
+                   "END")
+        op.execute("CREATE TRIGGER tasks_fts_delete AFTER DELETE ON tasks BEGIN "
+                   "INSERT INTO tasks_fts(tasks_fts, rowid, title, description) "
+                   "VALUES ('delete', old.rowid, old.title, old.description); "
+                   "END")
+        op.execute("CREATE TRIGGER tasks_fts_update AFTER UPDATE OF title, description ON tasks BEGIN "
+                   "INSERT INTO tasks_fts(tasks_fts, rowid, title, description) "
+                   "VALUES ('delete', old.rowid, old.title, old.description); "
+                   "INSERT INTO tasks_fts(rowid, title, description) VALUES (new.rowid, new.title, new.description); "
+                   "END")
+        op.execute("INSERT INTO tasks_fts(tasks_fts) VALUES ('rebuild')")
+    elif dialect == 'postgresql':
+        op.execute("ALTER TABLE tasks ADD COLUMN search_vector tsvector GENERATED ALWAYS AS ("
+                   "setweight(to_tsvector('english', title), 'A') || "
+                   "setweight(to_tsvector('english', description), 'B')) STORED")
+        op.execute("CREATE INDEX ix_tasks_search_vector ON tasks USING GIN (search_vector)")
+
+
+def downgrade():
+    dialect = op.get_bind().dialect.name
+
+    if dialect == 'sqlite':
+        op.execute("DROP TRIGGER IF EXISTS tasks_fts_update")
+        op.execute("DROP TRIGGER IF EXISTS tasks_fts_delete")
+        op.execute("DROP TRIGGER IF EXISTS tasks_fts_insert")
+        op.execute("DROP TABLE IF EXISTS tasks_fts")
+    elif dialect == 'postgresql':
+        op.execute("DROP INDEX IF EXISTS ix_tasks_search_vector")
+        op.execute("ALTER TABLE tasks DROP COLUMN IF EXISTS search_vector")
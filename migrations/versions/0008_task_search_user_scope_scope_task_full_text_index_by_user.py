@@ -0,0 +1,62 @@
+"""scope task full-text index by user
+
+Revision ID: 0008_task_search_user_scope
+Revises: 0007_task_created_on_index
+Create Date: 2026-10-17 09:12:37.518204
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '0008_task_search_user_scope'
+down_revision = '0007_task_created_on_index'
+branch_labels = None
+depends_on = None
+
+
+def _create_sqlite_index(columns):
+    # The FTS5 table is recreated with the given columns and filled again from tasks: an external
+    # content table cannot gain a column in place.
+    listed = ', '.join(columns)
+    new = ', '.join(f'new.{column}' for column in columns)
+    old = ', '.join(f'old.{column}' for column in columns)
+
+    op.execute("DROP TRIGGER IF EXISTS tasks_fts_update")
+    op.execute("DROP TRIGGER IF EXISTS tasks_fts_delete")
+    op.execute("DROP TRIGGER IF EXISTS tasks_fts_insert")
+    op.execute("DROP TABLE IF EXISTS tasks_fts")
+    op.execute(f"CREATE VIRTUAL TABLE tasks_fts USING fts5({listed}, "
+               "content='tasks', content_rowid='rowid', tokenize='unicode61 remove_diacritics 2')")
+    op.execute("CREATE TRIGGER tasks_fts_insert AFTER INSERT ON tasks BEGIN "
+               f"INSERT INTO tasks_fts(rowid, {listed}) VALUES (new.rowid, {new}); "
+               "END")
+    op.execute("CREATE TRIGGER tasks_fts_delete AFTER DELETE ON tasks BEGIN "
+               f"INSERT INTO tasks_fts(tasks_fts, rowid, {listed}) VALUES ('delete', old.rowid, {old}); "
+               "END")
+    op.execute(f"CREATE TRIGGER tasks_fts_update AFTER UPDATE OF {listed} ON tasks BEGIN "
+               f"INSERT INTO tasks_fts(tasks_fts, rowid, {listed}) VALUES ('delete', old.rowid, {old}); "
+               f"INSERT INTO tasks_fts(rowid, {listed}) VALUES (new.rowid, {new}); "
+               "END")
+    op.execute("INSERT INTO tasks_fts(tasks_fts) VALUES ('rebuild')")
+
+
+def upgrade():
+    dialect = op.get_bind().dialect.name
+
+    if dialect == 'sqlite':
+        _create_sqlite_index(('title', 'description', 'user_id'))
+    elif dialect == 'postgresql':
+        op.execute("CREATE EXTENSION IF NOT EXISTS btree_gin")
+        op.execute("CREATE INDEX ix_tasks_user_id_search_vector ON tasks USING GIN (user_id, search_vector)")
+        op.execute("DROP INDEX IF EXISTS ix_tasks_search_vector")
+
+
+def downgrade():
+    dialect = op.get_bind().dialect.name
+
+    if dialect == 'sqlite':
+        _create_sqlite_index(('title', 'description'))
+    elif dialect == 'postgresql':
+        op.execute("CREATE INDEX ix_tasks_search_vector ON tasks USING GIN (search_vector)")
+        op.execute("DROP INDEX IF EXISTS ix_tasks_user_id_search_vector")
@@ -0,0 +1,71 @@
+"""
+Shared pytest fixtures.
+
+Test modules that configure the application differently, such as with the response cache, replicas
+or a SQLite file, override app and keep client and user from here.
+
+Fixtures:
+    - app: Sets up and tears down the Flask testing application on an in-memory database.
+    - client: Creates a test client for the Flask testing application.
+    - user: Registers and logs in a user, returning a JWT token.
+    - assert_max_queries: Returns a context manager failing the test if its block runs too many SQL statements.
+"""
+
+import pytest
+from flask import Flask
+
+from app.extensions import db
+from app.extensions.query_counter import QueryCounter
+from app.routes import tasks_blueprint, auth_blueprint
+
+
+@pytest.fixture
+def app():
+    """
+    Set up and tear down the Flask testing application.
+    """
+    app = Flask(__name__)
+    app.config['TESTING'] = True
+    app.config['SQLALCHEMY_DATABASE_URI'] = 'sqlite:///:memory:'
+    db.init_app(app)
+    app.register_blueprint(auth_blueprint, url_prefix='/auth')
+    app.register_blueprint(tasks_blueprint, url_prefix='/tasks')
+
+    with app.app_context():
+        db.create_all()
+        yield app
+        db.drop_all()
+
+
+@pytest.fixture
+def client(app):
+    """
+    Create a test client for the Flask app.
+    """
+    return app.test_client()
+
+
+@pytest.fixture
+def user(client):
+    """
+    Register and log in a user, returning a JWT token.
+    """
+    client.post('/auth/register', json={'email': 'test@example.com', 'password': 'testpassword'})
+
+    response = client.post('/auth/login', json={'email': 'test@example.com', 'password': 'testpassword'})
+
+    json_data = response.get_json()
+
+    return json_data['token']
+
+
+@pytest.fixture
+def assert_max_queries():
+    """
+    Return a context manager failing the test if its block runs more SQL statements than a limit.
+
+    Usage:
+        with assert_max_queries(2):
+            client.get('/tasks/', headers=headers)
+    """
+    return lambda limit: QueryCounter(limit)
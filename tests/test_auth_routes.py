@@ -13,6 +13,8 @@ Tests:
     - test_login: Valid user login.
     - test_login_invalid_password: Login with invalid password.
     - test_login_invalid_email: Login with an unregistered email.
+    - test_register_password_pool_saturated: Registration while the password pool is saturated.
+    - test_login_password_pool: Registration and login with passwords hashed in a process pool, bounded or not.
 """
 
 from typing import Generator, Any
@@ -23,6 +25,7 @@ from flask.testing import FlaskClient
 
 from app.extensions import db
 from app.routes import auth_blueprint
+from app.services.auth_service import PasswordHasher
 
 
 @pytest.fixture
@@ -131,3 +134,42 @@ def test_login_invalid_email(client: FlaskClient) -> None:
 
     assert response.status_code == 401
     assert json_data['message'] == 'Invalid email or password'
+
+
+def test_register_password_pool_saturated(testing_app: Flask, client: FlaskClient) -> None:
+    """
+    Test registration while the password pool is saturated.
+    """
+    hasher = PasswordHasher('pbkdf2:sha256:1000', workers=1, max_pending=1)
+    testing_app.extensions['password_hasher'] = hasher
+    hasher._slots.acquire()
+
+    try:
+        response = client.post('/register', json={'email': 'test@example.com', 'password': 'password'})
+    finally:
+        hasher._slots.release()
+        hasher.shutdown()
+
+    assert response.status_code == 503
+    assert response.headers['Retry-After'] == '1'
+
+
+@pytest.mark.parametrize('max_pending', [4, 0])
+def test_login_password_pool(testing_app: Flask, client: FlaskClient, max_pending: int) -> None:
+    """
+    Test registration and login with passwords hashed in a process pool, with a bounded and an
+    unbounded (max_pending=0) queue.
+    """
+    hasher = PasswordHasher('pbkdf2:sha256:1000', workers=1, max_pending=max_pending)
+    testing_app.extensions['password_hasher'] = hasher
+
+    try:
+        client.post('/register', json={'email': 'test@example.com', 'password': 'password'})
+        response = client.post('/login', json={'email': 'test@example.com', 'password': 'password'})
+        invalid_response = client.post('/login', json={'email': 'test@example.com', 'password': 'wrong-password'})
+    finally:
+        hasher.shutdown()
+
+    assert response.status_code == 200
+    assert 'token' in response.get_json()
+    assert invalid_response.status_code == 401
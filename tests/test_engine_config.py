@@ -0,0 +1,141 @@
+"""
+Unit tests for the engine configuration and pool metrics using pytest.
+
+Fixtures:
+    - app: Sets up and tears down a Flask application on a SQLite file with a one connection pool.
+
+Tests:
+    - test_engine_options_defaults: Tests the engine options without DB_* variables.
+    - test_engine_options_from_env: Tests that the DB_* variables set the engine options.
+    - test_env_flag: Tests reading booleans from the environment.
+    - test_engine_report: Tests the startup report of the engine configuration.
+    - test_pool_metrics_checkouts: Tests that checkouts and connections in use are counted.
+    - test_pool_metrics_wait_and_timeout: Tests that the wait on an exhausted pool is measured.
+"""
+
+import pytest
+from flask import Flask
+from sqlalchemy import exc, text
+
+from app.config.base_config import engine_options_from_env, env_flag
+from app.extensions import db, engine_report
+from app.extensions.pool_metrics import PoolMetrics
+
+
+@pytest.fixture
+def app(tmp_path):
+    """
+    Set up and tear down a Flask application on a SQLite file with a one connection pool.
+    """
+    app = Flask(__name__)
+    app.config['TESTING'] = True
+    app.config['SQLALCHEMY_DATABASE_URI'] = f'sqlite:///{tmp_path / "tasks.db"}'
+    app.config['SQLALCHEMY_ENGINE_OPTIONS'] = {'pool_size': 1, 'max_overflow': 0, 'pool_timeout': 1}
+    db.init_app(app)
+
+    with app.app_context():
+        yield app
+
+
+@pytest.fixture(autouse=True)
+def clean_env(monkeypatch):
+    """
+    Remove the DB_* variables of the environment running the tests.
+    """
+    for variable in ('DB_POOL_SIZE', 'DB_MAX_OVERFLOW', 'DB_POOL_TIMEOUT', 'DB_POOL_PRE_PING', 'DB_POOL_RECYCLE',
+                     'DB_STATEMENT_CACHE_SIZE'):
+        monkeypatch.delenv(variable, raising=False)
+
+
+def test_engine_options_defaults():
+    """
+    Test the engine options without DB_* variables.
+    """
+    assert engine_options_from_env() == {'pool_pre_ping': True, 'pool_recycle': 3600, 'query_cache_size': 500}
+
+
+def test_engine_options_from_env(monkeypatch):
+    """
+    Test that the DB_* variables set the engine options.
+    """
+    monkeypatch.setenv('DB_POOL_SIZE', '20')
+    monkeypatch.setenv('DB_MAX_OVERFLOW', '5')
+    monkeypatch.setenv('DB_POOL_TIMEOUT', '3')
+    monkeypatch.setenv('DB_POOL_PRE_PING', 'false')
+    monkeypatch.setenv('DB_POOL_RECYCLE', '600')
+    monkeypatch.setenv('DB_STATEMENT_CACHE_SIZE', '1000')
+
+    assert engine_options_from_env() == {
+        'pool_pre_ping': False,
+        'pool_recycle': 600,
+        'query_cache_size': 1000,
+        'pool_size': 20,
+        'max_overflow': 5,
+        'pool_timeout': 3,
+    }
+
+
+def test_env_flag(monkeypatch):
+    """
+    Test reading booleans from the environment.
+    """
+    assert env_flag('TEST_FLAG', True) is True
+
+    for value, expected in (('1', True), ('Yes', True), ('on', True), ('0', False), ('false', False)):
+        monkeypatch.setenv('TEST_FLAG', value)
+
+        assert env_flag('TEST_FLAG', not expected) is expected
+
+
+def test_engine_report(app):
+    """
+    Test the startup report of the engine configuration.
+    """
+    report = engine_report(app)
+
+    assert report['dialect'] == 'sqlite+pysqlite'
+    assert report['pool'] == 'QueuePool'
+    assert report['echo'] is False
+    assert report['engine_options'] == {'pool_size': 1, 'max_overflow': 0, 'pool_timeout': 1}
+    assert report['sqlite_single_writer'] is False
+
+
+def test_pool_metrics_checkouts(app):
+    """
+    Test that checkouts and connections in use are counted.
+    """
+    metrics = PoolMetrics()
+    metrics.instrument(db.engine)
+
+    with db.engine.connect() as conn:
+        conn.execute(text('SELECT 1'))
+
+        assert metrics.stats()['default']['checked_out'] == 1
+
+    with db.engine.connect() as conn:
+        conn.execute(text('SELECT 1'))
+
+    stats = metrics.stats()['default']
+
+    assert stats['checkouts'] == 2
+    assert stats['checked_out'] == 0
+    assert stats['max_checked_out'] == 1
+    assert stats['connects'] == 1
+    assert stats['size'] == 1
+
+
+def test_pool_metrics_wait_and_timeout(app):
+    """
+    Test that the wait on an exhausted pool is measured.
+    """
+    metrics = PoolMetrics()
+    metrics.instrument(db.engine)
+
+    with db.engine.connect():
+        with pytest.raises(exc.TimeoutError):
+            db.engine.connect()
+
+    stats = metrics.stats()['default']
+
+    assert stats['timeouts'] == 1
+    assert stats['wait_seconds_max'] >= 1
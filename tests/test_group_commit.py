@@ -0,0 +1,235 @@
+"""
+Unit tests for the group commit of task creations using pytest.
+
+Fixtures:
+    - app: Sets up and tears down a Flask application on a SQLite file with group commit on.
+    - client, user: The shared fixtures of conftest.py.
+
+Tests:
+    - test_create_task_group_commit: Tests that a task created through group commit is returned and stored.
+    - test_concurrent_creations_share_commits: Tests that concurrent creations are committed together.
+    - test_failing_item_fails_alone: Tests that a failing item only fails its own caller.
+    - test_timed_out_item_is_not_written: Tests that an item still queued when its caller times out is never written.
+    - test_stuck_write_times_out: Tests that a caller stops waiting for a write that does not finish.
+    - test_thread_survives_errors: Tests that the batching thread keeps serving after a failed rollback.
+    - test_exited_thread_is_restarted: Tests that a batching thread that exited is started again.
+"""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from flask import Flask
+from sqlalchemy import func, select
+
+from app.extensions import db
+from app.models import Task
+from app.routes import tasks_blueprint, auth_blueprint
+from app.services.group_commit import GroupCommitTimeout, GroupCommitter, task_group_commit
+
+
+@pytest.fixture
+def app(tmp_path):
+    """
+    Set up and tear down a Flask application on a SQLite file with group commit on.
+    """
+    app = Flask(__name__)
+    app.config['TESTING'] = True
+    app.config['SQLALCHEMY_DATABASE_URI'] = f'sqlite:///{tmp_path / "tasks.db"}'
+    app.config['TASKS_GROUP_COMMIT'] = True
+    app.config['TASKS_GROUP_COMMIT_WINDOW'] = 0.05
+    db.init_app(app)
+    task_group_commit.init_app(app)
+    app.register_blueprint(auth_blueprint, url_prefix='/auth')
+    app.register_blueprint(tasks_blueprint, url_prefix='/tasks')
+
+    with app.app_context():
+        db.create_all()
+        yield app
+        task_group_commit.shutdown()
+        task_group_commit.enabled = False
+        db.drop_all()
+
+
+def test_create_task_group_commit(client, user):
+    """
+    Test that a task created through group commit is returned and stored.
+    """
+    response = client.post('/tasks/', headers={'Authorization': user}, json={'title': 'Task', 'description': 'Task'})
+
+    assert response.status_code == 201
+
+    json_data = response.get_json()
+
+    assert json_data['title'] == 'Task'
+    assert json_data['change_seq'] == 1
+
+    response = client.get(f"/tasks/{json_data['id']}", headers={'Authorization': user})
+
+    assert response.status_code == 200
+
+
+def test_concurrent_creations_share_commits(app, user):
+    """
+    Test that concurrent creations are committed together.
+    """
+    def create(i):
+        with app.test_client() as client:
+            return client.post('/tasks/', headers={'Authorization': user},
+                               json={'title': f'Task {i}', 'description': f'Task {i}'}).status_code
+
+    batches = task_group_commit.batches
+
+    with ThreadPoolExecutor(max_workers=16) as executor:
+        statuses = list(executor.map(create, range(32)))
+
+    assert statuses == [201] * 32
+    assert db.session.scalar(select(func.count(func.distinct(Task.change_seq)))) == 32
+    assert task_group_commit.batches - batches < 32
+
+
+def test_failing_item_fails_alone(app):
+    """
+    Test that a failing item only fails its own caller.
+    """
+    def write(user_id, items):
+        if any(item == 'bad' for item in items):
+            raise ValueError('bad item')
+
+        return [{'status': 201, 'item': item} for item in items]
+
+    committer = GroupCommitter(write)
+    committer.init_app(app)
+    committer.window = 0.1
+    results = {}
+
+    def submit(item):
+        try:
+            results[item] = committer.submit('user', item)
+        except ValueError as e:
+            results[item] = str(e)
+
+    threads = [threading.Thread(target=submit, args=(item,)) for item in ('a', 'bad', 'b')]
+
+    for thread in threads:
+        thread.start()
+
+    for thread in threads:
+        thread.join()
+
+    committer.shutdown()
+
+    assert results == {'a': {'status': 201, 'item': 'a'}, 'bad': 'bad item', 'b': {'status': 201, 'item': 'b'}}
+
+
+def test_timed_out_item_is_not_written(app):
+    """
+    Test that an item still queued when its caller times out is never written, so the caller can
+    safely retry, while an item already being written is waited for.
+    """
+    writing = threading.Event()
+    release = threading.Event()
+    written = []
+
+    def write(user_id, items):
+        writing.set()
+        release.wait(5)
+        written.extend(items)
+
+        return [{'status': 201, 'item': item} for item in items]
+
+    committer = GroupCommitter(write)
+    committer.init_app(app)
+    committer.max_items = 1
+    committer.timeout = 0.5
+    results = {}
+
+    def submit(item):
+        try:
+            results[item] = committer.submit('user', item)
+        except GroupCommitTimeout:
+            results[item] = 'timeout'
+
+    first = threading.Thread(target=submit, args=('a',))
+    first.start()
+
+    writing.wait(5)
+    submit('b')
+    release.set()
+    first.join()
+    committer.shutdown()
+
+    assert results == {'a': {'status': 201, 'item': 'a'}, 'b': 'timeout'}
+    assert written == ['a']
+
+
+def test_stuck_write_times_out(app):
+    """
+    Test that a caller stops waiting for a write that does not finish, learning that it may have
+    been written.
+    """
+    release = threading.Event()
+
+    def write(user_id, items):
+        release.wait(5)
+
+        return [{'status': 201, 'item': item} for item in items]
+
+    committer = GroupCommitter(write)
+    committer.init_app(app)
+    committer.timeout = 0.1
+
+    with pytest.raises(GroupCommitTimeout) as excinfo:
+        committer.submit('user', 'a')
+
+    release.set()
+    committer.shutdown()
+
+    assert excinfo.value.withdrawn is False
+
+
+def test_thread_survives_errors(app, monkeypatch):
+    """
+    Test that the batching thread keeps serving after a failed rollback, failing only the items of
+    that batch.
+    """
+    def write(user_id, items):
+        if 'bad' in items:
+            raise ValueError('bad item')
+
+        return [{'status': 201, 'item': item} for item in items]
+
+    def rollback():
+        raise RuntimeError('rollback failed')
+
+    committer = GroupCommitter(write)
+    committer.init_app(app)
+    committer.timeout = 5
+    monkeypatch.setattr(db.session, 'rollback', rollback)
+
+    with pytest.raises(RuntimeError):
+        committer.submit('user', 'bad')
+
+    monkeypatch.undo()
+
+    assert committer.submit('user', 'a') == {'status': 201, 'item': 'a'}
+
+    committer.shutdown()
+
+
+def test_exited_thread_is_restarted(app):
+    """
+    Test that a batching thread that exited is started again by the next caller.
+    """
+    committer = GroupCommitter(lambda user_id, items: [{'status': 201, 'item': item} for item in items])
+    committer.init_app(app)
+    committer.timeout = 5
+
+    assert committer.submit('user', 'a') == {'status': 201, 'item': 'a'}
+
+    committer._queue.put(None)
+    committer._thread.join()
+
+    assert committer.submit('user', 'b') == {'status': 201, 'item': 'b'}
+
+    committer.shutdown()
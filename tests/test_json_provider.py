@@ -0,0 +1,75 @@
+"""
+Unit tests for the JSON provider using pytest.
+
+Fixtures:
+    - app: Flask application using the JSON provider, parametrized with and without orjson.
+
+Tests:
+    - test_dumps_uuid_and_datetime: Tests that UUIDs and dates are serialized as strings.
+    - test_loads: Tests deserializing strings and bytes.
+    - test_response: Tests building a JSON response.
+    - test_dumps_unsupported_type: Tests that unsupported types raise a TypeError.
+"""
+import json
+import uuid
+from datetime import date, datetime
+
+import pytest
+from flask import Flask
+
+from app.utils.json_provider import FastJSONProvider, orjson
+
+
+@pytest.fixture(params=['orjson', 'json'])
+def app(request, monkeypatch):
+    """
+    Create a Flask application using the JSON provider, with orjson and with the stdlib fallback.
+    """
+    if request.param == 'orjson' and orjson is None:
+        pytest.skip('orjson is not installed')
+
+    monkeypatch.setattr(FastJSONProvider, 'use_orjson', request.param == 'orjson')
+
+    app = Flask(__name__)
+    app.json = FastJSONProvider(app)
+
+    return app
+
+
+def test_dumps_uuid_and_datetime(app):
+    """
+    Test that UUIDs and dates are serialized as strings.
+    """
+    task_id = uuid.uuid4()
+    created_at = datetime(2024, 5, 17, 10, 30, 15, 123456)
+
+    data = json.loads(app.json.dumps({'id': task_id, 'created_at': created_at, 'day': created_at.date()}))
+
+    assert data == {'id': str(task_id), 'created_at': '2024-05-17T10:30:15.123456', 'day': '2024-05-17'}
+
+
+def test_loads(app):
+    """
+    Test deserializing strings and bytes.
+    """
+    assert app.json.loads('{"title": "Task"}') == {'title': 'Task'}
+    assert app.json.loads(b'[1, 2]') == [1, 2]
+
+
+def test_response(app):
+    """
+    Test building a JSON response.
+    """
+    with app.app_context():
+        response = app.json.response({'id': uuid.UUID(int=1), 'day': date(2024, 1, 2)})
+
+    assert response.mimetype == 'application/json'
+    assert response.get_json() == {'id': '00000000-0000-0000-0000-000000000001', 'day': '2024-01-02'}
+
+
+def test_dumps_unsupported_type(app):
+    """
+    Test that unsupported types raise a TypeError.
+    """
+    with pytest.raises(TypeError):
+        app.json.dumps({'value': object()})
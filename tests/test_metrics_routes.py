@@ -0,0 +1,153 @@
+"""
+Unit tests for the Prometheus metrics endpoint using pytest.
+
+Fixtures:
+    - app: Sets up and tears down the Flask testing application with request timing and metrics.
+    - client, user: The shared fixtures of conftest.py.
+
+Tests:
+    - test_metrics_request_counts: Tests the request counts and latency histograms per route.
+    - test_metrics_pools_and_caches: Tests the pool and token cache metrics.
+    - test_metrics_response_cache: Tests the response cache hit ratio, size and eviction metrics.
+    - test_metrics_in_flight: Tests that finished requests leave the in-flight gauge unchanged.
+    - test_metrics_token: Tests that a configured token is required.
+    - test_metrics_multiprocess: Tests that the metrics are read from the multiprocess directory when set.
+"""
+
+import pytest
+from flask import Flask
+from prometheus_client import REGISTRY
+
+from app.extensions import db, metrics, pool_metrics, request_timing, response_cache
+from app.routes import tasks_blueprint, auth_blueprint
+from app.routes.metrics import metrics_blueprint
+from app.utils.json_provider import FastJSONProvider
+
+
+@pytest.fixture
+def app():
+    """
+    Set up and tear down the Flask testing application with request timing and metrics.
+    """
+    app = Flask(__name__)
+    app.json = FastJSONProvider(app)
+    app.config['TESTING'] = True
+    app.config['SQLALCHEMY_DATABASE_URI'] = 'sqlite:///:memory:'
+    db.init_app(app)
+    pool_metrics.init_app(app)
+    request_timing.init_app(app)
+    metrics.init_app(app)
+    app.register_blueprint(auth_blueprint, url_prefix='/auth')
+    app.register_blueprint(tasks_blueprint, url_prefix='/tasks')
+    app.register_blueprint(metrics_blueprint, url_prefix='/metrics')
+
+    with app.app_context():
+        db.create_all()
+        yield app
+        db.drop_all()
+
+
+def sample(name: str, **labels) -> float:
+    """
+    Return the current value of a metric sample, 0 if it was never recorded.
+    """
+    return REGISTRY.get_sample_value(name, labels) or 0.0
+
+
+def test_metrics_request_counts(client, user):
+    """
+    Test the request counts and latency histograms per route.
+    """
+    labels = {'blueprint': 'tasks', 'endpoint': 'tasks.get_tasks'}
+    requests = sample('http_requests_total', method='GET', status='200', **labels)
+    observations = sample('http_request_duration_seconds_count', **labels)
+
+    for _ in range(3):
+        client.get('/tasks/', headers={'Authorization': user})
+
+    response = client.get('/metrics')
+    body = response.get_data(as_text=True)
+
+    assert response.status_code == 200
+    assert response.content_type.startswith('text/plain')
+    assert sample('http_requests_total', method='GET', status='200', **labels) == requests + 3
+    assert sample('http_request_duration_seconds_count', **labels) == observations + 3
+    assert 'http_request_duration_seconds_bucket{blueprint="auth",endpoint="auth.login",le="0.001"}' in body
+    assert 'http_request_phase_seconds_count{endpoint="tasks.get_tasks",phase="jwt"}' in body
+    assert sample('db_statements_total', endpoint='tasks.get_tasks') >= 3
+
+
+def test_metrics_pools_and_caches(client, user):
+    """
+    Test the pool and token cache metrics.
+    """
+    checkouts = sample('db_pool_checkouts_total', engine='default')
+    hits = sample('token_cache_hits_total')
+
+    client.get('/tasks/', headers={'Authorization': user})
+    client.get('/tasks/', headers={'Authorization': user})
+    client.get('/metrics')
+
+    assert sample('db_pool_checkouts_total', engine='default') > checkouts
+    assert sample('token_cache_hits_total') > hits
+    assert sample('token_cache_size') >= 1
+
+
+def test_metrics_response_cache(app, client, user):
+    """
+    Test the response cache hit ratio, size and eviction metrics.
+    """
+    response_cache.init_app(app)
+    evictions = sample('response_cache_evictions_total')
+    hits = sample('response_cache_hits_total')
+
+    try:
+        client.post('/tasks/', headers={'Authorization': user}, json={'title': 'A', 'description': 'B'})
+        client.get('/tasks/', headers={'Authorization': user})
+        response_cache.backend.max_bytes = response_cache.backend.stats()['bytes']
+        client.get('/tasks/summary', headers={'Authorization': user})
+        client.get('/tasks/summary', headers={'Authorization': user})
+        metrics.sync()
+    finally:
+        response_cache.enabled = False
+
+    assert sample('response_cache_hits_total') == hits + 1
+    assert sample('response_cache_hit_ratio') == pytest.approx(1 / 3)
+    assert sample('response_cache_evictions_total') == evictions + 1
+    assert sample('response_cache_entries') == 1
+    assert 0 < sample('response_cache_bytes') <= response_cache.backend.max_bytes
+
+
+def test_metrics_in_flight(client, user):
+    """
+    Test that finished requests leave the in-flight gauge unchanged.
+    """
+    in_flight = sample('http_requests_in_flight')
+
+    client.get('/tasks/', headers={'Authorization': user})
+
+    assert sample('http_requests_in_flight') == in_flight
+    assert 'http_requests_in_flight' in client.get('/metrics').get_data(as_text=True)
+
+
+def test_metrics_token(app, client):
+    """
+    Test that a configured token is required.
+    """
+    app.config['METRICS_TOKEN'] = 'scrape-secret'
+
+    assert client.get('/metrics').status_code == 401
+    assert client.get('/metrics', headers={'Authorization': 'Bearer wrong'}).status_code == 401
+    assert client.get('/metrics', headers={'Authorization': 'Bearer scrape-secret'}).status_code == 200
+
+
+def test_metrics_multiprocess(client, monkeypatch, tmp_path):
+    """
+    Test that the metrics are read from the multiprocess directory when set.
+    """
+    monkeypatch.setenv('PROMETHEUS_MULTIPROC_DIR', str(tmp_path))
+
+    response = client.get('/metrics')
+
+    assert response.status_code == 200
+    assert 'http_requests_total' not in response.get_data(as_text=True)
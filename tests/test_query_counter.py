@@ -0,0 +1,132 @@
+"""
+Unit tests for the SQL statement counter, query budgets and N+1 guard using pytest.
+
+Fixtures:
+    - app: Sets up and tears down the Flask testing application with the query guard.
+    - client, user: The shared fixtures of conftest.py.
+
+Tests:
+    - test_assert_max_queries: Tests the shared fixture on a batch creation.
+    - test_assert_max_queries_exceeded: Tests that exceeding the limit fails with the repeated statements.
+    - test_max_queries_view: Tests that a view over its budget raises in testing and warns otherwise.
+    - test_query_guard_warns: Tests the warning of a request repeating the same statement.
+    - test_statement_shape: Tests that IN lists and whitespace are collapsed.
+"""
+
+import logging
+
+import pytest
+from flask import Flask, jsonify
+from sqlalchemy import select
+
+from app.extensions import db, max_queries, query_guard
+from app.extensions.query_counter import TooManyQueries, statement_shape
+from app.models import Task
+from app.routes import tasks_blueprint, auth_blueprint
+
+
+@pytest.fixture
+def app():
+    """
+    Set up and tear down the Flask testing application with the query guard.
+    """
+    app = Flask(__name__)
+    app.config['TESTING'] = True
+    app.config['SQLALCHEMY_DATABASE_URI'] = 'sqlite:///:memory:'
+    app.config['QUERY_GUARD_THRESHOLD'] = 3
+    db.init_app(app)
+    query_guard.init_app(app)
+    app.register_blueprint(auth_blueprint, url_prefix='/auth')
+    app.register_blueprint(tasks_blueprint, url_prefix='/tasks')
+
+    @app.route('/one-by-one')
+    @max_queries(2)
+    def one_by_one():
+        ids = db.session.execute(select(Task.id)).scalars().all()
+        return jsonify([db.session.get(Task, task_id).title for task_id in ids])
+
+    with app.app_context():
+        db.create_all()
+        yield app
+        db.drop_all()
+
+
+def create_tasks(client, token, count):
+    """
+    Create tasks through the batch endpoint.
+    """
+    client.post('/tasks/batch', headers={'Authorization': token}, json={
+        'tasks': [{'title': f'Task {i}', 'description': f'Task {i}'} for i in range(count)],
+    })
+
+
+def test_assert_max_queries(client, user, assert_max_queries):
+    """
+    Test the shared fixture on a batch creation.
+    """
+    with assert_max_queries(2) as counter:
+        create_tasks(client, user, 50)
+
+    assert 1 <= counter.count <= 2
+
+
+def test_assert_max_queries_exceeded(client, user, assert_max_queries):
+    """
+    Test that exceeding the limit fails with the repeated statements.
+    """
+    with pytest.raises(TooManyQueries, match=r'ran 3 statements, more than its limit of 2'):
+        with assert_max_queries(2):
+            for _ in range(3):
+                client.get('/tasks/changes', headers={'Authorization': user})
+
+
+def test_max_queries_view(app, client, user, caplog):
+    """
+    Test that a view over its budget raises in testing and warns otherwise.
+    """
+    create_tasks(client, user, 3)
+
+    with pytest.raises(TooManyQueries, match=r'one_by_one ran 4 statements'):
+        client.get('/one-by-one')
+
+    app.testing = False
+
+    with caplog.at_level(logging.WARNING, logger='app.extensions.query_counter'):
+        response = client.get('/one-by-one')
+
+    assert response.status_code == 200
+    assert 'one_by_one ran 4 statements, more than its limit of 2' in caplog.text
+
+
+def test_query_guard_warns(app, client, user, caplog):
+    """
+    Test the warning of a request repeating the same statement.
+    """
+    create_tasks(client, user, 3)
+    app.testing = False
+
+    with caplog.at_level(logging.WARNING, logger='app.extensions.query_counter'):
+        client.get('/tasks/', headers={'Authorization': user})
+
+    assert 'Possible N+1' not in caplog.text
+
+    with caplog.at_level(logging.WARNING, logger='app.extensions.query_counter'):
+        client.get('/one-by-one')
+
+    assert 'Possible N+1 query: GET one_by_one ran the same statement 3 times' not in caplog.text
+    create_tasks(client, user, 1)
+
+    with caplog.at_level(logging.WARNING, logger='app.extensions.query_counter'):
+        client.get('/one-by-one')
+
+    assert 'Possible N+1 query: GET one_by_one ran the same statement 4 times' in caplog.text
+
+
+def test_statement_shape():
+    """
+    Test that IN lists and whitespace are collapsed.
+    """
+    assert statement_shape('SELECT *\n  FROM tasks WHERE id IN (?, ?, ?)') == 'SELECT * FROM tasks WHERE id IN (?)'
+    assert statement_shape('SELECT * FROM tasks WHERE id IN (?)') == 'SELECT * FROM tasks WHERE id IN (?)'
+    assert statement_shape('DELETE FROM tasks WHERE id IN (%(id_1)s, %(id_2)s)') == \
+        'DELETE FROM tasks WHERE id IN (?)'
@@ -0,0 +1,125 @@
+"""
+Query plan tests for the task access paths using pytest.
+
+Every statement the tasks endpoints run against the tasks table is captured and explained with
+EXPLAIN QUERY PLAN on SQLite. A full table scan or a temporary sort means an index is missing;
+only a full-text search may sort its matches by rank.
+
+Fixtures:
+    - app, client, user: The shared fixtures of conftest.py.
+    - statements: Captures the SQL statements executed against the tasks table.
+
+Tests:
+    - test_task_routes_use_indexes: Tests that every tasks endpoint is served by an index.
+    - test_incomplete_tasks_use_partial_index: Tests that listing incomplete tasks uses the partial index.
+"""
+
+import uuid
+
+import pytest
+from sqlalchemy import event, select, text
+
+from app.extensions import db
+from app.models import Task
+
+
+@pytest.fixture
+def statements(app):
+    """
+    Capture the SQL statements, with their parameters, executed against the tasks and tombstones tables.
+    """
+    captured = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        if ('tasks' in statement or 'task_tombstones' in statement) and not statement.lstrip().upper().startswith(('INSERT', 'EXPLAIN')):
+            captured.append((statement, parameters))
+
+    event.listen(db.engine, 'before_cursor_execute', capture)
+    yield captured
+    event.remove(db.engine, 'before_cursor_execute', capture)
+
+
+def explain(statement, parameters) -> list[str]:
+    """
+    Run EXPLAIN QUERY PLAN for a statement and return the plan details.
+    """
+    with db.engine.connect() as conn:
+        rows = conn.exec_driver_sql(f'EXPLAIN QUERY PLAN {statement}', parameters).all()
+
+    return [row[-1] for row in rows]
+
+
+def assert_indexed(statement, parameters) -> None:
+    """
+    Assert that the plan of a statement has neither a table scan nor a temporary sort. A full-text
+    lookup through its virtual table index is not a scan, and the matches of a full-text search may
+    be sorted by rank.
+    """
+    plan = explain(statement, parameters)
+    ranked = ' MATCH ' in statement
+
+    assert plan, statement
+
+    for detail in plan:
+        assert not detail.startswith('SCAN') or 'VIRTUAL TABLE INDEX' in detail, f'{detail} in plan of {statement}'
+        assert 'TEMP B-TREE' not in detail or (ranked and detail == 'USE TEMP B-TREE FOR ORDER BY'), \
+            f'{detail} in plan of {statement}'
+
+
+def test_task_routes_use_indexes(client, user, statements):
+    """
+    Test that every tasks endpoint is served by an index.
+    """
+    headers = {'Authorization': user}
+
+    for i in range(3):
+        client.post('/tasks/', headers=headers, json={'title': f'Task {i}', 'description': f'Task {i}'})
+
+    first_page = client.get('/tasks/?limit=2', headers=headers).get_json()
+    client.get('/tasks/', headers=headers, query_string={'limit': 2, 'cursor': first_page['next_cursor']})
+
+    for sort in ('-created_at', 'title', '-title'):
+        page = client.get('/tasks/', headers=headers, query_string={'limit': 2, 'sort': sort}).get_json()
+        client.get('/tasks/', headers=headers, query_string={'limit': 2, 'sort': sort, 'cursor': page['next_cursor']})
+
+    client.get('/tasks/', headers=headers, query_string={'completed': 'false', 'fields': 'id,title'})
+    client.get('/tasks/search', headers=headers, query_string={'q': 'task', 'limit': 2})
+    client.get('/tasks/summary', headers=headers)
+    client.get('/tasks/summary', headers=headers,
+               query_string={'created_after': '2026-01-01T00:00:00', 'created_before': '2099-01-01T00:00:00'})
+
+    task_id = first_page['tasks'][0]['id']
+
+    client.get(f'/tasks/{task_id}', headers=headers)
+    client.put(f'/tasks/{task_id}', headers=headers, json={'completed': True})
+    client.delete(f'/tasks/{task_id}', headers=headers)
+    client.get('/tasks/changes', headers=headers)
+    client.get('/tasks/changes', headers=headers, query_string={'since': 1})
+
+    assert statements
+
+    for statement, parameters in statements:
+        assert_indexed(statement, parameters)
+
+
+def test_incomplete_tasks_use_partial_index(app, statements):
+    """
+    Test that listing incomplete tasks is served by the partial index once statistics are gathered.
+    """
+    user_id = uuid.uuid4()
+
+    db.session.add_all(Task(title=f'Task {i}', description=f'Task {i}', completed=i % 10 != 0, user_id=user_id)
+                       for i in range(100))
+    db.session.commit()
+    db.session.execute(text('ANALYZE'))
+
+    query = (select(Task)
+             .where(Task.user_id == user_id, Task.completed == False)  # noqa: E712
+             .order_by(Task.created_at, Task.id))
+    db.session.execute(query).all()
+
+    statement, parameters = statements[-1]
+    plan = explain(statement, parameters)
+
+    assert_indexed(statement, parameters)
+    assert any('ix_tasks_user_id_created_at_id_incomplete' in detail for detail in plan)
@@ -0,0 +1,150 @@
+"""
+Unit tests for the read replica routing using pytest, with two SQLite files as primary and replica.
+
+Fixtures:
+    - app: Sets up and tears down a Flask application with a primary and a replica database.
+    - replica: Returns the replica engine.
+    - client, user: The shared fixtures of conftest.py.
+
+Tests:
+    - test_read_only_routes_use_replica: Tests that read-only routes read from the replica.
+    - test_writes_use_primary: Tests that writes go to the primary.
+    - test_read_your_writes: Tests that a user reads from the primary right after writing.
+    - test_read_your_writes_window_expires: Tests that reads go back to the replica after the window.
+    - test_read_your_writes_cookie: Tests that the window travels with the client's signed cookie.
+"""
+
+import uuid
+from datetime import datetime
+
+import pytest
+from flask import Flask
+from sqlalchemy import insert, select
+
+from app.extensions import db, db_router
+from app.extensions.db import READ_YOUR_WRITES_COOKIE, REPLICAS_EXTENSION_KEY
+from app.models import Task
+from app.routes import tasks_blueprint, auth_blueprint
+from app.utils.token import verify_token
+
+
+@pytest.fixture
+def app(tmp_path):
+    """
+    Set up and tear down a Flask application with a primary and a replica database.
+    """
+    app = Flask(__name__)
+    app.config['TESTING'] = True
+    app.config['SQLALCHEMY_DATABASE_URI'] = f'sqlite:///{tmp_path / "primary.db"}'
+    app.config['DATABASE_REPLICA_URLS'] = [f'sqlite:///{tmp_path / "replica.db"}']
+    db.init_app(app)
+    db_router.init_app(app)
+    app.register_blueprint(auth_blueprint, url_prefix='/auth')
+    app.register_blueprint(tasks_blueprint, url_prefix='/tasks')
+
+    with app.app_context():
+        db.create_all()
+        db.metadata.create_all(app.extensions[REPLICAS_EXTENSION_KEY][0])
+        yield app
+        db.drop_all()
+
+
+@pytest.fixture
+def replica(app):
+    """
+    Return the replica engine.
+    """
+    return app.extensions[REPLICAS_EXTENSION_KEY][0]
+
+
+def insert_replica_task(replica, token, title):
+    """
+    Insert a task into the replica only and return its ID.
+    """
+    task_id = uuid.uuid4()
+    now = datetime.now()
+
+    with replica.begin() as conn:
+        conn.execute(insert(Task), {'id': task_id, 'title': title, 'description': title, 'completed': False,
+                                    'created_at': now, 'updated_at': now, 'change_seq': 1,
+                                    'user_id': uuid.UUID(verify_token(token))})
+
+    return str(task_id)
+
+
+def test_read_only_routes_use_replica(client, user, replica):
+    """
+    Test that read-only routes read from the replica.
+    """
+    headers = {'Authorization': user}
+    task_id = insert_replica_task(replica, user, 'Replica task')
+
+    assert [task['id'] for task in client.get('/tasks/', headers=headers).get_json()['tasks']] == [task_id]
+    assert client.get(f'/tasks/{task_id}', headers=headers).status_code == 200
+    assert task_id in client.get('/tasks/export', headers=headers).get_data(as_text=True)
+    assert [task['id'] for task in client.get('/tasks/changes', headers=headers).get_json()['changed']] == [task_id]
+
+
+def test_writes_use_primary(app, client, user, replica):
+    """
+    Test that writes go to the primary.
+    """
+    response = client.post('/tasks/', headers={'Authorization': user}, json={'title': 'Task', 'description': 'Task'})
+
+    assert response.status_code == 201
+    assert db.session.scalar(select(Task.title)) == 'Task'
+
+    with replica.connect() as conn:
+        assert conn.scalar(select(Task.title)) is None
+
+
+def test_read_your_writes(client, user, replica):
+    """
+    Test that a user reads from the primary right after writing.
+    """
+    headers = {'Authorization': user}
+    insert_replica_task(replica, user, 'Replica task')
+
+    task_id = client.post('/tasks/', headers=headers, json={'title': 'Task', 'description': 'Task'}).get_json()['id']
+
+    assert [task['id'] for task in client.get('/tasks/', headers=headers).get_json()['tasks']] == [task_id]
+    assert client.get(f'/tasks/{task_id}', headers=headers).status_code == 200
+
+
+def test_read_your_writes_window_expires(app, client, user, replica):
+    """
+    Test that reads go back to the replica after the window.
+    """
+    app.config['DATABASE_READ_YOUR_WRITES_SECONDS'] = 0
+    headers = {'Authorization': user}
+    replica_task_id = insert_replica_task(replica, user, 'Replica task')
+
+    client.post('/tasks/', headers=headers, json={'title': 'Task', 'description': 'Task'})
+
+    assert [task['id'] for task in client.get('/tasks/', headers=headers).get_json()['tasks']] == [replica_task_id]
+
+
+def test_read_your_writes_cookie(app, client, user, replica):
+    """
+    Test that the window travels with the client's signed cookie rather than the worker's memory, so
+    it holds on any worker, and that a missing or forged cookie reads from the replica.
+    """
+    headers = {'Authorization': user}
+    replica_task_id = insert_replica_task(replica, user, 'Replica task')
+
+    response = client.post('/tasks/', headers=headers, json={'title': 'Task', 'description': 'Task'})
+    cookie = client.get_cookie(READ_YOUR_WRITES_COOKIE)
+
+    assert response.status_code == 201
+    assert cookie is not None and cookie.http_only
+
+    for value, expected in ((cookie.value, response.get_json()['id']), (None, replica_task_id),
+                            (cookie.value + 'x', replica_task_id)):
+        other_client = app.test_client()
+
+        if value is not None:
+            other_client.set_cookie(READ_YOUR_WRITES_COOKIE, value)
+
+        tasks = other_client.get('/tasks/', headers=headers).get_json()['tasks']
+
+        assert [task['id'] for task in tasks] == [expected]
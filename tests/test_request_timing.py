@@ -0,0 +1,131 @@
+"""
+Unit tests for the request timing instrumentation using pytest.
+
+Fixtures:
+    - app: Sets up and tears down the Flask testing application with request timing.
+    - client, user: The shared fixtures of conftest.py.
+
+Tests:
+    - test_server_timing_header: Tests the Server-Timing breakdown of a tasks request.
+    - test_server_timing_auth: Tests that password hashing and token creation are timed on login.
+    - test_endpoint_histograms: Tests that timings are aggregated per endpoint.
+    - test_server_timing_header_disabled: Tests that the header can be turned off.
+    - test_histogram: Tests the cumulative bucket counts of a histogram.
+"""
+
+import re
+
+import pytest
+from flask import Flask
+
+from app.extensions import db, request_timing
+from app.extensions.timing import Histogram
+from app.routes import tasks_blueprint, auth_blueprint
+from app.utils.json_provider import FastJSONProvider
+
+
+@pytest.fixture
+def app():
+    """
+    Set up and tear down the Flask testing application with request timing.
+    """
+    app = Flask(__name__)
+    app.json = FastJSONProvider(app)
+    app.config['TESTING'] = True
+    app.config['SQLALCHEMY_DATABASE_URI'] = 'sqlite:///:memory:'
+    db.init_app(app)
+    request_timing.init_app(app)
+    request_timing.reset()
+    app.register_blueprint(auth_blueprint, url_prefix='/auth')
+    app.register_blueprint(tasks_blueprint, url_prefix='/tasks')
+
+    with app.app_context():
+        db.create_all()
+        yield app
+        db.drop_all()
+        request_timing.header = True
+
+
+def parse_server_timing(header: str) -> dict:
+    """
+    Parse a Server-Timing header into the duration and description of each metric.
+    """
+    metrics = {}
+
+    for entry in header.split(', '):
+        name, *params = entry.split(';')
+        values = dict(param.split('=', 1) for param in params)
+        metrics[name] = (float(values['dur']), values.get('desc', '').strip('"'))
+
+    return metrics
+
+
+def test_server_timing_header(client, user):
+    """
+    Test the Server-Timing breakdown of a tasks request.
+    """
+    headers = {'Authorization': user}
+    client.post('/tasks/', headers=headers, json={'title': 'Task', 'description': 'Task'})
+
+    response = client.get('/tasks/', headers=headers)
+    metrics = parse_server_timing(response.headers['Server-Timing'])
+
+    assert {'total', 'jwt', 'db', 'json'} <= set(metrics)
+    assert re.fullmatch(r'\d+ queries', metrics['db'][1])
+    assert int(metrics['db'][1].split()[0]) >= 1
+    assert metrics['total'][0] >= metrics['db'][0]
+
+
+def test_server_timing_auth(client):
+    """
+    Test that password hashing and token creation are timed on login.
+    """
+    client.post('/auth/register', json={'email': 'test@example.com', 'password': 'testpassword'})
+
+    response = client.post('/auth/login', json={'email': 'test@example.com', 'password': 'testpassword'})
+    metrics = parse_server_timing(response.headers['Server-Timing'])
+
+    assert {'total', 'password', 'jwt', 'db'} <= set(metrics)
+    assert metrics['password'][0] > 0
+
+
+def test_endpoint_histograms(client, user):
+    """
+    Test that timings are aggregated per endpoint.
+    """
+    headers = {'Authorization': user}
+
+    for _ in range(3):
+        client.get('/tasks/', headers=headers)
+
+    stats = request_timing.stats()
+
+    assert stats['tasks.get_tasks']['total']['count'] == 3
+    assert stats['tasks.get_tasks']['statements'] >= 3
+    assert stats['tasks.get_tasks']['total']['buckets'][10.0] == 3
+    assert stats['auth.login']['password']['count'] == 1
+
+
+def test_server_timing_header_disabled(client, user):
+    """
+    Test that the header can be turned off.
+    """
+    request_timing.header = False
+
+    response = client.get('/tasks/', headers={'Authorization': user})
+
+    assert 'Server-Timing' not in response.headers
+    assert request_timing.stats()['tasks.get_tasks']['total']['count'] == 1
+
+
+def test_histogram():
+    """
+    Test the cumulative bucket counts of a histogram.
+    """
+    histogram = Histogram(buckets=(0.01, 0.1, 1.0))
+
+    for value in (0.005, 0.05, 0.5, 5.0):
+        histogram.observe(value)
+
+    assert histogram.as_dict() == {'count': 4, 'sum': 5.555, 'mean': 5.555 / 4,
+                                   'buckets': {0.01: 1, 0.1: 2, 1.0: 3}}
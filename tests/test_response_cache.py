@@ -0,0 +1,205 @@
+"""
+Unit tests for the per-user response cache using pytest.
+
+Fixtures:
+    - app: Sets up and tears down the Flask testing application with the response cache enabled.
+    - client, user: The shared fixtures of conftest.py.
+
+Tests:
+    - test_get_tasks_cached: Tests that repeated list reads are served from the cache.
+    - test_get_task_by_id_cached: Tests that repeated task reads are served from the cache.
+    - test_writes_invalidate_cache: Tests that every write invalidates the user's cached reads.
+    - test_cache_follows_other_workers_writes: Tests that a write made elsewhere is never served stale.
+    - test_cache_is_per_user: Tests that users never see each other's cached responses.
+    - test_lru_backend_byte_budget: Tests that the LRU backend evicts to stay within its byte budget.
+    - test_lru_backend_ttl: Tests that the LRU backend expires entries after their TTL.
+"""
+import uuid
+
+import pytest
+from flask import Flask
+from sqlalchemy import select
+
+from app.extensions import db, response_cache
+from app.extensions.cache import LRUCacheBackend
+from app.models import User
+from app.routes import tasks_blueprint, auth_blueprint
+from app.services.tasks_service import update_task_by_id
+
+
+@pytest.fixture
+def app():
+    """
+    Set up and tear down the Flask testing application.
+    """
+    app = Flask(__name__)
+    app.config['TESTING'] = True
+    app.config['SQLALCHEMY_DATABASE_URI'] = 'sqlite:///:memory:'
+    db.init_app(app)
+    app.register_blueprint(auth_blueprint, url_prefix='/auth')
+    app.register_blueprint(tasks_blueprint, url_prefix='/tasks')
+    response_cache.init_app(app)
+
+    with app.app_context():
+        db.create_all()
+        yield app
+        db.drop_all()
+
+    response_cache.enabled = False
+
+
+def create_task(client, token, title='New Task'):
+    """
+    Create a task and return its ID.
+    """
+    response = client.post('/tasks/', headers={'Authorization': token}, json={
+        'title': title,
+        'description': 'A new task',
+    })
+
+    return response.get_json()['id']
+
+
+def test_get_tasks_cached(client, user):
+    """
+    Test that repeated list reads are served from the cache.
+    """
+    create_task(client, user)
+
+    first = client.get('/tasks/', headers={'Authorization': user})
+    second = client.get('/tasks/', headers={'Authorization': user})
+    other_page = client.get('/tasks/?limit=1', headers={'Authorization': user})
+
+    assert first.headers['X-Cache'] == 'MISS'
+    assert second.headers['X-Cache'] == 'HIT'
+    assert other_page.headers['X-Cache'] == 'MISS'
+    assert second.get_json() == first.get_json()
+    assert response_cache.stats()['hits'] == 1
+
+
+def test_get_task_by_id_cached(client, user):
+    """
+    Test that repeated task reads are served from the cache.
+    """
+    task_id = create_task(client, user)
+
+    first = client.get(f'/tasks/{task_id}', headers={'Authorization': user})
+    second = client.get(f'/tasks/{task_id}', headers={'Authorization': user})
+
+    assert first.headers['X-Cache'] == 'MISS'
+    assert second.headers['X-Cache'] == 'HIT'
+    assert second.get_json()['title'] == 'New Task'
+
+
+def test_writes_invalidate_cache(client, user):
+    """
+    Test that every write invalidates the user's cached reads.
+    """
+    headers = {'Authorization': user}
+    task_id = create_task(client, user)
+
+    client.get(f'/tasks/{task_id}', headers=headers)
+    client.put(f'/tasks/{task_id}', headers=headers, json={'title': 'Updated Task'})
+
+    response = client.get(f'/tasks/{task_id}', headers=headers)
+
+    assert response.headers['X-Cache'] == 'MISS'
+    assert response.get_json()['title'] == 'Updated Task'
+
+    client.get('/tasks/', headers=headers)
+    client.post('/tasks/batch', headers=headers, json={'tasks': [{'title': 'Batch', 'description': 'Batch'}]})
+
+    response = client.get('/tasks/', headers=headers)
+
+    assert response.headers['X-Cache'] == 'MISS'
+    assert len(response.get_json()['tasks']) == 2
+
+    client.delete(f'/tasks/{task_id}', headers=headers)
+
+    response = client.get('/tasks/', headers=headers)
+
+    assert response.headers['X-Cache'] == 'MISS'
+    assert len(response.get_json()['tasks']) == 1
+
+
+def test_cache_follows_other_workers_writes(client, user):
+    """
+    Test that a write made elsewhere, such as on another worker, is never served stale: the cache key
+    follows the ETag computed from the database, so the next read misses and a stale body is never
+    sent with a current ETag.
+    """
+    headers = {'Authorization': user}
+    task_id = create_task(client, user)
+
+    client.get('/tasks/', headers=headers)
+    client.get(f'/tasks/{task_id}', headers=headers)
+
+    user_id = db.session.scalar(select(User.id))
+    update_task_by_id(user_id, uuid.UUID(task_id), {'title': 'Updated elsewhere'})
+    db.session.commit()
+
+    for url in ('/tasks/', f'/tasks/{task_id}'):
+        response = client.get(url, headers=headers)
+        body = response.get_json()
+        title = body['tasks'][0]['title'] if 'tasks' in body else body['title']
+
+        assert response.headers['X-Cache'] == 'MISS'
+        assert title == 'Updated elsewhere'
+
+        not_modified = client.get(url, headers={**headers, 'If-None-Match': response.headers['ETag']})
+
+        assert not_modified.status_code == 304
+
+
+def test_cache_is_per_user(client, user):
+    """
+    Test that users never see each other's cached responses.
+    """
+    create_task(client, user)
+    client.get('/tasks/', headers={'Authorization': user})
+
+    client.post('/auth/register', json={'email': 'other@example.com', 'password': 'testpassword'})
+    other = client.post('/auth/login', json={'email': 'other@example.com', 'password': 'testpassword'})
+    other_token = other.get_json()['token']
+
+    response = client.get('/tasks/', headers={'Authorization': other_token})
+
+    assert response.headers['X-Cache'] == 'MISS'
+    assert response.get_json()['tasks'] == []
+
+
+def test_lru_backend_byte_budget():
+    """
+    Test that the LRU backend evicts the least recently used entries to stay within its byte budget.
+    """
+    backend = LRUCacheBackend(max_bytes=30)
+
+    backend.set('a', b'x' * 10)
+    backend.set('b', b'x' * 10)
+    backend.get('a')
+    backend.set('c', b'x' * 10)
+    backend.set('too-large', b'x' * 40)
+
+    assert backend.get('a') is not None
+    assert backend.get('b') is None
+    assert backend.get('c') is not None
+    assert backend.get('too-large') is None
+    assert backend.stats()['bytes'] <= 30
+    assert backend.stats()['evictions'] == 1
+
+
+def test_lru_backend_ttl():
+    """
+    Test that the LRU backend expires entries after their TTL.
+    """
+    now = [0.0]
+    backend = LRUCacheBackend(clock=lambda: now[0])
+
+    backend.set('key', b'value', ttl=10)
+
+    assert backend.get('key') == b'value'
+
+    now[0] = 10
+
+    assert backend.get('key') is None
+    assert backend.stats()['bytes'] == 0
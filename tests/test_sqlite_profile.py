@@ -0,0 +1,142 @@
+"""
+Unit tests for the SQLite production profile using pytest.
+
+Fixtures:
+    - app: Sets up and tears down a Flask application on a SQLite file with the production profile.
+    - client, user: The shared fixtures of conftest.py.
+
+Tests:
+    - test_pragmas_applied: Tests that every new connection gets the configured pragmas.
+    - test_writes_use_writer_engine: Tests that writes go to the writer engine and plain reads do not.
+    - test_concurrent_writers: Tests that concurrent writers are serialized instead of failing.
+    - test_write_routes_read_from_writer: Tests that the reads of write routes go to the writer engine.
+    - test_concurrent_batch_deletes: Tests that a task deleted by concurrent batches is reported deleted once.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from flask import Flask
+from sqlalchemy import event, text
+
+from app.config import ProductionConfig
+from app.extensions import db, init_sqlite
+from app.extensions.db import WRITER_EXTENSION_KEY
+from app.routes import tasks_blueprint, auth_blueprint
+
+
+@pytest.fixture
+def app(tmp_path):
+    """
+    Set up and tear down a Flask application on a SQLite file with the production profile.
+    """
+    uri = f'sqlite:///{tmp_path / "tasks.db"}'
+
+    app = Flask(__name__)
+    app.config['TESTING'] = True
+    app.config['SQLALCHEMY_DATABASE_URI'] = uri
+    app.config['SQLITE_PRAGMAS'] = ProductionConfig.SQLITE_PRAGMAS
+    app.config['SQLITE_SINGLE_WRITER'] = True
+    db.init_app(app)
+    init_sqlite(app)
+    app.register_blueprint(auth_blueprint, url_prefix='/auth')
+    app.register_blueprint(tasks_blueprint, url_prefix='/tasks')
+
+    with app.app_context():
+        db.create_all()
+        yield app
+        db.drop_all()
+
+
+def test_pragmas_applied(app):
+    """
+    Test that every new connection gets the configured pragmas.
+    """
+    for engine in (db.engine, app.extensions[WRITER_EXTENSION_KEY]):
+        with engine.connect() as conn:
+            assert conn.exec_driver_sql('PRAGMA journal_mode').scalar() == 'wal'
+            assert conn.exec_driver_sql('PRAGMA synchronous').scalar() == 1
+            assert conn.exec_driver_sql('PRAGMA busy_timeout').scalar() == 5000
+            assert conn.exec_driver_sql('PRAGMA temp_store').scalar() == 2
+            assert conn.exec_driver_sql('PRAGMA cache_size').scalar() == -64 * 1024
+
+
+def test_writes_use_writer_engine(app, client, user):
+    """
+    Test that writes go to the writer engine and plain reads do not.
+    """
+    statements = {'reader': [], 'writer': []}
+
+    for key, engine in (('reader', db.engine), ('writer', app.extensions[WRITER_EXTENSION_KEY])):
+        event.listen(engine, 'before_cursor_execute',
+                     lambda conn, cursor, statement, *args, key=key: statements[key].append(statement))
+
+    headers = {'Authorization': user}
+    task_id = client.post('/tasks/', headers=headers, json={'title': 'Task', 'description': 'Task'}).get_json()['id']
+    response = client.put(f'/tasks/{task_id}', headers=headers, json={'completed': True})
+
+    assert response.get_json()['completed'] is True
+
+    statements['reader'].clear()
+    client.get('/tasks/', headers=headers)
+
+    assert any(statement.startswith('INSERT INTO tasks') for statement in statements['writer'])
+    assert any(statement.startswith('UPDATE tasks') for statement in statements['writer'])
+    assert not any(statement.startswith(('INSERT', 'UPDATE', 'DELETE')) for statement in statements['reader'])
+    assert any('FROM tasks' in statement for statement in statements['reader'])
+
+
+def test_concurrent_writers(app, user):
+    """
+    Test that concurrent writers are serialized instead of failing.
+    """
+    def create(i):
+        with app.test_client() as client:
+            return client.post('/tasks/', headers={'Authorization': user},
+                               json={'title': f'Task {i}', 'description': f'Task {i}'}).status_code
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        statuses = list(executor.map(create, range(40)))
+
+    assert statuses == [201] * 40
+    assert db.session.execute(text('SELECT COUNT(DISTINCT change_seq) FROM tasks')).scalar() == 40
+
+
+def test_write_routes_read_from_writer(app, client, user):
+    """
+    Test that the reads of write routes go to the writer engine, even before their first write.
+    """
+    headers = {'Authorization': user}
+    task_id = client.post('/tasks/', headers=headers, json={'title': 'Task', 'description': 'Task'}).get_json()['id']
+    statements = {'reader': [], 'writer': []}
+
+    for key, engine in (('reader', db.engine), ('writer', app.extensions[WRITER_EXTENSION_KEY])):
+        event.listen(engine, 'before_cursor_execute',
+                     lambda conn, cursor, statement, *args, key=key: statements[key].append(statement))
+
+    response = client.patch('/tasks/batch', headers=headers, json={'tasks': [{'id': task_id}]})
+
+    assert response.get_json()['results'][0]['status'] == 200
+    assert any('FROM tasks' in statement for statement in statements['writer'])
+    assert not any('FROM tasks' in statement for statement in statements['reader'])
+
+
+def test_concurrent_batch_deletes(app, client, user):
+    """
+    Test that a task deleted by concurrent batches is reported deleted, and tombstoned, only once.
+    """
+    headers = {'Authorization': user}
+    response = client.post('/tasks/batch', headers=headers,
+                           json={'tasks': [{'title': f'Task {i}', 'description': 'Task'} for i in range(5)]})
+    task_ids = [result['task']['id'] for result in response.get_json()['results']]
+
+    def delete(_):
+        with app.test_client() as client:
+            results = client.delete('/tasks/batch', headers=headers, json={'ids': task_ids}).get_json()['results']
+            return [result['status'] for result in results]
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        statuses = [status for batch in executor.map(delete, range(8)) for status in batch]
+
+    assert statuses.count(200) == 5
+    assert db.session.execute(text('SELECT COUNT(*) FROM task_tombstones')).scalar() == 5
@@ -0,0 +1,186 @@
+"""
+Unit tests for the batch tasks endpoints using pytest.
+
+Fixtures:
+    - app, client, user: The shared fixtures of conftest.py.
+
+Tests:
+    - test_create_tasks_batch: Tests creating many tasks at once.
+    - test_create_tasks_batch_invalid_item: Tests that invalid items are rejected individually.
+    - test_create_tasks_batch_too_large: Tests that batches over the maximum size are rejected.
+    - test_update_tasks_batch: Tests updating many tasks at once.
+    - test_update_tasks_batch_other_user: Tests that tasks of another user are not updated.
+    - test_update_tasks_batch_distinct_changes: Tests that distinct changes per task run constant statements.
+    - test_delete_tasks_batch: Tests deleting many tasks at once.
+    - test_batch_unauthenticated: Tests batch endpoints without authentication.
+"""
+
+import uuid
+
+
+def create_tasks(client, token, count):
+    """
+    Create tasks through the batch endpoint and return their IDs.
+    """
+    response = client.post('/tasks/batch', headers={'Authorization': token}, json={
+        'tasks': [{'title': f'Task {i}', 'description': f'Task {i}'} for i in range(count)],
+    })
+
+    return [result['task']['id'] for result in response.get_json()['results']]
+
+
+def test_create_tasks_batch(client, user):
+    """
+    Test creating many tasks at once.
+    """
+    response = client.post('/tasks/batch', headers={'Authorization': user}, json={
+        'tasks': [{'title': f'Task {i}', 'description': f'Task {i}'} for i in range(3)],
+    })
+
+    json_data = response.get_json()
+
+    assert response.status_code == 200
+    assert [result['status'] for result in json_data['results']] == [201, 201, 201]
+    assert [result['task']['title'] for result in json_data['results']] == ['Task 0', 'Task 1', 'Task 2']
+
+    list_response = client.get('/tasks/', headers={'Authorization': user})
+
+    assert len(list_response.get_json()['tasks']) == 3
+
+
+def test_create_tasks_batch_invalid_item(client, user):
+    """
+    Test that invalid items are rejected individually.
+    """
+    response = client.post('/tasks/batch', headers={'Authorization': user}, json={
+        'tasks': [{'title': 'Task', 'description': 'Task'}, {'title': 'No description'}],
+    })
+
+    json_data = response.get_json()
+
+    assert response.status_code == 200
+    assert [result['status'] for result in json_data['results']] == [201, 400]
+
+
+def test_create_tasks_batch_too_large(app, client, user):
+    """
+    Test that batches over the maximum size are rejected.
+    """
+    app.config['TASKS_BATCH_MAX_SIZE'] = 2
+
+    response = client.post('/tasks/batch', headers={'Authorization': user}, json={
+        'tasks': [{'title': f'Task {i}', 'description': f'Task {i}'} for i in range(3)],
+    })
+
+    assert response.status_code == 400
+
+
+def test_update_tasks_batch(client, user):
+    """
+    Test updating many tasks at once.
+    """
+    task_ids = create_tasks(client, user, 3)
+
+    response = client.patch('/tasks/batch', headers={'Authorization': user}, json={
+        'tasks': [
+            {'id': task_ids[0], 'completed': True},
+            {'id': task_ids[1], 'completed': True},
+            {'id': task_ids[2], 'title': 'Renamed'},
+            {'id': str(uuid.uuid4()), 'completed': True},
+            {'id': 'not-a-uuid'},
+        ],
+    })
+
+    results = response.get_json()['results']
+
+    assert response.status_code == 200
+    assert [result['status'] for result in results] == [200, 200, 200, 404, 400]
+    assert results[0]['task']['completed'] is True
+    assert results[1]['task']['completed'] is True
+    assert results[2]['task']['title'] == 'Renamed'
+    assert results[2]['task']['completed'] is False
+
+
+def test_update_tasks_batch_other_user(client, user):
+    """
+    Test that tasks of another user are not updated.
+    """
+    task_ids = create_tasks(client, user, 1)
+
+    client.post('/auth/register', json={'email': 'other@example.com', 'password': 'testpassword'})
+    other = client.post('/auth/login', json={'email': 'other@example.com', 'password': 'testpassword'})
+    other_token = other.get_json()['token']
+
+    response = client.patch('/tasks/batch', headers={'Authorization': other_token}, json={
+        'tasks': [{'id': task_ids[0], 'title': 'Hijacked'}],
+    })
+
+    assert response.get_json()['results'][0]['status'] == 404
+
+    task = client.get(f'/tasks/{task_ids[0]}', headers={'Authorization': user}).get_json()
+
+    assert task['title'] == 'Task 0'
+
+
+def test_update_tasks_batch_distinct_changes(client, user, assert_max_queries):
+    """
+    Test that a batch giving every task different changes runs a constant number of statements and
+    keeps the fields a task does not change.
+    """
+    task_ids = create_tasks(client, user, 50)
+    items = [{'id': task_id, 'title': f'Renamed {i}'} if i % 2 else {'id': task_id, 'completed': True}
+             for i, task_id in enumerate(task_ids)]
+
+    with assert_max_queries(4):
+        response = client.patch('/tasks/batch', headers={'Authorization': user}, json={'tasks': items + [
+            {'id': task_ids[0]},
+        ]})
+
+    results = response.get_json()['results']
+
+    assert [result['status'] for result in results] == [200] * 50 + [400]
+
+    for i, result in enumerate(results[:50]):
+        task = result['task']
+
+        assert task['id'] == task_ids[i]
+        assert (task['title'], task['completed']) == ((f'Renamed {i}', False) if i % 2 else (f'Task {i}', True))
+        assert task['description'] == f'Task {i}'
+
+    assert len({result['task']['change_seq'] for result in results[:50]}) == 50
+
+    with assert_max_queries(4):
+        response = client.patch('/tasks/batch', headers={'Authorization': user}, json={'tasks': [
+            {'id': task_ids[1]},
+        ]})
+
+    assert response.get_json()['results'][0]['task']['title'] == 'Renamed 1'
+
+
+def test_delete_tasks_batch(client, user):
+    """
+    Test deleting many tasks at once.
+    """
+    task_ids = create_tasks(client, user, 3)
+
+    response = client.delete('/tasks/batch', headers={'Authorization': user}, json={
+        'ids': [task_ids[0], task_ids[1], str(uuid.uuid4())],
+    })
+
+    results = response.get_json()['results']
+
+    assert response.status_code == 200
+    assert [result['status'] for result in results] == [200, 200, 404]
+
+    remaining = client.get('/tasks/', headers={'Authorization': user}).get_json()['tasks']
+
+    assert [task['id'] for task in remaining] == [task_ids[2]]
+
+
+def test_batch_unauthenticated(client):
+    """
+    Test batch endpoints without authentication.
+    """
+    assert client.post('/tasks/batch', json={'tasks': []}).status_code == 401
+    assert client.patch('/tasks/batch', json={'tasks': []}).status_code == 401
+    assert client.delete('/tasks/batch', json={'ids': []}).status_code == 401
@@ -0,0 +1,153 @@
+"""
+Unit tests for the delta sync endpoint using pytest.
+
+Fixtures:
+    - app, client, user: The shared fixtures of conftest.py.
+
+Tests:
+    - test_full_sync: Tests that a sync without cursor returns every task.
+    - test_sync_since_cursor: Tests that a sync from a cursor only returns later changes.
+    - test_sync_deletions: Tests that deleted tasks are returned as tombstones.
+    - test_sync_batch_writes: Tests that batch writes give each task its own sequence number.
+    - test_sync_pagination: Tests paging through changes with the returned cursor.
+    - test_sync_other_user: Tests that the changes of another user are not returned.
+    - test_sync_invalid_cursor: Tests that a malformed cursor is rejected.
+"""
+
+
+def create_task(client, token, title):
+    """
+    Create a task and return its ID.
+    """
+    response = client.post('/tasks/', headers={'Authorization': token},
+                           json={'title': title, 'description': title})
+
+    return response.get_json()['id']
+
+
+def sync(client, token, since=None, limit=None):
+    """
+    Fetch the changes since a cursor.
+    """
+    params = {key: value for key, value in (('since', since), ('limit', limit)) if value is not None}
+    response = client.get('/tasks/changes', headers={'Authorization': token}, query_string=params)
+
+    assert response.status_code == 200
+
+    return response.get_json()
+
+
+def test_full_sync(client, user):
+    """
+    Test that a sync without cursor returns every task.
+    """
+    ids = [create_task(client, user, f'Task {i}') for i in range(3)]
+
+    json_data = sync(client, user)
+
+    assert [task['id'] for task in json_data['changed']] == ids
+    assert json_data['deleted'] == []
+    assert json_data['cursor'] == '3'
+    assert json_data['has_more'] is False
+
+
+def test_sync_since_cursor(client, user):
+    """
+    Test that a sync from a cursor only returns later changes.
+    """
+    first_id = create_task(client, user, 'First')
+    second_id = create_task(client, user, 'Second')
+    cursor = sync(client, user)['cursor']
+
+    assert sync(client, user, since=cursor) == {'changed': [], 'deleted': [], 'cursor': cursor, 'has_more': False}
+
+    client.put(f'/tasks/{first_id}', headers={'Authorization': user}, json={'completed': True})
+    third_id = create_task(client, user, 'Third')
+
+    json_data = sync(client, user, since=cursor)
+
+    assert [task['id'] for task in json_data['changed']] == [first_id, third_id]
+    assert json_data['changed'][0]['completed'] is True
+    assert second_id not in [task['id'] for task in json_data['changed']]
+
+
+def test_sync_deletions(client, user):
+    """
+    Test that deleted tasks are returned as tombstones.
+    """
+    task_id = create_task(client, user, 'Task')
+    cursor = sync(client, user)['cursor']
+
+    client.delete(f'/tasks/{task_id}', headers={'Authorization': user})
+
+    json_data = sync(client, user, since=cursor)
+
+    assert json_data['changed'] == []
+    assert json_data['deleted'] == [task_id]
+    assert sync(client, user)['changed'] == []
+
+
+def test_sync_batch_writes(client, user):
+    """
+    Test that batch writes give each task its own sequence number.
+    """
+    response = client.post('/tasks/batch', headers={'Authorization': user}, json={
+        'tasks': [{'title': f'Task {i}', 'description': f'Task {i}'} for i in range(4)],
+    })
+    ids = [result['task']['id'] for result in response.get_json()['results']]
+    cursor = sync(client, user)['cursor']
+
+    client.patch('/tasks/batch', headers={'Authorization': user},
+                 json={'tasks': [{'id': task_id, 'completed': True} for task_id in ids[:2]]})
+    client.delete('/tasks/batch', headers={'Authorization': user}, json={'ids': ids[2:]})
+
+    json_data = sync(client, user, since=cursor)
+
+    assert sorted(task['change_seq'] for task in json_data['changed']) == [5, 6]
+    assert sorted(json_data['deleted']) == sorted(ids[2:])
+    assert json_data['cursor'] == '8'
+
+
+def test_sync_pagination(client, user):
+    """
+    Test paging through changes with the returned cursor.
+    """
+    ids = [create_task(client, user, f'Task {i}') for i in range(3)]
+    cursor = sync(client, user)['cursor']
+
+    client.delete(f'/tasks/{ids[0]}', headers={'Authorization': user})
+    client.put(f'/tasks/{ids[1]}', headers={'Authorization': user}, json={'title': 'Updated'})
+    client.delete(f'/tasks/{ids[2]}', headers={'Authorization': user})
+
+    first_page = sync(client, user, since=cursor, limit=2)
+
+    assert first_page['deleted'] == [ids[0]]
+    assert [task['id'] for task in first_page['changed']] == [ids[1]]
+    assert first_page['has_more'] is True
+
+    second_page = sync(client, user, since=first_page['cursor'], limit=2)
+
+    assert second_page == {'changed': [], 'deleted': [ids[2]], 'cursor': '6', 'has_more': False}
+
+
+def test_sync_other_user(client, user):
+    """
+    Test that the changes of another user are not returned.
+    """
+    create_task(client, user, 'Task')
+
+    client.post('/auth/register', json={'email': 'other@example.com', 'password': 'otherpassword'})
+    response = client.post('/auth/login', json={'email': 'other@example.com', 'password': 'otherpassword'})
+    other_token = response.get_json()['token']
+
+    assert sync(client, other_token) == {'changed': [], 'deleted': [], 'cursor': '0', 'has_more': False}
+
+
+def test_sync_invalid_cursor(client, user):
+    """
+    Test that a malformed cursor is rejected.
+    """
+    for since in ('abc', '-1'):
+        response = client.get('/tasks/changes', headers={'Authorization': user}, query_string={'since': since})
+
+        assert response.status_code == 400
@@ -0,0 +1,154 @@
+"""
+Unit tests for conditional task reads (ETag, Last-Modified and 304 responses) using pytest.
+
+Fixtures:
+    - app, client, user: The shared fixtures of conftest.py.
+
+Tests:
+    - test_get_tasks_not_modified: Tests that an unchanged task list answers 304 without loading tasks.
+    - test_get_tasks_etag_changes: Tests that creating, updating and deleting tasks change the list ETag.
+    - test_get_tasks_etag_per_page: Tests that each page of the list has its own ETag.
+    - test_get_tasks_if_modified_since: Tests If-Modified-Since on the task list.
+    - test_get_tasks_if_modified_since_after_delete: Tests that deleting a task moves the list Last-Modified date.
+    - test_get_task_by_id_not_modified: Tests 304 and ETag changes on a single task.
+"""
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import event, update
+from werkzeug.http import http_date
+
+from app.extensions import db
+from app.models import User
+
+
+def create_task(client, token, title='New Task'):
+    """
+    Create a task and return its ID.
+    """
+    response = client.post('/tasks/', headers={'Authorization': token}, json={
+        'title': title,
+        'description': 'A new task',
+    })
+
+    return response.get_json()['id']
+
+
+def test_get_tasks_not_modified(client, user):
+    """
+    Test that an unchanged task list answers 304 without loading tasks.
+    """
+    create_task(client, user)
+
+    response = client.get('/tasks/', headers={'Authorization': user})
+    etag = response.headers['ETag']
+
+    assert response.status_code == 200
+    assert 'Last-Modified' in response.headers
+
+    statements = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(db.engine, 'before_cursor_execute', capture)
+
+    try:
+        not_modified = client.get('/tasks/', headers={'Authorization': user, 'If-None-Match': etag})
+    finally:
+        event.remove(db.engine, 'before_cursor_execute', capture)
+
+    assert not_modified.status_code == 304
+    assert not_modified.headers['ETag'] == etag
+    assert not_modified.get_data() == b''
+    assert len(statements) == 1
+    assert 'task_change_seq' in statements[0]
+
+
+def test_get_tasks_etag_changes(client, user):
+    """
+    Test that creating, updating and deleting tasks change the list ETag.
+    """
+    headers = {'Authorization': user}
+    task_id = create_task(client, user)
+    etags = [client.get('/tasks/', headers=headers).headers['ETag']]
+
+    create_task(client, user, 'Second Task')
+    etags.append(client.get('/tasks/', headers=headers).headers['ETag'])
+
+    client.put(f'/tasks/{task_id}', headers=headers, json={'completed': True})
+    etags.append(client.get('/tasks/', headers=headers).headers['ETag'])
+
+    client.delete(f'/tasks/{task_id}', headers=headers)
+    response = client.get('/tasks/', headers={**headers, 'If-None-Match': etags[-1]})
+    etags.append(response.headers['ETag'])
+
+    assert response.status_code == 200
+    assert len(set(etags)) == 4
+
+
+def test_get_tasks_etag_per_page(client, user):
+    """
+    Test that each page of the list has its own ETag.
+    """
+    create_task(client, user)
+    create_task(client, user)
+
+    first = client.get('/tasks/', headers={'Authorization': user})
+    second = client.get('/tasks/?limit=1', headers={'Authorization': user, 'If-None-Match': first.headers['ETag']})
+
+    assert second.status_code == 200
+    assert second.headers['ETag'] != first.headers['ETag']
+
+
+def test_get_tasks_if_modified_since(client, user):
+    """
+    Test If-Modified-Since on the task list.
+    """
+    create_task(client, user)
+
+    future = http_date(datetime.now(timezone.utc) + timedelta(minutes=1))
+    past = http_date(datetime.now(timezone.utc) - timedelta(minutes=1))
+
+    assert client.get('/tasks/', headers={'Authorization': user, 'If-Modified-Since': future}).status_code == 304
+    assert client.get('/tasks/', headers={'Authorization': user, 'If-Modified-Since': past}).status_code == 200
+
+
+def test_get_tasks_if_modified_since_after_delete(client, user):
+    """
+    Test that deleting a task moves the list Last-Modified date, so If-Modified-Since alone sees it.
+    """
+    headers = {'Authorization': user}
+    task_id = create_task(client, user)
+    create_task(client, user)
+
+    db.session.execute(update(User).values(task_changed_at=datetime.now() - timedelta(minutes=1)))
+    db.session.commit()
+
+    last_modified = client.get('/tasks/', headers=headers).headers['Last-Modified']
+
+    assert client.get('/tasks/', headers={**headers, 'If-Modified-Since': last_modified}).status_code == 304
+
+    client.delete(f'/tasks/{task_id}', headers=headers)
+    response = client.get('/tasks/', headers={**headers, 'If-Modified-Since': last_modified})
+
+    assert response.status_code == 200
+    assert len(response.get_json()['tasks']) == 1
+
+
+def test_get_task_by_id_not_modified(client, user):
+    """
+    Test 304 and ETag changes on a single task.
+    """
+    headers = {'Authorization': user}
+    task_id = create_task(client, user)
+
+    etag = client.get(f'/tasks/{task_id}', headers=headers).headers['ETag']
+    not_modified = client.get(f'/tasks/{task_id}', headers={**headers, 'If-None-Match': etag})
+
+    client.put(f'/tasks/{task_id}', headers=headers, json={'title': 'Updated Task'})
+    modified = client.get(f'/tasks/{task_id}', headers={**headers, 'If-None-Match': etag})
+
+    assert not_modified.status_code == 304
+    assert modified.status_code == 200
+    assert modified.headers['ETag'] != etag
+    assert modified.get_json()['title'] == 'Updated Task'
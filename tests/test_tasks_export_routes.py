@@ -0,0 +1,78 @@
+"""
+Unit tests for the task export endpoint using pytest.
+
+Fixtures:
+    - app, client, user: The shared fixtures of conftest.py.
+
+Tests:
+    - test_export_tasks_ndjson: Tests exporting tasks as NDJSON.
+    - test_export_tasks_csv: Tests exporting tasks as CSV.
+    - test_export_tasks_invalid_format: Tests exporting tasks in an unsupported format.
+    - test_export_tasks_unauthenticated: Tests exporting tasks without authentication.
+"""
+import csv
+import io
+import json
+
+
+def create_tasks(client, token, count):
+    """
+    Create tasks through the batch endpoint.
+    """
+    client.post('/tasks/batch', headers={'Authorization': token}, json={
+        'tasks': [{'title': f'Task {i}', 'description': f'Task, "number" {i}'} for i in range(count)],
+    })
+
+
+def test_export_tasks_ndjson(app, client, user):
+    """
+    Test exporting tasks as NDJSON.
+    """
+    app.config['TASKS_EXPORT_BATCH_SIZE'] = 2
+    create_tasks(client, user, 5)
+
+    response = client.get('/tasks/export', headers={'Authorization': user})
+
+    assert response.status_code == 200
+    assert response.is_streamed
+    assert response.mimetype == 'application/x-ndjson'
+
+    tasks = [json.loads(line) for line in response.get_data(as_text=True).splitlines()]
+
+    assert [task['title'] for task in tasks] == [f'Task {i}' for i in range(5)]
+
+
+def test_export_tasks_csv(app, client, user):
+    """
+    Test exporting tasks as CSV.
+    """
+    app.config['TASKS_EXPORT_BATCH_SIZE'] = 2
+    create_tasks(client, user, 3)
+
+    response = client.get('/tasks/export?format=csv', headers={'Authorization': user})
+
+    assert response.status_code == 200
+    assert response.mimetype == 'text/csv'
+
+    rows = list(csv.DictReader(io.StringIO(response.get_data(as_text=True))))
+
+    assert [row['title'] for row in rows] == ['Task 0', 'Task 1', 'Task 2']
+    assert rows[1]['description'] == 'Task, "number" 1'
+
+
+def test_export_tasks_invalid_format(client, user):
+    """
+    Test exporting tasks in an unsupported format.
+    """
+    response = client.get('/tasks/export?format=xml', headers={'Authorization': user})
+
+    assert response.status_code == 400
+
+
+def test_export_tasks_unauthenticated(client):
+    """
+    Test exporting tasks without authentication.
+    """
+    response = client.get('/tasks/export')
+
+    assert response.status_code == 401
@@ -0,0 +1,172 @@
+"""
+Unit tests for filtering, sorting and field selection on the task list using pytest.
+
+Fixtures:
+    - app, client, user: The shared fixtures of conftest.py.
+
+Tests:
+    - test_filter_completed: Tests listing only completed or incomplete tasks.
+    - test_filter_created_range: Tests listing the tasks created within a date range.
+    - test_sort_created_at_descending: Tests listing the newest tasks first.
+    - test_sort_title_paginated: Tests walking through tasks sorted by title with the next cursor.
+    - test_sort_cursor_mismatch: Tests that a cursor cannot be replayed with another sort.
+    - test_sparse_fieldset: Tests that only the requested fields are selected and returned.
+    - test_invalid_parameters: Tests the errors of malformed filters, sorts and fields.
+"""
+
+import pytest
+from sqlalchemy import event
+
+from app.extensions import db
+
+
+def create_tasks(client, token, titles, completed=()):
+    """
+    Create tasks with the given titles, completing those at the given positions, and return them.
+    """
+    tasks = []
+
+    for i, title in enumerate(titles):
+        task = client.post('/tasks/', headers={'Authorization': token},
+                           json={'title': title, 'description': f'Description of {title}'}).get_json()
+
+        if i in completed:
+            task = client.put(f"/tasks/{task['id']}", headers={'Authorization': token},
+                              json={'completed': True}).get_json()
+
+        tasks.append(task)
+
+    return tasks
+
+
+def list_titles(client, token, **query):
+    """
+    Return the titles of a page of tasks.
+    """
+    response = client.get('/tasks/', headers={'Authorization': token}, query_string=query)
+
+    assert response.status_code == 200
+
+    return [task['title'] for task in response.get_json()['tasks']]
+
+
+def test_filter_completed(client, user):
+    """
+    Test listing only completed or incomplete tasks.
+    """
+    create_tasks(client, user, ['A', 'B', 'C', 'D'], completed=(1, 3))
+
+    assert list_titles(client, user, completed='true') == ['B', 'D']
+    assert list_titles(client, user, completed='false') == ['A', 'C']
+
+
+def test_filter_created_range(client, user):
+    """
+    Test listing the tasks created within a date range.
+    """
+    create_tasks(client, user, ['A', 'B', 'C', 'D'])
+    tasks = client.get('/tasks/', headers={'Authorization': user}).get_json()['tasks']
+
+    assert list_titles(client, user, created_after=tasks[0]['created_at']) == ['B', 'C', 'D']
+    assert list_titles(client, user, created_before=tasks[2]['created_at']) == ['A', 'B']
+    assert list_titles(client, user, created_after=tasks[0]['created_at'],
+                       created_before=tasks[3]['created_at']) == ['B', 'C']
+
+
+def test_sort_created_at_descending(client, user):
+    """
+    Test listing the newest tasks first, page by page.
+    """
+    create_tasks(client, user, ['A', 'B', 'C'])
+
+    response = client.get('/tasks/?sort=-created_at&limit=2', headers={'Authorization': user})
+    first_page = response.get_json()
+
+    assert [task['title'] for task in first_page['tasks']] == ['C', 'B']
+    assert list_titles(client, user, sort='-created_at', cursor=first_page['next_cursor']) == ['A']
+
+
+def test_sort_title_paginated(client, user):
+    """
+    Test walking through tasks sorted by title with the next cursor, ties broken by ID.
+    """
+    titles = ['pear', 'apple', 'fig', 'apple', 'kiwi', 'banana', 'fig']
+    create_tasks(client, user, titles)
+
+    for sort, expected in (('title', sorted(titles)), ('-title', sorted(titles, reverse=True))):
+        seen = []
+        cursor = None
+
+        while True:
+            query = {'sort': sort, 'limit': 2, 'fields': 'id,title'}
+
+            if cursor:
+                query['cursor'] = cursor
+
+            json_data = client.get('/tasks/', headers={'Authorization': user}, query_string=query).get_json()
+            seen.extend(json_data['tasks'])
+            cursor = json_data['next_cursor']
+
+            if cursor is None:
+                break
+
+        assert [task['title'] for task in seen] == expected
+        assert len({task['id'] for task in seen}) == len(titles)
+
+
+def test_sort_cursor_mismatch(client, user):
+    """
+    Test that a cursor cannot be replayed with another sort.
+    """
+    create_tasks(client, user, ['A', 'B', 'C'])
+
+    cursor = client.get('/tasks/?sort=title&limit=1', headers={'Authorization': user}).get_json()['next_cursor']
+
+    response = client.get('/tasks/', headers={'Authorization': user}, query_string={'cursor': cursor})
+
+    assert response.status_code == 400
+    assert 'Invalid cursor' in response.get_json()['message']
+
+
+def test_sparse_fieldset(app, client, user):
+    """
+    Test that only the requested fields are selected and returned.
+    """
+    create_tasks(client, user, ['A', 'B', 'C'])
+    statements = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        if 'FROM tasks' in statement:
+            statements.append(statement)
+
+    event.listen(db.engine, 'before_cursor_execute', capture)
+
+    try:
+        response = client.get('/tasks/?fields=id,title,completed&limit=2', headers={'Authorization': user})
+    finally:
+        event.remove(db.engine, 'before_cursor_execute', capture)
+
+    json_data = response.get_json()
+
+    assert response.status_code == 200
+    assert [set(task) for task in json_data['tasks']] == [{'id', 'title', 'completed'}] * 2
+    assert json_data['next_cursor'] is not None
+    assert not any('description' in statement for statement in statements)
+    assert list_titles(client, user, fields='title', cursor=json_data['next_cursor']) == ['C']
+
+
+@pytest.mark.parametrize('query', [
+    {'completed': 'maybe'},
+    {'created_after': 'yesterday'},
+    {'sort': 'description'},
+    {'fields': 'id,secret'},
+    {'fields': ','},
+])
+def test_invalid_parameters(client, user, query):
+    """
+    Test the errors of malformed filters, sorts and fields.
+    """
+    response = client.get('/tasks/', headers={'Authorization': user}, query_string=query)
+
+    assert response.status_code == 400
+    assert 'message' in response.get_json()
@@ -0,0 +1,127 @@
+"""
+Unit tests for the task import endpoint using pytest.
+
+Fixtures:
+    - app, client, user: The shared fixtures of conftest.py.
+
+Tests:
+    - test_import_tasks_ndjson: Tests importing tasks from NDJSON, rejecting invalid records.
+    - test_import_tasks_csv: Tests importing tasks from CSV.
+    - test_import_tasks_chunked_commits: Tests that imports commit once per chunk.
+    - test_import_tasks_export_round_trip: Tests importing the output of the export endpoint.
+    - test_import_tasks_invalid_format: Tests importing tasks in an unsupported format.
+    - test_import_tasks_unauthenticated: Tests importing tasks without authentication.
+"""
+import json
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+
+def list_titles(client, token):
+    """
+    Return the titles of the user's tasks.
+    """
+    response = client.get('/tasks/', headers={'Authorization': token})
+
+    return [task['title'] for task in response.get_json()['tasks']]
+
+
+def test_import_tasks_ndjson(client, user):
+    """
+    Test importing tasks from NDJSON, rejecting invalid records.
+    """
+    body = '\n'.join([
+        json.dumps({'title': 'Task 1', 'description': 'First'}),
+        '{not json',
+        json.dumps({'title': 'Task 2'}),
+        '',
+        json.dumps({'title': 'Task 3', 'description': 'Third'}),
+    ])
+
+    response = client.post('/tasks/import', headers={'Authorization': user}, data=body,
+                           content_type='application/x-ndjson')
+    json_data = response.get_json()
+
+    assert response.status_code == 200
+    assert json_data['accepted'] == 2
+    assert json_data['rejected'] == 2
+    assert [error['line'] for error in json_data['errors']] == [2, 3]
+    assert list_titles(client, user) == ['Task 1', 'Task 3']
+
+
+def test_import_tasks_csv(client, user):
+    """
+    Test importing tasks from CSV.
+    """
+    body = 'title,description\nTask 1,"First, with a comma"\n,Missing title\nTask 2,Second\n'
+
+    response = client.post('/tasks/import?format=csv', headers={'Authorization': user}, data=body)
+    json_data = response.get_json()
+
+    assert response.status_code == 200
+    assert json_data['accepted'] == 2
+    assert json_data['rejected'] == 1
+    assert list_titles(client, user) == ['Task 1', 'Task 2']
+
+
+def test_import_tasks_chunked_commits(app, client, user):
+    """
+    Test that imports commit once per chunk.
+    """
+    app.config['TASKS_IMPORT_CHUNK_SIZE'] = 2
+    commits = []
+
+    def count_commit(session):
+        commits.append(session)
+
+    body = '\n'.join(json.dumps({'title': f'Task {i}', 'description': 'Task'}) for i in range(5))
+
+    event.listen(Session, 'after_commit', count_commit)
+
+    try:
+        response = client.post('/tasks/import', headers={'Authorization': user}, data=body,
+                               content_type='application/x-ndjson')
+    finally:
+        event.remove(Session, 'after_commit', count_commit)
+
+    assert response.get_json()['accepted'] == 5
+    assert len(commits) == 3
+
+
+def test_import_tasks_export_round_trip(client, user):
+    """
+    Test importing the output of the export endpoint.
+    """
+    client.post('/tasks/batch', headers={'Authorization': user}, json={
+        'tasks': [{'title': f'Task {i}', 'description': f'Task {i}'} for i in range(3)],
+    })
+
+    for export_format, count in (('ndjson', 3), ('csv', 6)):
+        export = client.get(f'/tasks/export?format={export_format}', headers={'Authorization': user})
+
+        response = client.post(f'/tasks/import?format={export_format}', headers={'Authorization': user},
+                               data=export.get_data())
+
+        assert response.get_json()['accepted'] == count
+
+    assert len(list_titles(client, user)) == 12
+
+
+def test_import_tasks_invalid_format(client, user):
+    """
+    Test importing tasks in an unsupported format.
+    """
+    response = client.post('/tasks/import', headers={'Authorization': user}, data='<tasks/>',
+                           content_type='application/xml')
+
+    assert response.status_code == 400
+
+
+def test_import_tasks_unauthenticated(client):
+    """
+    Test importing tasks without authentication.
+    """
+    response = client.post('/tasks/import', data='', content_type='application/x-ndjson')
+
+    assert response.status_code == 401
@@ -2,73 +2,34 @@
 Unit tests for tasks endpoints using pytest.
 
 Fixtures:
-    - app: Sets up and tears down the Flask testing application.
-    - client: Creates a test client for the Flask testing application.
-    - user: Registers and logs in a user, returning a JWT token.
+    - app, client, user: The shared fixtures of conftest.py.
 
 Tests:
     - test_create_task: Tests creating a new task.
     - test_create_task_unauthenticated: Tests creating a new task without authentication.
     - test_get_tasks: Tests getting all tasks.
     - test_get_tasks_unauthenticated: Tests getting all tasks without authentication.
+    - test_get_tasks_paginated: Tests walking through all tasks with the next cursor.
+    - test_get_tasks_max_page_size: Tests that the page size is capped.
+    - test_get_tasks_invalid_cursor: Tests getting tasks with a malformed cursor.
     - test_get_task_by_id: Tests getting a single task.
     - test_get_task_by_id_unauthenticated: Tests getting a single task without authentication.
     - test_get_task_by_id_not_exist: Tests getting a single task without an existing task with the given ID.
     - test_update_task: Tests updating a single task.
     - test_update_task_unauthenticated: Tests updating a single task without authentication.
     - test_update_task_not_exist: Tests updating a single task without an existing task.
+    - test_update_task_single_statement: Tests that updating a task runs a single statement.
     - test_delete_task: Tests deleting a single task.
     - test_delete_task_unauthenticated: Tests deleting a single task without authentication.
     - test_delete_task_not_exist: Tests deleting a single task without an existing task.
+    - test_delete_task_single_statement: Tests that deleting a task runs a single statement.
 """
 
 import uuid
 
-import pytest
-from flask import Flask
+from sqlalchemy import event
 
 from app.extensions import db
-from app.routes import tasks_blueprint, auth_blueprint
-
-
-@pytest.fixture
-def app():
-    """
-    Set up and tear down the Flask testing application.
-    """
-    app = Flask(__name__)
-    app.config['TESTING'] = True
-    app.config['SQLALCHEMY_DATABASE_URI'] = 'sqlite:///:memory:'
-    db.init_app(app)
-    app.register_blueprint(auth_blueprint, url_prefix='/auth')
-    app.register_blueprint(tasks_blueprint, url_prefix='/tasks')
-
-    with app.app_context():
-        db.create_all()
-        yield app
-        db.drop_all()
-
-
-@pytest.fixture
-def client(app):
-    """
-    Create a test client for the Flask app.
-    """
-    return app.test_client()
-
-
-@pytest.fixture
-def user(client):
-    """
-    Register and log in a user, returning a JWT token.
-    """
-    client.post('/auth/register', json={'email': 'test@example.com', 'password': 'testpassword'})
-
-    response = client.post('/auth/login', json={'email': 'test@example.com', 'password': 'testpassword'})
-
-    json_data = response.get_json()
-
-    return json_data['token']
 
 
 def test_create_task(client, user):
@@ -117,7 +78,8 @@ def test_get_tasks(client, user):
     json_data = response.get_json()
 
     assert response.status_code == 200
-    assert len(json_data) == 2
+    assert len(json_data['tasks']) == 2
+    assert json_data['next_cursor'] is None
 
 
 def test_get_tasks_unauthenticated(client):
@@ -129,6 +91,69 @@ def test_get_tasks_unauthenticated(client):
     assert response.status_code == 401
 
 
+def test_get_tasks_paginated(client, user):
+    """
+    Test walking through all tasks with the next cursor.
+    """
+    for i in range(5):
+        client.post('/tasks/', headers={'Authorization': user}, json={
+            'title': f'New Task {i}',
+            'description': f'A new task {i}',
+        })
+
+    titles = []
+    cursor = None
+
+    while True:
+        query = {'limit': 2}
+
+        if cursor:
+            query['cursor'] = cursor
+
+        response = client.get('/tasks/', headers={'Authorization': user}, query_string=query)
+        json_data = response.get_json()
+
+        assert response.status_code == 200
+        assert len(json_data['tasks']) <= 2
+
+        titles += [task['title'] for task in json_data['tasks']]
+        cursor = json_data['next_cursor']
+
+        if cursor is None:
+            break
+
+    assert titles == [f'New Task {i}' for i in range(5)]
+
+
+def test_get_tasks_max_page_size(app, client, user):
+    """
+    Test that the page size is capped at the maximum page size.
+    """
+    app.config['TASKS_MAX_PAGE_SIZE'] = 2
+
+    for i in range(3):
+        client.post('/tasks/', headers={'Authorization': user}, json={
+            'title': f'New Task {i}',
+            'description': f'A new task {i}',
+        })
+
+    response = client.get('/tasks/?limit=100', headers={'Authorization': user})
+    json_data = response.get_json()
+
+    assert response.status_code == 200
+    assert len(json_data['tasks']) == 2
+    assert json_data['next_cursor'] is not None
+
+
+def test_get_tasks_invalid_cursor(client, user):
+    """
+    Test getting tasks with a malformed cursor.
+    """
+    response = client.get('/tasks/?cursor=not-a-cursor', headers={'Authorization': user})
+
+    assert response.status_code == 400
+
+
 def test_get_task_by_id(client, user):
     """
     Test getting a single task.
@@ -231,6 +256,47 @@ def test_update_task_not_exist(client, user):
     assert response.status_code == 404
 
 
+def count_task_statements(client, method, url, **kwargs):
+    """
+    Send a request and return the response and the SQL statements run against the tasks table.
+    """
+    statements = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        if 'tasks' in statement:
+            statements.append(statement)
+
+    event.listen(db.engine, 'before_cursor_execute', capture)
+
+    try:
+        response = client.open(url, method=method, **kwargs)
+    finally:
+        event.remove(db.engine, 'before_cursor_execute', capture)
+
+    return response, statements
+
+
+def test_update_task_single_statement(client, user):
+    """
+    Test that updating a task runs a single UPDATE ... RETURNING statement.
+    """
+    create_response = client.post('/tasks/', headers={'Authorization': user}, json={
+        'title': 'New Task',
+        'description': 'A new task',
+    })
+
+    task_id = create_response.get_json()['id']
+
+    response, statements = count_task_statements(client, 'PUT', f'/tasks/{task_id}',
+                                                 headers={'Authorization': user}, json={'completed': True})
+
+    assert response.status_code == 200
+    assert response.get_json()['completed'] is True
+    assert response.get_json()['title'] == 'New Task'
+    assert len(statements) == 1
+    assert statements[0].startswith('UPDATE')
+
+
 def test_delete_task(client, user):
     """
     Test deleting a single task.
@@ -275,3 +341,22 @@ def test_delete_task_not_exist(client, user):
     response = client.delete(f'/tasks/{fake_uuid}', headers={'Authorization': user})
 
     assert response.status_code == 404
+
+
+def test_delete_task_single_statement(client, user):
+    """
+    Test that deleting a task runs a single DELETE ... RETURNING statement.
+    """
+    create_response = client.post('/tasks/', headers={'Authorization': user}, json={
+        'title': 'New Task',
+        'description': 'A new task',
+    })
+
+    task_id = create_response.get_json()['id']
+
+    response, statements = count_task_statements(client, 'DELETE', f'/tasks/{task_id}',
+                                                 headers={'Authorization': user})
+
+    assert response.status_code == 200
+    assert len(statements) == 1
+    assert statements[0].startswith('DELETE')
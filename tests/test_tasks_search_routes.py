@@ -0,0 +1,229 @@
+"""
+Unit tests for the full-text task search endpoint using pytest.
+
+Fixtures:
+    - app, client, user: The shared fixtures of conftest.py.
+
+Tests:
+    - test_search_tasks: Tests that tasks matching every word are returned, title matches first.
+    - test_search_tasks_follows_writes: Tests that updates and deletions are reflected in the index.
+    - test_search_tasks_paginated: Tests walking through the results with the next cursor.
+    - test_search_tasks_other_user: Tests that the tasks of other users are not returned.
+    - test_search_tasks_matches_user_only: Tests that the full-text match itself only finds the user's tasks.
+    - test_search_tasks_max_results: Tests that paging stops after the maximum number of results.
+    - test_search_tasks_syntax: Tests that FTS5 operators and punctuation in the text are searched literally.
+    - test_search_tasks_uses_index: Tests that the search is served by the full-text index.
+    - test_search_tasks_invalid: Tests the errors of a missing text and a malformed cursor.
+"""
+
+import pytest
+from sqlalchemy import event
+
+from app.extensions import db
+from app.utils.pagination import encode_offset_cursor
+
+
+def register(client, email):
+    """
+    Register and log in a user, returning a JWT token.
+    """
+    client.post('/auth/register', json={'email': email, 'password': 'testpassword'})
+
+    response = client.post('/auth/login', json={'email': email, 'password': 'testpassword'})
+
+    return response.get_json()['token']
+
+
+def create_task(client, token, title, description=''):
+    """
+    Create a task and return its ID.
+    """
+    response = client.post('/tasks/', headers={'Authorization': token},
+                           json={'title': title, 'description': description})
+
+    return str(response.get_json()['id'])
+
+
+def search(client, token, **query):
+    """
+    Search the tasks and return the titles of the results.
+    """
+    response = client.get('/tasks/search', headers={'Authorization': token}, query_string=query)
+
+    assert response.status_code == 200
+
+    return [task['title'] for task in response.get_json()['tasks']]
+
+
+def test_search_tasks(client, user):
+    """
+    Test that tasks matching every word are returned, title matches first.
+    """
+    create_task(client, user, 'Call the plumber', 'About the kitchen sink')
+    create_task(client, user, 'Kitchen cleanup', 'Scrub the sink and the floor')
+    create_task(client, user, 'Groceries', 'Buy soap for the kitchen')
+
+    assert search(client, user, q='kitchen sink') == ['Kitchen cleanup', 'Call the plumber']
+    assert search(client, user, q='KITCHEN')[0] == 'Kitchen cleanup'
+    assert search(client, user, q='plumber') == ['Call the plumber']
+    assert search(client, user, q='dishwasher') == []
+
+
+def test_search_tasks_follows_writes(client, user):
+    """
+    Test that updates and deletions are reflected in the index.
+    """
+    task_id = create_task(client, user, 'Renew passport')
+
+    client.put(f'/tasks/{task_id}', headers={'Authorization': user}, json={'title': 'Renew driving licence'})
+
+    assert search(client, user, q='passport') == []
+    assert search(client, user, q='licence') == ['Renew driving licence']
+
+    client.put(f'/tasks/{task_id}', headers={'Authorization': user}, json={'completed': True})
+
+    assert search(client, user, q='licence') == ['Renew driving licence']
+
+    client.delete(f'/tasks/{task_id}', headers={'Authorization': user})
+
+    assert search(client, user, q='licence') == []
+
+
+def test_search_tasks_paginated(client, user):
+    """
+    Test walking through the results with the next cursor.
+    """
+    for i in range(5):
+        create_task(client, user, f'Report {i}', 'Quarterly report')
+
+    seen = []
+    cursor = None
+
+    while True:
+        query = {'q': 'report', 'limit': 2}
+
+        if cursor:
+            query['cursor'] = cursor
+
+        json_data = client.get('/tasks/search', headers={'Authorization': user}, query_string=query).get_json()
+        seen.extend(task['id'] for task in json_data['tasks'])
+        cursor = json_data['next_cursor']
+
+        if cursor is None:
+            break
+
+    assert len(seen) == len(set(seen)) == 5
+
+
+def test_search_tasks_other_user(client, user):
+    """
+    Test that the tasks of other users are not returned.
+    """
+    create_task(client, register(client, 'other@example.com'), 'Secret plan')
+
+    assert search(client, user, q='secret') == []
+
+
+def capture_search(client, token, **query):
+    """
+    Search the tasks and return the full-text statement that ran and its parameters.
+    """
+    statements = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        if 'tasks_fts' in statement:
+            statements.append((statement, parameters))
+
+    event.listen(db.engine, 'before_cursor_execute', capture)
+
+    try:
+        search(client, token, **query)
+    finally:
+        event.remove(db.engine, 'before_cursor_execute', capture)
+
+    return statements[-1]
+
+
+def test_search_tasks_matches_user_only(client, user):
+    """
+    Test that the full-text match itself only finds the user's tasks, so the tasks of other users
+    are neither joined nor ranked.
+    """
+    other = register(client, 'other@example.com')
+
+    for i in range(5):
+        create_task(client, other, f'Shared word {i}')
+
+    create_task(client, user, 'Shared word')
+
+    statement, parameters = capture_search(client, user, q='shared word')
+    match = next(parameter for parameter in parameters if 'shared' in str(parameter))
+
+    with db.engine.connect() as conn:
+        matched = conn.exec_driver_sql('SELECT count(*) FROM tasks_fts WHERE tasks_fts MATCH ?', (match,)).scalar()
+
+    assert matched == 1
+
+
+def test_search_tasks_max_results(app, client, user):
+    """
+    Test that paging stops after the maximum number of results, and that later cursors are rejected.
+    """
+    app.config['TASKS_SEARCH_MAX_RESULTS'] = 3
+
+    for i in range(5):
+        create_task(client, user, f'Report {i}')
+
+    first = client.get('/tasks/search', headers={'Authorization': user},
+                       query_string={'q': 'report', 'limit': 2}).get_json()
+    second = client.get('/tasks/search', headers={'Authorization': user},
+                        query_string={'q': 'report', 'limit': 2, 'cursor': first['next_cursor']}).get_json()
+
+    assert len(first['tasks']) == 2
+    assert len(second['tasks']) == 1
+    assert second['next_cursor'] is None
+
+    response = client.get('/tasks/search', headers={'Authorization': user},
+                          query_string={'q': 'report', 'cursor': encode_offset_cursor(3)})
+
+    assert response.status_code == 400
+
+
+def test_search_tasks_syntax(client, user):
+    """
+    Test that FTS5 operators and punctuation in the text are searched literally.
+    """
+    create_task(client, user, 'Fix "AND" OR NOT bug', 'Parser: handle col:value and a*b')
+
+    assert search(client, user, q='"AND" OR') == ['Fix "AND" OR NOT bug']
+    assert search(client, user, q='NOT col:value') == ['Fix "AND" OR NOT bug']
+    assert search(client, user, q='a*b (') == ['Fix "AND" OR NOT bug']
+    assert search(client, user, q='value:col') == []
+
+
+def test_search_tasks_uses_index(app, client, user):
+    """
+    Test that the search is served by the full-text index.
+    """
+    create_task(client, user, 'Indexed task')
+
+    assert search(client, user, q='indexed') == ['Indexed task']
+
+    statement, parameters = capture_search(client, user, q='indexed')
+
+    with db.engine.connect() as conn:
+        plan = [row[-1] for row in conn.exec_driver_sql(f'EXPLAIN QUERY PLAN {statement}', parameters)]
+
+    assert any('VIRTUAL TABLE INDEX' in detail for detail in plan)
+    assert not any(detail.split()[:2] == ['SCAN', 'tasks'] for detail in plan)
+
+
+@pytest.mark.parametrize('query', [{}, {'q': '   '}, {'q': 'x' * 201}, {'q': 'task', 'cursor': 'bogus'}])
+def test_search_tasks_invalid(client, user, query):
+    """
+    Test the errors of a missing text and a malformed cursor.
+    """
+    response = client.get('/tasks/search', headers={'Authorization': user}, query_string=query)
+
+    assert response.status_code == 400
+    assert 'message' in response.get_json()
@@ -0,0 +1,190 @@
+"""
+Unit tests for the live task event stream using pytest.
+
+Fixtures:
+    - app: Sets up and tears down the Flask testing application.
+    - client, user: The shared fixtures of conftest.py.
+
+Tests:
+    - test_stream_task_events: Tests that writes are pushed to an open stream.
+    - test_stream_heartbeat: Tests that an idle stream sends heartbeats.
+    - test_stream_resume_resync: Tests that resuming after missed changes asks for a resync.
+    - test_stream_unpublished_write_resync: Tests that a write published by another worker asks for a resync.
+    - test_stream_closed_unsubscribes: Tests that closing a stream removes its subscription.
+    - test_stream_invalid_last_event_id: Tests that a malformed Last-Event-ID is rejected.
+    - test_subscription_overflow: Tests that a full subscription queue overflows without blocking.
+"""
+
+import json
+
+import pytest
+from flask import Flask
+from sqlalchemy import update
+
+from app.extensions import db, event_hub
+from app.extensions.events import EventHub
+from app.models import User
+from app.routes import tasks_blueprint, auth_blueprint
+
+
+@pytest.fixture
+def app():
+    """
+    Set up and tear down the Flask testing application.
+    """
+    app = Flask(__name__)
+    app.config['TESTING'] = True
+    app.config['SQLALCHEMY_DATABASE_URI'] = 'sqlite:///:memory:'
+    app.config['TASKS_STREAM_HEARTBEAT'] = 0.05
+    db.init_app(app)
+    app.register_blueprint(auth_blueprint, url_prefix='/auth')
+    app.register_blueprint(tasks_blueprint, url_prefix='/tasks')
+
+    with app.app_context():
+        db.create_all()
+        yield app
+        db.drop_all()
+
+
+def next_message(chunks) -> dict:
+    """
+    Read the next Server-Sent Events message, skipping heartbeats, and parse its fields.
+    """
+    for chunk in chunks:
+        text = chunk.decode()
+
+        if text.startswith((':', 'retry:')):
+            continue
+
+        fields = dict(line.split(': ', 1) for line in text.strip().split('\n'))
+        fields['data'] = json.loads(fields['data'])
+
+        return fields
+
+
+def test_stream_task_events(client, user):
+    """
+    Test that writes are pushed to an open stream.
+    """
+    headers = {'Authorization': user}
+    response = client.get('/tasks/stream', headers=headers, buffered=False)
+
+    assert response.status_code == 200
+    assert response.mimetype == 'text/event-stream'
+
+    chunks = iter(response.response)
+    assert next(chunks).decode().startswith('retry:')
+
+    task_id = client.post('/tasks/', headers=headers, json={'title': 'Task', 'description': 'Task'}).get_json()['id']
+    created = next_message(chunks)
+
+    assert created['event'] == 'task.created'
+    assert created['id'] == '1'
+    assert created['data']['id'] == task_id
+
+    client.put(f'/tasks/{task_id}', headers=headers, json={'completed': True})
+    updated = next_message(chunks)
+
+    assert (updated['event'], updated['id'], updated['data']['completed']) == ('task.updated', '2', True)
+
+    client.delete('/tasks/batch', headers=headers, json={'ids': [task_id]})
+    deleted = next_message(chunks)
+
+    assert (deleted['event'], deleted['id'], deleted['data']) == ('task.deleted', '3', {'id': task_id})
+
+    response.close()
+
+
+def test_stream_heartbeat(client, user):
+    """
+    Test that an idle stream sends heartbeats.
+    """
+    response = client.get('/tasks/stream', headers={'Authorization': user}, buffered=False)
+    chunks = iter(response.response)
+    next(chunks)
+
+    assert next(chunks) == b': heartbeat\n\n'
+
+    response.close()
+
+
+def test_stream_resume_resync(client, user):
+    """
+    Test that resuming after missed changes asks for a resync.
+    """
+    headers = {'Authorization': user}
+
+    for i in range(2):
+        client.post('/tasks/', headers=headers, json={'title': f'Task {i}', 'description': f'Task {i}'})
+
+    response = client.get('/tasks/stream', headers={**headers, 'Last-Event-ID': '1'}, buffered=False)
+    message = next_message(iter(response.response))
+
+    assert message == {'event': 'resync', 'data': {'since': '1'}}
+
+    response.close()
+
+
+def test_stream_unpublished_write_resync(client, user):
+    """
+    Test that a write published by another worker asks for a resync.
+    """
+    response = client.get('/tasks/stream', headers={'Authorization': user}, buffered=False)
+    chunks = iter(response.response)
+    next(chunks)
+
+    db.session.execute(update(User).values(task_change_seq=User.task_change_seq + 1))
+    db.session.commit()
+
+    assert next_message(chunks) == {'event': 'resync', 'data': {'since': '0'}}
+    assert next(chunks) == b': heartbeat\n\n'
+
+    response.close()
+
+
+def test_stream_closed_unsubscribes(client, user):
+    """
+    Test that closing a stream removes its subscription.
+    """
+    response = client.get('/tasks/stream', headers={'Authorization': user}, buffered=False)
+    next(iter(response.response))
+
+    assert event_hub.subscriber_count() == 1
+
+    response.close()
+
+    assert event_hub.subscriber_count() == 0
+
+
+def test_stream_invalid_last_event_id(client, user):
+    """
+    Test that a malformed Last-Event-ID is rejected.
+    """
+    response = client.get('/tasks/stream', headers={'Authorization': user, 'Last-Event-ID': 'abc'})
+
+    assert response.status_code == 400
+    assert event_hub.subscriber_count() == 0
+
+
+def test_subscription_overflow():
+    """
+    Test that a full subscription queue overflows without blocking.
+    """
+    hub = EventHub()
+    subscription = hub.subscribe('user', maxsize=2)
+
+    for seq in range(1, 4):
+        hub.publish('user', 'task.created', seq, {})
+
+    assert subscription.overflowed is True
+
+    subscription.reset()
+    hub.publish('user', 'task.created', 4, {})
+
+    assert subscription.overflowed is False
+    assert subscription.get(0) == ('task.created', 4, {})
+    assert subscription.get(0) is None
+
+    hub.unsubscribe(subscription)
+
+    assert hub.subscriber_count() == 0
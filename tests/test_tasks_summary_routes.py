@@ -0,0 +1,140 @@
+"""
+Unit tests for the task summary endpoint using pytest.
+
+Fixtures:
+    - app, client, user: The shared fixtures of conftest.py.
+
+Tests:
+    - test_summary_empty: Tests the summary of a user without tasks.
+    - test_summary_counts: Tests the total, completed and pending counts and the daily histogram.
+    - test_summary_follows_writes: Tests that completions and deletions are reflected in the summary.
+    - test_summary_created_range: Tests counting only the tasks created within a date range.
+    - test_summary_single_statement: Tests that the summary is one aggregate statement that loads no task.
+    - test_summary_invalid: Tests the error of a malformed date.
+"""
+import uuid
+from datetime import datetime
+
+from sqlalchemy import event, update
+
+from app.extensions import db
+from app.models import Task
+
+
+def create_task(client, token, title, created_at, completed=False):
+    """
+    Create a task backdated to the given creation date and return its ID.
+    """
+    task_id = client.post('/tasks/', headers={'Authorization': token},
+                          json={'title': title, 'description': f'Description of {title}'}).get_json()['id']
+
+    if completed:
+        client.put(f'/tasks/{task_id}', headers={'Authorization': token}, json={'completed': True})
+
+    db.session.execute(update(Task).where(Task.id == uuid.UUID(task_id)).values(created_at=created_at))
+    db.session.commit()
+
+    return task_id
+
+
+def summary(client, token, **query):
+    """
+    Return the task summary.
+    """
+    response = client.get('/tasks/summary', headers={'Authorization': token}, query_string=query)
+
+    assert response.status_code == 200
+
+    return response.get_json()
+
+
+def test_summary_empty(client, user):
+    """
+    Test the summary of a user without tasks.
+    """
+    assert summary(client, user) == {'total': 0, 'completed': 0, 'pending': 0, 'days': []}
+
+
+def test_summary_counts(client, user):
+    """
+    Test the total, completed and pending counts and the daily histogram.
+    """
+    create_task(client, user, 'A', datetime(2026, 3, 1, 9), completed=True)
+    create_task(client, user, 'B', datetime(2026, 3, 1, 23, 59))
+    create_task(client, user, 'C', datetime(2026, 3, 4, 0, 1), completed=True)
+    create_task(client, user, 'D', datetime(2026, 3, 5, 12))
+
+    assert summary(client, user) == {
+        'total': 4,
+        'completed': 2,
+        'pending': 2,
+        'days': [
+            {'date': '2026-03-01', 'count': 2},
+            {'date': '2026-03-04', 'count': 1},
+            {'date': '2026-03-05', 'count': 1},
+        ],
+    }
+
+
+def test_summary_follows_writes(client, user):
+    """
+    Test that completions and deletions are reflected in the summary.
+    """
+    first = create_task(client, user, 'A', datetime(2026, 3, 1, 9))
+    create_task(client, user, 'B', datetime(2026, 3, 2, 9))
+
+    client.put(f'/tasks/{first}', headers={'Authorization': user}, json={'completed': True})
+    json_data = summary(client, user)
+
+    assert (json_data['total'], json_data['completed'], json_data['pending']) == (2, 1, 1)
+
+    client.delete(f'/tasks/{first}', headers={'Authorization': user})
+
+    assert summary(client, user) == {'total': 1, 'completed': 0, 'pending': 1,
+                                     'days': [{'date': '2026-03-02', 'count': 1}]}
+
+
+def test_summary_created_range(client, user):
+    """
+    Test counting only the tasks created within a date range.
+    """
+    for day in range(1, 6):
+        create_task(client, user, f'Task {day}', datetime(2026, 3, day, 12), completed=day % 2 == 0)
+
+    json_data = summary(client, user, created_after='2026-03-02T00:00:00', created_before='2026-03-05T00:00:00')
+
+    assert (json_data['total'], json_data['completed'], json_data['pending']) == (3, 2, 1)
+    assert [day['date'] for day in json_data['days']] == ['2026-03-02', '2026-03-03', '2026-03-04']
+
+
+def test_summary_single_statement(app, client, user):
+    """
+    Test that the summary is one aggregate statement that loads no task.
+    """
+    create_task(client, user, 'A', datetime(2026, 3, 1, 9))
+    statements = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        if 'GROUP BY' in statement:
+            statements.append(statement)
+
+    event.listen(db.engine, 'before_cursor_execute', capture)
+
+    try:
+        summary(client, user)
+    finally:
+        event.remove(db.engine, 'before_cursor_execute', capture)
+
+    assert len(statements) == 1
+    assert 'count(' in statements[0].lower()
+    assert 'description' not in statements[0]
+
+
+def test_summary_invalid(client, user):
+    """
+    Test the error of a malformed date.
+    """
+    response = client.get('/tasks/summary?created_after=yesterday', headers={'Authorization': user})
+
+    assert response.status_code == 400
+    assert 'message' in response.get_json()
@@ -9,7 +9,7 @@ from unittest.mock import patch
 import jwt
 import pytest
 
-from app.utils.token import generate_token, verify_token
+from app.utils.token import TokenCache, generate_token, verify_token, verify_token_cached, token_cache
 
 
 def test_generate_token() -> None:
@@ -79,3 +79,73 @@ def test_verify_token_invalid() -> None:
     with patch('app.utils.token.SECRET_KEY', "secret"):
         with pytest.raises(jwt.InvalidTokenError):
             verify_token(token)
+
+
+def test_verify_token_cached() -> None:
+    """
+    Test that a token is verified once and then served from the cache.
+    """
+    user_id = uuid.uuid4()
+
+    with patch('app.utils.token.SECRET_KEY', "secret"):
+        token = generate_token(str(user_id))
+        token_cache.clear()
+
+        with patch('app.utils.token.jwt.decode', wraps=jwt.decode) as decode:
+            assert verify_token_cached(token) == user_id
+            assert verify_token_cached(token) == user_id
+
+        assert decode.call_count == 1
+
+    assert token_cache.stats()['hits'] == 1
+    assert token_cache.stats()['misses'] == 1
+
+
+def test_verify_token_cached_invalid() -> None:
+    """
+    Test that invalid tokens are not cached.
+    """
+    token_cache.clear()
+
+    with patch('app.utils.token.SECRET_KEY', "secret"):
+        for _ in range(2):
+            with pytest.raises(jwt.InvalidTokenError):
+                verify_token_cached("it.is.not.a.token")
+
+    assert token_cache.stats()['size'] == 0
+
+
+def test_token_cache_expiry() -> None:
+    """
+    Test that cached tokens are evicted at their expiry.
+    """
+    now = [1000.0]
+    cache = TokenCache(maxsize=10, ttl=300, clock=lambda: now[0])
+    user_id = uuid.uuid4()
+
+    cache.put('token', user_id, exp=1010)
+
+    assert cache.get('token') == user_id
+
+    now[0] = 1010
+
+    assert cache.get('token') is None
+    assert cache.stats()['size'] == 0
+
+
+def test_token_cache_lru_eviction() -> None:
+    """
+    Test that the cache evicts the least recently used token when full.
+    """
+    cache = TokenCache(maxsize=2, ttl=300)
+    exp = datetime.now().timestamp() + 60
+    user_ids = [uuid.uuid4() for _ in range(3)]
+
+    cache.put('token-0', user_ids[0], exp)
+    cache.put('token-1', user_ids[1], exp)
+    cache.get('token-0')
+    cache.put('token-2', user_ids[2], exp)
+
+    assert cache.get('token-0') == user_ids[0]
+    assert cache.get('token-1') is None
+    assert cache.get('token-2') == user_ids[2]